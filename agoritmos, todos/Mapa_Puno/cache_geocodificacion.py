@@ -0,0 +1,125 @@
+import json
+import os
+import threading
+import time
+
+from cache_osm import CARPETA_CACHE, escribir_atomico
+
+# Caché persistente de geocodificación (Nominatim).
+#
+# Guarda tanto los lugares encontrados como los no encontrados, cada uno con
+# su propio tiempo de vida: un lugar que Nominatim no conoce hoy se vuelve a
+# intentar al día siguiente, uno encontrado dura un mes. Junto a cada lugar
+# encontrado se guarda el nodo del grafo al que se ajustó, así elegir un lugar
+# de la lista no necesita ni red ni búsqueda de vecino más cercano.
+
+ARCHIVO_GEOCODIFICACION = os.path.join(CARPETA_CACHE, "geocodificacion.json")
+TTL_ENCONTRADO = 30 * 24 * 3600
+TTL_NO_ENCONTRADO = 24 * 3600
+PAUSA_NOMINATIM = 1.0  # la política de uso de Nominatim pide máximo 1 consulta por segundo
+
+def consulta_para(direccion):
+    return direccion + ", Puno, Perú"
+
+class CacheGeocodificacion:
+    def __init__(self, geolocalizador, archivo=ARCHIVO_GEOCODIFICACION,
+                 ttl_encontrado=TTL_ENCONTRADO, ttl_no_encontrado=TTL_NO_ENCONTRADO):
+        self.geolocalizador = geolocalizador
+        self.archivo = archivo
+        self.ttl_encontrado = ttl_encontrado
+        self.ttl_no_encontrado = ttl_no_encontrado
+        self.lock = threading.Lock()
+        self.entradas = {}
+        if os.path.exists(archivo):
+            try:
+                with open(archivo, encoding='utf-8') as f:
+                    self.entradas = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"No se pudo leer {archivo}: {e}")
+
+    # Se escribe dentro del lock: así el último en guardar deja el estado más nuevo
+    # (el hilo de pregeocodificar() y los clics de la interfaz guardan a la vez)
+    def guardar(self):
+        with self.lock:
+            datos = json.dumps(self.entradas, ensure_ascii=False, indent=1)
+            escribir_atomico(self.archivo, datos.encode('utf-8'))
+
+    def entrada_vigente(self, clave):
+        entrada = self.entradas.get(clave)
+        if entrada is None:
+            return None
+        ttl = self.ttl_encontrado if entrada['encontrado'] else self.ttl_no_encontrado
+        if time.time() - entrada['fecha'] > ttl:
+            return None
+        return entrada
+
+    # Devuelve (entrada, consultó_la_red). Los errores de red no se guardan:
+    # solo un "no encontrado" real cuenta como resultado negativo.
+    def buscar(self, direccion):
+        clave = " ".join(direccion.lower().split())
+        with self.lock:
+            entrada = self.entrada_vigente(clave)
+        if entrada is not None:
+            return entrada, False
+
+        ubicacion = self.geolocalizador.geocode(consulta_para(direccion), timeout=10)
+        if ubicacion:
+            entrada = {'encontrado': True, 'lat': ubicacion.latitude,
+                       'lon': ubicacion.longitude, 'fecha': time.time()}
+        else:
+            entrada = {'encontrado': False, 'fecha': time.time()}
+        with self.lock:
+            self.entradas[clave] = entrada
+        self.guardar()
+        return entrada, True
+
+    def ubicar(self, direccion):
+        entrada, _ = self.buscar(direccion)
+        if not entrada['encontrado']:
+            return None
+        return entrada['lat'], entrada['lon']
+
+    # Nodo del grafo más cercano a la dirección; se guarda para la próxima vez
+    def nodo_para(self, direccion, indice, grafo):
+        entrada, _ = self.buscar(direccion)
+        if not entrada['encontrado']:
+            return None
+        nodo = entrada.get('nodo')
+        if nodo is None or nodo not in grafo:
+            nodo, _ = indice.mas_cercano(entrada['lat'], entrada['lon'])
+            with self.lock:
+                entrada['nodo'] = nodo
+            self.guardar()
+        return nodo
+
+    # Resuelve de una vez una lista de lugares (al iniciar o fuera de línea)
+    def pregeocodificar(self, lugares, indice, grafo, pausa=PAUSA_NOMINATIM):
+        encontrados = 0
+        for lugar in lugares:
+            try:
+                entrada, uso_red = self.buscar(lugar)
+                if self.nodo_para(lugar, indice, grafo) is not None:
+                    encontrados += 1
+                else:
+                    print(f"No encontrado: {lugar}")
+                if uso_red:
+                    time.sleep(pausa)
+            except Exception as e:
+                print(f"Error geocodificando {lugar}: {e}")
+        print(f"Geocodificación previa completada: {encontrados}/{len(lugares)} lugares")
+        return encontrados
+
+if __name__ == "__main__":
+    # python cache_geocodificacion.py: resuelve todos los LUGARES_PUNO y los deja en caché
+    from geopy.geocoders import Nominatim
+
+    from cache_osm import cargar_grafo_puno
+    from grafo_osm import LUGARES_PUNO
+    from indice_espacial import IndiceEspacial
+
+    grafo, nodos = cargar_grafo_puno()
+    if grafo is None:
+        raise SystemExit("No se pudo crear el grafo de calles.")
+    indice = IndiceEspacial({n: nodos[n] for n in grafo.nodes})
+    cache = CacheGeocodificacion(Nominatim(user_agent="puno_ruta_app"))
+    cache.pregeocodificar(LUGARES_PUNO, indice, grafo)
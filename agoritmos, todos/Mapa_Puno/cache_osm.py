@@ -0,0 +1,251 @@
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+import zlib
+from array import array
+
+import networkx as nx
+
+from grafo_osm import CONSULTA_CALLES_PUNO, obtener_calles_puno, crear_grafo_osm_vectorizado
+
+# Caché local de las calles de Puno, para no esperar a Overpass en cada inicio.
+#
+# Por cada consulta se guardan dos archivos en CARPETA_CACHE:
+#   <clave>.json.gz  respuesta cruda de Overpass
+#   <clave>.grafo    instantánea binaria del grafo ya construido
+# La clave es un hash del texto de la consulta; si la consulta cambia se usan
+# archivos nuevos. Los archivos con más de MAX_EDAD_HORAS se vuelven a descargar.
+#
+# Formato de la instantánea (little-endian, todo alineado a 8 bytes):
+#   cabecera  : magia, versión, nodos, nodos en el grafo, aristas, fecha
+#   int64[n]  : id OSM de cada nodo (primero los del grafo, en su orden)
+#   float64[n]: latitud           float64[n]: longitud
+#   float64[m]: peso (km)         int32[m]  : origen   int32[m]: destino
+#   uint16[m] : tipo de vía (índice en la tabla final)
+#   uint32 + JSON: tabla de tipos de vía
+
+CARPETA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache_osm")
+MAX_EDAD_HORAS = 24 * 7
+
+MAGIA = b'GOSM'
+VERSION_INSTANTANEA = 1
+CABECERA = struct.Struct('<4sHHqqqd')
+
+def clave_consulta(consulta):
+    normalizada = " ".join(consulta.split())
+    return hashlib.sha1(normalizada.encode('utf-8')).hexdigest()[:16]
+
+def rutas_cache(consulta):
+    base = os.path.join(CARPETA_CACHE, clave_consulta(consulta))
+    return base + ".json.gz", base + ".grafo"
+
+def es_reciente(ruta, max_edad_horas):
+    return os.path.exists(ruta) and time.time() - os.path.getmtime(ruta) < max_edad_horas * 3600
+
+# Temporal propio de cada escritura (dos hilos pueden guardar el mismo archivo
+# a la vez) y os.replace: quien lee ve el archivo viejo o el nuevo, nunca uno a medias
+def escribir_atomico(ruta, datos):
+    carpeta = os.path.dirname(ruta)
+    os.makedirs(carpeta, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=carpeta, prefix=os.path.basename(ruta) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            f.write(datos)
+        os.replace(temporal, ruta)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+
+def guardar_datos_osm(datos_osm, ruta):
+    escribir_atomico(ruta, gzip.compress(json.dumps(datos_osm).encode('utf-8')))
+
+# Un .json.gz cortado o dañado se informa como ValueError, igual que una
+# instantánea dañada, para que quien llama lo vuelva a descargar
+def leer_datos_osm(ruta):
+    try:
+        with gzip.open(ruta, 'rb') as f:
+            return json.loads(f.read().decode('utf-8'))
+    except (gzip.BadGzipFile, EOFError, zlib.error) as e:
+        raise ValueError(f"{ruta} está dañado: {e}") from e
+
+def guardar_instantanea(grafo, nodos, ruta):
+    en_grafo = list(grafo.nodes)
+    resto = [n for n in nodos if n not in grafo]
+    ids = en_grafo + resto
+    indice = {nodo: i for i, nodo in enumerate(ids)}
+
+    tipos = []
+    codigo_tipo = {}
+    pesos = array('d')
+    origenes = array('i')
+    destinos = array('i')
+    tipos_arista = array('H')
+    for u, v, datos in grafo.edges(data=True):
+        tipo = datos.get('highway', 'unknown')
+        if tipo not in codigo_tipo:
+            codigo_tipo[tipo] = len(tipos)
+            tipos.append(tipo)
+        pesos.append(datos['weight'])
+        origenes.append(indice[u])
+        destinos.append(indice[v])
+        tipos_arista.append(codigo_tipo[tipo])
+
+    partes = [
+        CABECERA.pack(MAGIA, VERSION_INSTANTANEA, 0, len(ids), len(en_grafo), len(pesos), time.time()),
+        array('q', ids).tobytes(),
+        array('d', (nodos[n][0] for n in ids)).tobytes(),
+        array('d', (nodos[n][1] for n in ids)).tobytes(),
+        pesos.tobytes(),
+        origenes.tobytes(),
+        destinos.tobytes(),
+        tipos_arista.tobytes(),
+    ]
+    tabla = json.dumps(tipos).encode('utf-8')
+    partes.append(struct.pack('<I', len(tabla)) + tabla)
+    escribir_atomico(ruta, b''.join(partes))
+
+class InstantaneaGrafo:
+    """Vista de solo lectura sobre un archivo .grafo mapeado en memoria.
+    Los arreglos son memoryview sobre el mmap: no se copian ni se parsean.
+    Hay que cerrarla (close() o 'with') antes de volver a escribir el archivo:
+    en Windows os.replace falla mientras el mmap siga abierto."""
+
+    def __init__(self, ruta):
+        with open(ruta, 'rb') as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            n, m = self.validar(ruta)
+            # La tabla de tipos se lee antes de crear las vistas: si el JSON
+            # está dañado todavía se puede cerrar el mmap sin soltar nada
+            inicio_tabla = CABECERA.size + 24 * n + 18 * m
+            largo_tabla, = struct.unpack_from('<I', self.mmap, inicio_tabla)
+            self.tipos = json.loads(self.mmap[inicio_tabla + 4:inicio_tabla + 4 + largo_tabla].decode('utf-8'))
+        except ValueError:
+            self.mmap.close()
+            raise
+        self.vista = vista = memoryview(self.mmap)
+
+        posicion = CABECERA.size
+
+        def tomar(formato, cantidad, tamano):
+            nonlocal posicion
+            bloque = vista[posicion:posicion + cantidad * tamano].cast(formato)
+            posicion += cantidad * tamano
+            return bloque
+
+        self.ids = tomar('q', n, 8)
+        self.lat = tomar('d', n, 8)
+        self.lon = tomar('d', n, 8)
+        self.pesos = tomar('d', m, 8)
+        self.origenes = tomar('i', m, 4)
+        self.destinos = tomar('i', m, 4)
+        self.tipos_arista = tomar('H', m, 2)
+
+    # Revisa la cabecera y que el tamaño del archivo sea el que dicen n y m,
+    # antes de crear las vistas: un archivo cortado haría fallar cast() con
+    # TypeError. Devuelve (n, m).
+    def validar(self, ruta):
+        largo = len(self.mmap)
+        if largo < CABECERA.size:
+            raise ValueError(f"{ruta} está truncado (sin cabecera completa)")
+        magia, version, _, n, self.nodos_en_grafo, m, self.fecha = CABECERA.unpack_from(self.mmap, 0)
+        if magia != MAGIA or version != VERSION_INSTANTANEA:
+            raise ValueError(f"{ruta} no es una instantánea válida")
+        if n < 0 or m < 0 or not 0 <= self.nodos_en_grafo <= n:
+            raise ValueError(f"{ruta} tiene una cabecera dañada")
+        fin_arreglos = CABECERA.size + 24 * n + 18 * m
+        if largo < fin_arreglos + 4:
+            raise ValueError(f"{ruta} mide {largo} bytes y debería medir al menos {fin_arreglos + 4} "
+                             f"(truncado o dañado)")
+        largo_tabla, = struct.unpack_from('<I', self.mmap, fin_arreglos)
+        if largo != fin_arreglos + 4 + largo_tabla:
+            raise ValueError(f"{ruta} mide {largo} bytes y debería medir {fin_arreglos + 4 + largo_tabla} "
+                             f"(truncado o dañado)")
+        return n, m
+
+    # Primero se sueltan las vistas: el mmap no se puede cerrar con vistas vivas
+    def close(self):
+        for nombre in ('ids', 'lat', 'lon', 'pesos', 'origenes', 'destinos', 'tipos_arista', 'vista'):
+            vista = self.__dict__.pop(nombre, None)
+            if vista is not None:
+                vista.release()
+        self.mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.close()
+
+    def a_grafo(self):
+        # Mismo resultado que crear_grafo_osm(): (grafo networkx, dict id -> (lat, lon))
+        ids = self.ids.tolist()
+        nodos = dict(zip(ids, zip(self.lat.tolist(), self.lon.tolist())))
+        tipos = self.tipos
+        G = nx.Graph()
+        G.add_nodes_from(ids[:self.nodos_en_grafo])
+        G.add_edges_from(
+            (ids[u], ids[v], {'weight': peso, 'highway': tipos[t]})
+            for u, v, peso, t in zip(self.origenes.tolist(), self.destinos.tolist(),
+                                     self.pesos.tolist(), self.tipos_arista.tolist())
+        )
+        return G, nodos
+
+# Respuesta cruda de Overpass: la copia local si es reciente, si no se descarga.
+# Si la descarga falla se usa la copia vencida, si existe.
+def cargar_datos_osm(consulta=CONSULTA_CALLES_PUNO, max_edad_horas=MAX_EDAD_HORAS):
+    ruta_json, _ = rutas_cache(consulta)
+    if es_reciente(ruta_json, max_edad_horas):
+        try:
+            return leer_datos_osm(ruta_json)
+        except (OSError, ValueError) as e:
+            print(f"Copia local dañada, se vuelve a descargar: {e}")
+
+    print("Descargando las calles de Puno...")
+    datos_osm = obtener_calles_puno(consulta)
+    if datos_osm is not None:
+        guardar_datos_osm(datos_osm, ruta_json)
+    elif os.path.exists(ruta_json):
+        print("Sin conexión: se usa la copia anterior de las calles.")
+        try:
+            datos_osm = leer_datos_osm(ruta_json)
+        except (OSError, ValueError) as e:
+            print(f"La copia anterior también está dañada: {e}")
+    return datos_osm
+
+# Devuelve (grafo, nodos) como crear_grafo_osm(), usando el caché cuando se puede:
+#   1. instantánea reciente  -> se mapea en memoria (sin red ni JSON)
+#   2. JSON crudo reciente   -> se reconstruye el grafo y la instantánea
+#   3. si no                 -> se descarga de Overpass y se guardan ambos
+def cargar_grafo_puno(consulta=CONSULTA_CALLES_PUNO, max_edad_horas=MAX_EDAD_HORAS):
+    ruta_json, ruta_grafo = rutas_cache(consulta)
+
+    if es_reciente(ruta_grafo, max_edad_horas) and es_reciente(ruta_json, max_edad_horas):
+        try:
+            inicio = time.perf_counter()
+            with InstantaneaGrafo(ruta_grafo) as instantanea:
+                grafo, nodos = instantanea.a_grafo()
+            print(f"Grafo cargado desde caché en {(time.perf_counter() - inicio) * 1000:.0f} ms")
+            return grafo, nodos
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Instantánea dañada, se reconstruye: {e}")
+
+    grafo, nodos = crear_grafo_osm_vectorizado(cargar_datos_osm(consulta, max_edad_horas))
+    if grafo is not None:
+        guardar_instantanea(grafo, nodos, ruta_grafo)
+    return grafo, nodos
+
+if __name__ == "__main__":
+    # python cache_osm.py: fuerza una descarga nueva y regenera el caché
+    grafo, nodos = cargar_grafo_puno(max_edad_horas=0)
+    if grafo is None:
+        raise SystemExit("No se pudo crear el grafo de calles.")
+    print(f"Caché actualizado: {len(grafo.nodes)} nodos y {len(grafo.edges)} aristas.")
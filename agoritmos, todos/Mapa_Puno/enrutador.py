@@ -0,0 +1,180 @@
+import heapq
+import random
+import time
+from collections import namedtuple
+
+import networkx as nx
+
+from grafo_osm import haversine_distance
+
+# Motor de rutas sobre el grafo de calles de crear_grafo_osm().
+# Cada búsqueda devuelve, además de la ruta, cuántos nodos "asentó" (sacó de
+# la cola con su distancia definitiva), para poder comparar el trabajo que
+# hace cada algoritmo frente al Dijkstra de networkx.
+
+ResultadoRuta = namedtuple('ResultadoRuta', ['ruta', 'distancia', 'nodos_asentados', 'tiempo_ms'])
+
+def reconstruir_ruta(padres, destino):
+    ruta = []
+    nodo = destino
+    while nodo is not None:
+        ruta.append(nodo)
+        nodo = padres[nodo]
+    ruta.reverse()
+    return ruta
+
+# Dijkstra unidireccional (mismo algoritmo que nx.shortest_path, pero contando nodos)
+def dijkstra(grafo, origen, destino):
+    inicio = time.perf_counter()
+    dist = {origen: 0.0}
+    padres = {origen: None}
+    asentados = set()
+    cola = [(0.0, origen)]
+
+    while cola:
+        d, u = heapq.heappop(cola)
+        if u in asentados:
+            continue
+        asentados.add(u)
+        if u == destino:
+            ruta = reconstruir_ruta(padres, destino)
+            return ResultadoRuta(ruta, d, len(asentados), (time.perf_counter() - inicio) * 1000)
+        for v, datos in grafo.adj[u].items():
+            nueva = d + datos['weight']
+            if nueva < dist.get(v, float('inf')):
+                dist[v] = nueva
+                padres[v] = u
+                heapq.heappush(cola, (nueva, v))
+
+    raise nx.NetworkXNoPath(f"No hay ruta entre {origen} y {destino}")
+
+# A* usando la distancia haversine al destino como heurística.
+# Los pesos de las aristas son distancias haversine entre nodos consecutivos,
+# así que la distancia en línea recta nunca sobreestima: la heurística es
+# admisible y consistente, y la primera vez que se asienta el destino la ruta es óptima.
+def a_estrella(grafo, nodos, origen, destino):
+    inicio = time.perf_counter()
+    lat_d, lon_d = nodos[destino]
+
+    def h(nodo):
+        lat, lon = nodos[nodo]
+        return haversine_distance(lat, lon, lat_d, lon_d)
+
+    dist = {origen: 0.0}
+    padres = {origen: None}
+    asentados = set()
+    cola = [(h(origen), 0.0, origen)]
+
+    while cola:
+        _, d, u = heapq.heappop(cola)
+        if u in asentados:
+            continue
+        asentados.add(u)
+        if u == destino:
+            ruta = reconstruir_ruta(padres, destino)
+            return ResultadoRuta(ruta, d, len(asentados), (time.perf_counter() - inicio) * 1000)
+        for v, datos in grafo.adj[u].items():
+            if v in asentados:
+                continue
+            nueva = d + datos['weight']
+            if nueva < dist.get(v, float('inf')):
+                dist[v] = nueva
+                padres[v] = u
+                heapq.heappush(cola, (nueva + h(v), nueva, v))
+
+    raise nx.NetworkXNoPath(f"No hay ruta entre {origen} y {destino}")
+
+# Dijkstra bidireccional: una búsqueda desde el origen y otra desde el destino,
+# alternando por la cola de menor distancia. Se detiene cuando la suma de los
+# dos mínimos supera la mejor ruta encontrada en la frontera.
+def dijkstra_bidireccional(grafo, origen, destino):
+    inicio = time.perf_counter()
+    if origen == destino:
+        return ResultadoRuta([origen], 0.0, 1, (time.perf_counter() - inicio) * 1000)
+
+    dist = [{origen: 0.0}, {destino: 0.0}]
+    padres = [{origen: None}, {destino: None}]
+    asentados = [set(), set()]
+    colas = [[(0.0, origen)], [(0.0, destino)]]
+    mejor = float('inf')
+    encuentro = None
+
+    while colas[0] and colas[1]:
+        if colas[0][0][0] + colas[1][0][0] >= mejor:
+            break
+
+        lado = 0 if colas[0][0][0] <= colas[1][0][0] else 1
+        d, u = heapq.heappop(colas[lado])
+        if u in asentados[lado]:
+            continue
+        asentados[lado].add(u)
+
+        otro = 1 - lado
+        for v, datos in grafo.adj[u].items():
+            nueva = d + datos['weight']
+            if nueva < dist[lado].get(v, float('inf')):
+                dist[lado][v] = nueva
+                padres[lado][v] = u
+                heapq.heappush(colas[lado], (nueva, v))
+            if v in dist[otro] and nueva + dist[otro][v] < mejor:
+                mejor = nueva + dist[otro][v]
+                encuentro = (u, v) if lado == 0 else (v, u)
+
+    if encuentro is None:
+        raise nx.NetworkXNoPath(f"No hay ruta entre {origen} y {destino}")
+
+    # encuentro = (a, b): arista a-b con a alcanzado desde el origen y b desde el destino
+    a, b = encuentro
+    ruta = reconstruir_ruta(padres[0], a)
+    nodo = b
+    while nodo is not None:
+        ruta.append(nodo)
+        nodo = padres[1][nodo]
+
+    total_asentados = len(asentados[0]) + len(asentados[1])
+    return ResultadoRuta(ruta, mejor, total_asentados, (time.perf_counter() - inicio) * 1000)
+
+ALGORITMOS = {
+    'Dijkstra': lambda grafo, nodos, o, d: dijkstra(grafo, o, d),
+    'A*': a_estrella,
+    'Dijkstra bidireccional': lambda grafo, nodos, o, d: dijkstra_bidireccional(grafo, o, d),
+}
+
+# Compara cada algoritmo con nx.shortest_path sobre pares aleatorios de nodos
+def comparar_algoritmos(grafo, nodos, consultas=50, semilla=0):
+    rnd = random.Random(semilla)
+    # Solo pares dentro de la componente más grande, para que siempre exista ruta
+    componente = list(max(nx.connected_components(grafo), key=len))
+    pares = [(rnd.choice(componente), rnd.choice(componente)) for _ in range(consultas)]
+
+    inicio = time.perf_counter()
+    referencia = [nx.shortest_path_length(grafo, o, d, weight='weight') for o, d in pares]
+    base_ms = (time.perf_counter() - inicio) * 1000
+
+    print(f"\n=== {consultas} consultas aleatorias ({len(grafo.nodes)} nodos) ===")
+    print(f"{'networkx':>24}: {base_ms / consultas:8.3f} ms/consulta")
+
+    resumen = {}
+    for nombre, algoritmo in ALGORITMOS.items():
+        total_ms = 0.0
+        total_asentados = 0
+        for (o, d), esperado in zip(pares, referencia):
+            resultado = algoritmo(grafo, nodos, o, d)
+            if abs(resultado.distancia - esperado) > 1e-9:
+                print(f"ADVERTENCIA: {nombre} devolvió {resultado.distancia} en vez de {esperado}")
+            total_ms += resultado.tiempo_ms
+            total_asentados += resultado.nodos_asentados
+        resumen[nombre] = (total_ms / consultas, total_asentados / consultas)
+        print(f"{nombre:>24}: {total_ms / consultas:8.3f} ms/consulta | "
+              f"{total_asentados / consultas:9.1f} nodos asentados | "
+              f"aceleración {base_ms / total_ms:5.2f}x")
+
+    return resumen
+
+if __name__ == "__main__":
+    from cache_osm import cargar_grafo_puno
+
+    grafo, nodos = cargar_grafo_puno()
+    if grafo is None:
+        raise SystemExit("No se pudo crear el grafo de calles.")
+    comparar_algoritmos(grafo, nodos)
@@ -0,0 +1,163 @@
+import requests
+import networkx as nx
+import math
+import numpy as np
+from tkinter import messagebox
+
+# Funciones compartidas por los scripts del mapa de Puno (descarga de calles,
+# construcción del grafo y distancia haversine).
+
+# Lugares predefinidos en Puno
+LUGARES_PUNO = [
+    "Escuela Profesional de Ingeniería de Sistemas",
+    "Biblioteca Central Universidad Nacional del Altiplano",
+    "Mercado Bellavista",
+    "Estadio Enrique Torres Belón",
+    "Puerto Puno",
+    "Clínica Las Kalas",
+    "Catedral de Puno",
+    "Casa del Corregidor",
+    "Parque Pino",
+    "Museo Naval de Puno",
+    "Mirador Kuntur Wasi",
+    "Cerro Huajsapata",
+    "Terminal Terrestre Puno",
+    "Hospital Regional Manuel Núñez Butrón"
+]
+
+# Consulta Overpass con todas las vías de Puno (también es la clave del caché en cache_osm.py)
+CONSULTA_CALLES_PUNO = """
+        [out:json];
+        area[name="Puno"]->.a;
+        (
+          way(area.a)[highway];
+        );
+        out body;
+        >;
+        out skel qt;
+        """
+
+# Función para obtener datos OSM de Puno con manejo de errores
+def obtener_calles_puno(consulta=CONSULTA_CALLES_PUNO):
+    try:
+        url = "http://overpass-api.de/api/interpreter"
+        r = requests.post(url, data={'data': consulta}, timeout=30)
+        r.raise_for_status()  # Lanza excepción para códigos 4XX/5XX
+        return r.json()
+    except requests.exceptions.RequestException as e:
+        messagebox.showerror("Error de conexión", f"No se pudo conectar al servidor OSM: {e}")
+        return None
+
+# Función para construir el grafo de calles con mejor manejo de datos
+def crear_grafo_osm(datos_osm):
+    if datos_osm is None or 'elements' not in datos_osm:
+        return None, None
+        
+    G = nx.Graph()
+    nodos = {}
+
+    # Procesar nodos
+    for elem in datos_osm['elements']:
+        if elem['type'] == 'node':
+            nodos[elem['id']] = (elem['lat'], elem['lon'])
+
+    # Procesar vías (ways)
+    for elem in datos_osm['elements']:
+        if elem['type'] == 'way' and 'nodes' in elem:
+            nodes_way = elem['nodes']
+            for i in range(len(nodes_way) - 1):
+                n1 = nodes_way[i]
+                n2 = nodes_way[i + 1]
+                if n1 in nodos and n2 in nodos:
+                    lat1, lon1 = nodos[n1]
+                    lat2, lon2 = nodos[n2]
+                    # Distancia haversine (más precisa para distancias geográficas)
+                    dist = haversine_distance(lat1, lon1, lat2, lon2)
+                    G.add_edge(n1, n2, weight=dist, highway=elem.get('tags', {}).get('highway', 'unknown'))
+
+    return G, nodos
+
+# Igual que crear_grafo_osm(), pero en bloque: junta todos los tramos de todas
+# las vías en arreglos NumPy, calcula todas las distancias haversine de una vez
+# y agrega las aristas con un solo add_edges_from.
+#
+# La ganancia sale del haversine en bloque y es modesta (ver
+# tiempo_construccion.py --sintetico): una vez resuelto, lo que domina es
+# add_edges_from, que crea un dict de atributos por arista en Python.
+def crear_grafo_osm_vectorizado(datos_osm):
+    if datos_osm is None or 'elements' not in datos_osm:
+        return None, None
+
+    nodos = {}
+    for elem in datos_osm['elements']:
+        if elem['type'] == 'node':
+            nodos[elem['id']] = (elem['lat'], elem['lon'])
+
+    # Extremos de cada tramo consecutivo de cada vía, y el tipo de vía del tramo
+    desde = []
+    hasta = []
+    tipos = []
+    tipo_tramo = []
+    codigo_tipo = {}
+    for elem in datos_osm['elements']:
+        if elem['type'] == 'way' and 'nodes' in elem:
+            nodes_way = elem['nodes']
+            if len(nodes_way) < 2:
+                continue
+            tipo = elem.get('tags', {}).get('highway', 'unknown')
+            if tipo not in codigo_tipo:
+                codigo_tipo[tipo] = len(tipos)
+                tipos.append(tipo)
+            desde.extend(nodes_way[:-1])
+            hasta.extend(nodes_way[1:])
+            tipo_tramo.extend([codigo_tipo[tipo]] * (len(nodes_way) - 1))
+
+    G = nx.Graph()
+    if not desde or not nodos:
+        return G, nodos
+
+    # Ids OSM -> posición en los arreglos de coordenadas (búsqueda binaria en bloque)
+    ids = np.fromiter(nodos.keys(), dtype=np.int64, count=len(nodos))
+    coords = np.array(list(nodos.values()), dtype=np.float64)
+    orden = np.argsort(ids)
+    ids_ordenados = ids[orden]
+
+    desde = np.array(desde, dtype=np.int64)
+    hasta = np.array(hasta, dtype=np.int64)
+    pos_desde = np.minimum(np.searchsorted(ids_ordenados, desde), len(ids) - 1)
+    pos_hasta = np.minimum(np.searchsorted(ids_ordenados, hasta), len(ids) - 1)
+    # Igual que 'if n1 in nodos and n2 in nodos'
+    validos = (ids_ordenados[pos_desde] == desde) & (ids_ordenados[pos_hasta] == hasta)
+
+    desde = desde[validos]
+    hasta = hasta[validos]
+    tipo_tramo = np.array(tipo_tramo, dtype=np.int32)[validos]
+    p1 = coords[orden[pos_desde[validos]]]
+    p2 = coords[orden[pos_hasta[validos]]]
+    pesos = haversine_vectorizado(p1[:, 0], p1[:, 1], p2[:, 0], p2[:, 1])
+
+    datos = ({'weight': peso, 'highway': tipos[t]} for peso, t in zip(pesos.tolist(), tipo_tramo.tolist()))
+    G.add_edges_from(zip(desde.tolist(), hasta.tolist(), datos))
+    return G, nodos
+
+# Misma fórmula que haversine_distance, sobre arreglos NumPy completos
+def haversine_vectorizado(lat1, lon1, lat2, lon2):
+    R = 6371  # Radio de la Tierra en km
+    dLat = np.radians(lat2 - lat1)
+    dLon = np.radians(lon2 - lon1)
+    a = (np.sin(dLat/2) * np.sin(dLat/2) +
+         np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) *
+         np.sin(dLon/2) * np.sin(dLon/2))
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+    return R * c
+
+# Función para calcular distancia haversine
+def haversine_distance(lat1, lon1, lat2, lon2):
+    R = 6371  # Radio de la Tierra en km
+    dLat = math.radians(lat2 - lat1)
+    dLon = math.radians(lon2 - lon1)
+    a = (math.sin(dLat/2) * math.sin(dLat/2) +
+         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) *
+         math.sin(dLon/2) * math.sin(dLon/2))
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    return R * c
@@ -0,0 +1,130 @@
+import heapq
+import math
+import random
+import time
+from array import array
+
+from grafo_osm import haversine_distance
+
+# Índice espacial (árbol KD) sobre los nodos del grafo de calles, para
+# encontrar el nodo más cercano a un punto geocodificado sin recorrer los
+# ~20k nodos con haversine_distance en cada búsqueda.
+#
+# Las coordenadas se proyectan a km en un plano (equirectangular alrededor de
+# la latitud media). En un área del tamaño de Puno el error frente a haversine
+# es despreciable y así las distancias son simples restas y multiplicaciones.
+
+R_TIERRA = 6371  # km, el mismo radio que usa haversine_distance
+
+class IndiceEspacial:
+    def __init__(self, nodos):
+        self.ids = list(nodos)
+        n = len(self.ids)
+        lat0 = sum(nodos[i][0] for i in self.ids) / n if n else 0.0
+        self.escala_x = math.radians(1) * R_TIERRA * math.cos(math.radians(lat0))
+        self.escala_y = math.radians(1) * R_TIERRA
+
+        xs = [nodos[i][1] * self.escala_x for i in self.ids]
+        ys = [nodos[i][0] * self.escala_y for i in self.ids]
+
+        # Árbol KD implícito: en cada rango [ini, fin) la mediana queda en el
+        # medio, la mitad izquierda a un lado y la derecha al otro.
+        orden = list(range(n))
+        pila = [(0, n, 0)]
+        while pila:
+            ini, fin, eje = pila.pop()
+            if fin - ini <= 1:
+                continue
+            coord = xs if eje == 0 else ys
+            orden[ini:fin] = sorted(orden[ini:fin], key=coord.__getitem__)
+            medio = (ini + fin) // 2
+            pila.append((ini, medio, 1 - eje))
+            pila.append((medio + 1, fin, 1 - eje))
+
+        # Coordenadas guardadas en el orden del árbol para recorrerlo sin indirecciones
+        self.orden = array('i', orden)
+        self.xs = array('d', (xs[i] for i in orden))
+        self.ys = array('d', (ys[i] for i in orden))
+
+    def proyectar(self, lat, lon):
+        return lon * self.escala_x, lat * self.escala_y
+
+    def k_mas_cercanos(self, lat, lon, k):
+        # Devuelve [(nodo, distancia_km), ...] ordenado de más cercano a más lejano
+        x, y = self.proyectar(lat, lon)
+        mejores = []  # max-heap de tamaño k: (-distancia², posición)
+        self._buscar(0, len(self.orden), 0, x, y, k, mejores)
+        mejores.sort(reverse=True)
+        return [(self.ids[self.orden[pos]], math.sqrt(-d2)) for d2, pos in mejores]
+
+    def mas_cercano(self, lat, lon):
+        resultado = self.k_mas_cercanos(lat, lon, 1)
+        return resultado[0] if resultado else (None, float('inf'))
+
+    def _buscar(self, ini, fin, eje, x, y, k, mejores):
+        if ini >= fin:
+            return
+        medio = (ini + fin) // 2
+        dx = x - self.xs[medio]
+        dy = y - self.ys[medio]
+        d2 = dx * dx + dy * dy
+        if len(mejores) < k:
+            heapq.heappush(mejores, (-d2, medio))
+        elif d2 < -mejores[0][0]:
+            heapq.heapreplace(mejores, (-d2, medio))
+
+        diferencia = dx if eje == 0 else dy
+        if diferencia < 0:
+            cercano, lejano = (ini, medio), (medio + 1, fin)
+        else:
+            cercano, lejano = (medio + 1, fin), (ini, medio)
+
+        self._buscar(cercano[0], cercano[1], 1 - eje, x, y, k, mejores)
+        # El otro lado solo puede tener algo mejor si el plano de corte está más cerca
+        if len(mejores) < k or diferencia * diferencia < -mejores[0][0]:
+            self._buscar(lejano[0], lejano[1], 1 - eje, x, y, k, mejores)
+
+# Compara el índice con el recorrido lineal que hacía obtener_nodo_desde_direccion
+def comparar_con_busqueda_lineal(nodos, consultas=200, semilla=0):
+    rnd = random.Random(semilla)
+    lats = [p[0] for p in nodos.values()]
+    lons = [p[1] for p in nodos.values()]
+    puntos = [(rnd.uniform(min(lats), max(lats)), rnd.uniform(min(lons), max(lons)))
+              for _ in range(consultas)]
+
+    inicio = time.perf_counter()
+    indice = IndiceEspacial(nodos)
+    construccion_ms = (time.perf_counter() - inicio) * 1000
+
+    inicio = time.perf_counter()
+    lineal = [min(nodos, key=lambda n: haversine_distance(nodos[n][0], nodos[n][1], lat, lon))
+              for lat, lon in puntos]
+    lineal_ms = (time.perf_counter() - inicio) * 1000
+
+    inicio = time.perf_counter()
+    con_indice = [indice.mas_cercano(lat, lon)[0] for lat, lon in puntos]
+    indice_ms = (time.perf_counter() - inicio) * 1000
+
+    # Puede haber empates a pocos centímetros por la proyección; se cuentan aparte
+    distintos = 0
+    for (lat, lon), a, b in zip(puntos, lineal, con_indice):
+        if a != b:
+            da = haversine_distance(nodos[a][0], nodos[a][1], lat, lon)
+            db = haversine_distance(nodos[b][0], nodos[b][1], lat, lon)
+            if db - da > 0.001:
+                distintos += 1
+
+    print(f"\n=== Nodo más cercano: {consultas} consultas sobre {len(nodos)} nodos ===")
+    print(f"Construcción del índice: {construccion_ms:10.2f} ms")
+    print(f"Recorrido lineal:        {lineal_ms / consultas:10.4f} ms/consulta")
+    print(f"Árbol KD:                {indice_ms / consultas:10.4f} ms/consulta "
+          f"({lineal_ms / indice_ms:.0f}x más rápido)")
+    print(f"Resultados distintos (> 1 m): {distintos}")
+
+if __name__ == "__main__":
+    from cache_osm import cargar_grafo_puno
+
+    grafo, nodos = cargar_grafo_puno()
+    if grafo is None:
+        raise SystemExit("No se pudo crear el grafo de calles.")
+    comparar_con_busqueda_lineal({n: nodos[n] for n in grafo.nodes})
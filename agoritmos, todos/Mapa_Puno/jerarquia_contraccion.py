@@ -0,0 +1,346 @@
+import heapq
+import os
+import random
+import struct
+import time
+from array import array
+
+import networkx as nx
+
+from cache_osm import CARPETA_CACHE, clave_consulta, escribir_atomico
+from enrutador import ResultadoRuta, a_estrella, dijkstra_bidireccional
+from grafo_osm import CONSULTA_CALLES_PUNO
+
+# Jerarquía de contracción (Contraction Hierarchies) para el grafo de calles.
+#
+# Preproceso (una sola vez, fuera de línea):
+#   1. Se "contraen" los nodos uno por uno, del menos importante al más importante.
+#   2. Al contraer v, por cada par de vecinos u-w se agrega un atajo u-w si el
+#      único camino más corto entre ellos pasaba por v.
+#   3. El orden de contracción es el rango de cada nodo.
+# Consulta: Dijkstra bidireccional que solo sube de rango en ambos sentidos.
+# Como la búsqueda nunca baja, explora muy pocos nodos.
+#
+# La jerarquía se guarda en CARPETA_CACHE junto a la instantánea del grafo
+# (<clave>.jerarquia, misma clave de consulta que <clave>.grafo). Formato
+# binario, en el mismo orden de bytes que la instantánea:
+#   cabecera  : magia, versión, nodos, aristas hacia arriba, atajos, firma
+#   int64[n]  : id OSM de cada nodo       float64[m]: peso de cada arista
+#   int32[n+1]: inicio de las aristas de cada nodo (CSR)
+#   int32[m]  : destino de cada arista
+#   int32[3k] : atajos como (u, w, nodo intermedio)
+
+MAGIA = b'GJER'
+VERSION_FORMATO = 2
+CABECERA = struct.Struct('<4sHHqqqqqd')  # ..., firma: nodos, aristas, peso total
+LIMITE_TESTIGOS = 60  # nodos máximos que explora cada búsqueda de testigos
+
+def ruta_jerarquia(consulta=CONSULTA_CALLES_PUNO):
+    return os.path.join(CARPETA_CACHE, clave_consulta(consulta) + ".jerarquia")
+
+def firma_grafo(grafo):
+    # Para detectar si el archivo guardado corresponde a otro grafo
+    return (grafo.number_of_nodes(), grafo.number_of_edges(),
+            round(grafo.size(weight='weight'), 6))
+
+# Busca un camino u -> destinos que no pase por 'excluido' y que no supere 'limite'.
+# Devuelve las distancias encontradas (acotadas), para saber qué atajos sobran.
+def busqueda_testigos(adj, u, excluido, limite):
+    dist = {u: 0.0}
+    cola = [(0.0, u)]
+    asentados = 0
+    while cola and asentados < LIMITE_TESTIGOS:
+        d, x = heapq.heappop(cola)
+        if d > dist[x]:
+            continue
+        if d > limite:
+            break
+        asentados += 1
+        for y, peso in adj[x].items():
+            if y == excluido:
+                continue
+            nueva = d + peso
+            if nueva < dist.get(y, float('inf')):
+                dist[y] = nueva
+                heapq.heappush(cola, (nueva, y))
+    return dist
+
+# Atajos necesarios para contraer v: lista de (u, w, peso)
+def atajos_necesarios(adj, v):
+    vecinos = list(adj[v].items())
+    atajos = []
+    for i, (u, peso_u) in enumerate(vecinos):
+        restantes = vecinos[i + 1:]
+        if not restantes:
+            continue
+        limite = peso_u + max(peso_w for _, peso_w in restantes)
+        dist = busqueda_testigos(adj, u, v, limite)
+        for w, peso_w in restantes:
+            via_v = peso_u + peso_w
+            if dist.get(w, float('inf')) > via_v:
+                atajos.append((u, w, via_v))
+    return atajos
+
+def prioridad(adj, v, vecinos_contraidos):
+    # Diferencia de aristas + vecinos ya contraídos (reparte la contracción por el grafo)
+    return len(atajos_necesarios(adj, v)) - len(adj[v]) + vecinos_contraidos[v]
+
+def preprocesar_jerarquia(grafo):
+    inicio = time.perf_counter()
+    ids = list(grafo.nodes)
+    indice = {nodo: i for i, nodo in enumerate(ids)}
+    n = len(ids)
+
+    # Grafo de trabajo: se van quitando los nodos contraídos
+    adj = [dict() for _ in range(n)]
+    for a, b, datos in grafo.edges(data=True):
+        if a == b:
+            continue
+        u, w = indice[a], indice[b]
+        adj[u][w] = datos['weight']
+        adj[w][u] = datos['weight']
+
+    medios = {}  # (u, w) con u < w -> nodo intermedio del atajo
+    vecinos_contraidos = [0] * n
+    arriba = [None] * n  # aristas hacia nodos contraídos después (de mayor rango)
+    cola = [(prioridad(adj, v, vecinos_contraidos), v) for v in range(n)]
+    heapq.heapify(cola)
+    total_atajos = 0
+
+    while cola:
+        _, v = heapq.heappop(cola)
+        if arriba[v] is not None:
+            continue
+        # Actualización perezosa: si la prioridad empeoró, vuelve a la cola
+        actual = prioridad(adj, v, vecinos_contraidos)
+        if cola and actual > cola[0][0]:
+            heapq.heappush(cola, (actual, v))
+            continue
+
+        for u, w, peso in atajos_necesarios(adj, v):
+            if peso < adj[u].get(w, float('inf')):
+                adj[u][w] = peso
+                adj[w][u] = peso
+                medios[(min(u, w), max(u, w))] = v
+                total_atajos += 1
+
+        # Todos los vecinos que quedan tendrán mayor rango que v
+        arriba[v] = list(adj[v].items())
+        for u in adj[v]:
+            del adj[u][v]
+            vecinos_contraidos[u] += 1
+        adj[v] = {}
+
+    # Grafo ascendente en formato CSR para guardarlo compacto
+    offsets = array('i', [0]) * (n + 1)
+    destinos = array('i')
+    pesos = array('d')
+    for v in range(n):
+        for w, peso in arriba[v]:
+            destinos.append(w)
+            pesos.append(peso)
+        offsets[v + 1] = len(destinos)
+
+    print(f"Jerarquía construida: {n} nodos, {total_atajos} atajos "
+          f"en {time.perf_counter() - inicio:.1f} s")
+
+    return {
+        'version': VERSION_FORMATO,
+        'firma': firma_grafo(grafo),
+        'ids': ids,
+        'offsets': offsets,
+        'destinos': destinos,
+        'pesos': pesos,
+        'medios': medios,
+    }
+
+def guardar_jerarquia(jerarquia, archivo=None):
+    archivo = archivo or ruta_jerarquia()
+    medios = array('i')
+    for (u, w), v in jerarquia['medios'].items():
+        medios.extend((u, w, v))
+    nodos_firma, aristas_firma, peso_firma = jerarquia['firma']
+    partes = [
+        CABECERA.pack(MAGIA, jerarquia['version'], 0, len(jerarquia['ids']), len(jerarquia['destinos']),
+                      len(jerarquia['medios']), nodos_firma, aristas_firma, peso_firma),
+        array('q', jerarquia['ids']).tobytes(),
+        jerarquia['pesos'].tobytes(),
+        jerarquia['offsets'].tobytes(),
+        jerarquia['destinos'].tobytes(),
+        medios.tobytes(),
+    ]
+    escribir_atomico(archivo, b''.join(partes))
+
+def leer_jerarquia(archivo):
+    with open(archivo, 'rb') as f:
+        datos = f.read()
+    if len(datos) < CABECERA.size:
+        raise ValueError(f"{archivo} está truncado (sin cabecera completa)")
+    magia, version, _, n, m, k, nodos_firma, aristas_firma, peso_firma = CABECERA.unpack_from(datos)
+    if magia != MAGIA:
+        raise ValueError(f"{archivo} no es una jerarquía válida")
+    if n < 0 or m < 0 or k < 0:
+        raise ValueError(f"{archivo} tiene una cabecera dañada")
+    esperado = CABECERA.size + 8 * n + 8 * m + 4 * (n + 1) + 4 * m + 12 * k
+    if len(datos) != esperado:
+        raise ValueError(f"{archivo} mide {len(datos)} bytes y debería medir {esperado} "
+                         f"(truncado o dañado)")
+
+    posicion = CABECERA.size
+
+    def tomar(formato, cantidad):
+        nonlocal posicion
+        bloque = array(formato)
+        bloque.frombytes(datos[posicion:posicion + cantidad * bloque.itemsize])
+        posicion += cantidad * bloque.itemsize
+        return bloque
+
+    ids = tomar('q', n).tolist()
+    pesos = tomar('d', m)
+    offsets = tomar('i', n + 1)
+    destinos = tomar('i', m)
+    medios = tomar('i', 3 * k)
+    return {
+        'version': version,
+        'firma': (nodos_firma, aristas_firma, peso_firma),
+        'ids': ids,
+        'offsets': offsets,
+        'destinos': destinos,
+        'pesos': pesos,
+        'medios': {(medios[i], medios[i + 1]): medios[i + 2] for i in range(0, len(medios), 3)},
+    }
+
+# Devuelve None si no hay archivo, si está dañado o si fue generado para otro grafo
+def cargar_jerarquia(archivo, grafo):
+    if not os.path.exists(archivo):
+        return None
+    try:
+        jerarquia = leer_jerarquia(archivo)
+    except (OSError, ValueError) as e:
+        print(f"No se pudo leer {archivo}: {e}")
+        return None
+    if jerarquia['version'] != VERSION_FORMATO or jerarquia['firma'] != firma_grafo(grafo):
+        print(f"{archivo} no corresponde al grafo actual, se ignora.")
+        return None
+    return jerarquia
+
+class MotorRutas:
+    """Responde consultas origen/destino con la jerarquía de contracción si
+    existe el archivo preprocesado; si no, usa A* sobre el grafo original."""
+
+    def __init__(self, grafo, nodos, archivo=None):
+        self.grafo = grafo
+        self.nodos = nodos
+        self.jerarquia = cargar_jerarquia(archivo or ruta_jerarquia(), grafo)
+        if self.jerarquia is not None:
+            self.indice = {nodo: i for i, nodo in enumerate(self.jerarquia['ids'])}
+
+    def usa_jerarquia(self):
+        return self.jerarquia is not None
+
+    def ruta(self, origen, destino):
+        if self.jerarquia is None:
+            return a_estrella(self.grafo, self.nodos, origen, destino)
+        return self.consulta_jerarquia(origen, destino)
+
+    def consulta_jerarquia(self, origen, destino):
+        inicio = time.perf_counter()
+        offsets = self.jerarquia['offsets']
+        destinos = self.jerarquia['destinos']
+        pesos = self.jerarquia['pesos']
+        s, t = self.indice[origen], self.indice[destino]
+
+        dist = [{s: 0.0}, {t: 0.0}]
+        padres = [{s: None}, {t: None}]
+        asentados = [set(), set()]
+        colas = [[(0.0, s)], [(0.0, t)]]
+        mejor = float('inf')
+        encuentro = None
+
+        # Ambas búsquedas solo suben; se detiene cada lado cuando su mínimo supera 'mejor'
+        while colas[0] or colas[1]:
+            for lado in (0, 1):
+                if not colas[lado]:
+                    continue
+                d, u = heapq.heappop(colas[lado])
+                if d >= mejor:
+                    colas[lado] = []
+                    continue
+                if u in asentados[lado]:
+                    continue
+                asentados[lado].add(u)
+                otro = dist[1 - lado]
+                if u in otro and d + otro[u] < mejor:
+                    mejor = d + otro[u]
+                    encuentro = u
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = destinos[k]
+                    nueva = d + pesos[k]
+                    if nueva < dist[lado].get(v, float('inf')):
+                        dist[lado][v] = nueva
+                        padres[lado][v] = u
+                        heapq.heappush(colas[lado], (nueva, v))
+
+        if encuentro is None:
+            raise nx.NetworkXNoPath(f"No hay ruta entre {origen} y {destino}")
+
+        # Camino en la jerarquía: s -> ... -> encuentro -> ... -> t
+        subida = []
+        nodo = encuentro
+        while nodo is not None:
+            subida.append(nodo)
+            nodo = padres[0][nodo]
+        subida.reverse()
+        nodo = padres[1][encuentro]
+        while nodo is not None:
+            subida.append(nodo)
+            nodo = padres[1][nodo]
+
+        ids = self.jerarquia['ids']
+        ruta = [ids[i] for i in self.desempaquetar(subida)]
+        total_asentados = len(asentados[0]) + len(asentados[1])
+        return ResultadoRuta(ruta, mejor, total_asentados, (time.perf_counter() - inicio) * 1000)
+
+    def desempaquetar(self, camino):
+        # Reemplaza cada atajo u-w por u-medio-w, hasta que solo queden aristas originales
+        medios = self.jerarquia['medios']
+        resultado = [camino[0]]
+        pila = [(camino[i], camino[i + 1]) for i in range(len(camino) - 2, -1, -1)]
+        while pila:
+            u, w = pila.pop()
+            medio = medios.get((min(u, w), max(u, w)))
+            if medio is None:
+                resultado.append(w)
+            else:
+                pila.append((medio, w))
+                pila.append((u, medio))
+        return resultado
+
+def comparar_con_bidireccional(grafo, motor, consultas=200, semilla=0):
+    rnd = random.Random(semilla)
+    componente = list(max(nx.connected_components(grafo), key=len))
+    pares = [(rnd.choice(componente), rnd.choice(componente)) for _ in range(consultas)]
+
+    for nombre, buscar in (("Dijkstra bidireccional", lambda o, d: dijkstra_bidireccional(grafo, o, d)),
+                           ("Jerarquía de contracción", motor.ruta)):
+        total_ms = 0.0
+        total_asentados = 0
+        for o, d in pares:
+            resultado = buscar(o, d)
+            total_ms += resultado.tiempo_ms
+            total_asentados += resultado.nodos_asentados
+        print(f"{nombre:>26}: {total_ms / consultas:8.3f} ms/consulta | "
+              f"{total_asentados / consultas:9.1f} nodos asentados")
+
+if __name__ == "__main__":
+    from cache_osm import cargar_grafo_puno
+
+    grafo, nodos = cargar_grafo_puno()
+    if grafo is None:
+        raise SystemExit("No se pudo crear el grafo de calles.")
+
+    guardar_jerarquia(preprocesar_jerarquia(grafo))
+    print(f"Jerarquía guardada en {ruta_jerarquia()}")
+
+    motor = MotorRutas(grafo, nodos)
+    comparar_con_bidireccional(grafo, motor)
@@ -1,4 +1,3 @@
-import requests
 import networkx as nx
 import folium
 import tkinter as tk
@@ -6,100 +5,26 @@ from tkinter import messagebox, ttk
 from geopy.geocoders import Nominatim
 import webbrowser
 import os
-import math
+import threading
+from grafo_osm import LUGARES_PUNO
+from cache_osm import cargar_grafo_puno
+from cache_geocodificacion import CacheGeocodificacion
+from indice_espacial import IndiceEspacial
+from jerarquia_contraccion import MotorRutas
 
 # Configurar geolocalizador
 geolocalizador = Nominatim(user_agent="puno_ruta_app")
-
-# Lugares predefinidos en Puno
-LUGARES_PUNO = [
-    "Escuela Profesional de Ingeniería de Sistemas",
-    "Biblioteca Central Universidad Nacional del Altiplano",
-    "Mercado Bellavista",
-    "Estadio Enrique Torres Belón",
-    "Puerto Puno",
-    "Clínica Las Kalas",
-    "Catedral de Puno",
-    "Casa del Corregidor",
-    "Parque Pino",
-    "Museo Naval de Puno",
-    "Mirador Kuntur Wasi",
-    "Cerro Huajsapata",
-    "Terminal Terrestre Puno",
-    "Hospital Regional Manuel Núñez Butrón"
-]
-
-# Función para obtener datos OSM de Puno
-def obtener_calles_puno():
-    try:
-        consulta = """
-        [out:json];
-        area[name="Puno"]->.a;
-        (
-          way(area.a)[highway];
-        );
-        out body;
-        >;
-        out skel qt;
-        """
-        url = "http://overpass-api.de/api/interpreter"
-        r = requests.post(url, data={'data': consulta}, timeout=30)
-        r.raise_for_status()
-        return r.json()
-    except requests.exceptions.RequestException as e:
-        messagebox.showerror("Error de conexión", f"No se pudo conectar al servidor OSM: {e}")
-        return None
-
-# Función para construir el grafo de calles
-def crear_grafo_osm(datos_osm):
-    if datos_osm is None or 'elements' not in datos_osm:
-        return None, None
-        
-    G = nx.Graph()
-    nodos = {}
-
-    for elem in datos_osm['elements']:
-        if elem['type'] == 'node':
-            nodos[elem['id']] = (elem['lat'], elem['lon'])
-
-    for elem in datos_osm['elements']:
-        if elem['type'] == 'way' and 'nodes' in elem:
-            nodes_way = elem['nodes']
-            for i in range(len(nodes_way) - 1):
-                n1 = nodes_way[i]
-                n2 = nodes_way[i + 1]
-                if n1 in nodos and n2 in nodos:
-                    lat1, lon1 = nodos[n1]
-                    lat2, lon2 = nodos[n2]
-                    dist = haversine_distance(lat1, lon1, lat2, lon2)
-                    G.add_edge(n1, n2, weight=dist, highway=elem.get('tags', {}).get('highway', 'unknown'))
-
-    return G, nodos
-
-# Función para calcular distancia haversine
-def haversine_distance(lat1, lon1, lat2, lon2):
-    R = 6371  # Radio de la Tierra en km
-    dLat = math.radians(lat2 - lat1)
-    dLon = math.radians(lon2 - lon1)
-    a = (math.sin(dLat/2) * math.sin(dLat/2) +
-         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) *
-         math.sin(dLon/2) * math.sin(dLon/2))
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    return R * c
+cache_geo = CacheGeocodificacion(geolocalizador)
 
 # Función para obtener el nodo más cercano
-def obtener_nodo_desde_direccion(direccion, nodos_dict):
-    if not direccion or not nodos_dict:
+def obtener_nodo_desde_direccion(direccion):
+    if not direccion:
         return None
         
     try:
-        ubicacion = geolocalizador.geocode(direccion + ", Puno, Perú", timeout=10)
-        if not ubicacion:
-            return None
-        lat, lon = ubicacion.latitude, ubicacion.longitude
-        nodo_cercano = min(nodos_dict, 
-                          key=lambda n: haversine_distance(nodos_dict[n][0], nodos_dict[n][1], lat, lon))
-        return nodo_cercano
+        # El caché recuerda la ubicación (o que no existe) y el nodo ya ajustado;
+        # solo consulta Nominatim y el árbol KD la primera vez
+        return cache_geo.nodo_para(direccion, indice_nodos, grafo)
     except Exception as e:
         print(f"Error geocodificando {direccion}: {e}")
         return None
@@ -139,14 +64,16 @@ def calcular_ruta():
     ventana.update_idletasks()
 
     try:
-        nodo_o = obtener_nodo_desde_direccion(origen, nodos)
-        nodo_d = obtener_nodo_desde_direccion(destino, nodos)
+        nodo_o = obtener_nodo_desde_direccion(origen)
+        nodo_d = obtener_nodo_desde_direccion(destino)
 
         if nodo_o is None or nodo_d is None:
             messagebox.showerror("Error", "No se encontraron uno o ambos lugares. Verifica los nombres.")
             return
 
-        ruta = nx.shortest_path(grafo, nodo_o, nodo_d, weight='weight')
+        # Jerarquía de contracción si está preprocesada; si no, A* con heurística haversine
+        resultado = motor_rutas.ruta(nodo_o, nodo_d)
+        ruta = resultado.ruta
         puntos = [nodos[n] for n in ruta]
         distancia_total = calcular_distancia_total(grafo, ruta)
 
@@ -210,18 +137,30 @@ def calcular_ruta():
         progress_bar.stop()
 
 # -------- Cargar datos OSM --------
-print("Descargando las calles de Puno...")
-datos_osm = obtener_calles_puno()
-if datos_osm is None:
-    exit()
-
-grafo, nodos = crear_grafo_osm(datos_osm)
+print("Cargando las calles de Puno...")
+# Usa la copia local (cache_osm/) si es reciente; si no, descarga de Overpass
+grafo, nodos = cargar_grafo_puno()
 if grafo is None or nodos is None:
     messagebox.showerror("Error", "No se pudo crear el grafo de calles.")
     exit()
 
 print(f"Grafo creado con {len(grafo.nodes)} nodos y {len(grafo.edges)} aristas.")
 
+# Índice espacial para ubicar el nodo más cercano a cada dirección
+# (solo nodos que forman parte del grafo, para que siempre haya ruta posible)
+indice_nodos = IndiceEspacial({n: nodos[n] for n in grafo.nodes})
+
+# Resolver en segundo plano todos los lugares de la lista, para que elegirlos no espere a la red
+threading.Thread(target=cache_geo.pregeocodificar, args=(LUGARES_PUNO, indice_nodos, grafo),
+                 daemon=True).start()
+
+# Para generar la jerarquía: python jerarquia_contraccion.py
+motor_rutas = MotorRutas(grafo, nodos)
+if motor_rutas.usa_jerarquia():
+    print("Usando jerarquía de contracción precalculada.")
+else:
+    print("Sin jerarquía precalculada, se usará A*.")
+
 # -------- Interfaz gráfica mejorada --------
 ventana = tk.Tk()
 ventana.title("Ruta más corta en Puno")
@@ -0,0 +1,176 @@
+import argparse
+import csv
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Matriz de distancias entre muchos orígenes y destinos del grafo de calles.
+#
+# En vez de una búsqueda por cada par (N² llamadas a nx.shortest_path), se hace
+# un solo Dijkstra por origen que se detiene en cuanto asentó todos los
+# destinos. Los orígenes se reparten entre varios procesos; cada proceso
+# recibe el grafo una sola vez al iniciar.
+
+_grafo = None  # grafo del proceso trabajador (lo fija iniciar_trabajador)
+
+def iniciar_trabajador(grafo):
+    global _grafo
+    _grafo = grafo
+
+# Dijkstra desde 'origen' hasta asentar todos los 'destinos'
+def distancias_desde(grafo, origen, destinos, con_rutas=False):
+    pendientes = set(destinos)
+    dist = {origen: 0.0}
+    padres = {origen: None}
+    asentados = set()
+    cola = [(0.0, origen)]
+
+    while cola and pendientes:
+        d, u = heapq.heappop(cola)
+        if u in asentados:
+            continue
+        asentados.add(u)
+        pendientes.discard(u)
+        for v, datos in grafo.adj[u].items():
+            nueva = d + datos['weight']
+            if nueva < dist.get(v, float('inf')):
+                dist[v] = nueva
+                padres[v] = u
+                heapq.heappush(cola, (nueva, v))
+
+    fila = [dist[d] if d in asentados else float('inf') for d in destinos]
+    rutas = None
+    if con_rutas:
+        rutas = []
+        for destino in destinos:
+            if destino not in asentados:
+                rutas.append(None)
+                continue
+            ruta = []
+            nodo = destino
+            while nodo is not None:
+                ruta.append(nodo)
+                nodo = padres[nodo]
+            ruta.reverse()
+            rutas.append(ruta)
+    return fila, rutas
+
+def _tarea(origen, destinos, con_rutas):
+    return distancias_desde(_grafo, origen, destinos, con_rutas)
+
+# Devuelve (matriz numpy de km, rutas o None). matriz[i][j] = inf si no hay ruta.
+# rutas[i][j] es la lista de nodos de origenes[i] a destinos[j].
+def calcular_matriz(grafo, origenes, destinos, con_rutas=False, procesos=None):
+    matriz = np.full((len(origenes), len(destinos)), np.inf)
+    rutas = [None] * len(origenes) if con_rutas else None
+
+    if procesos == 1:
+        resultados = (distancias_desde(grafo, o, destinos, con_rutas) for o in origenes)
+        for i, (fila, rutas_fila) in enumerate(resultados):
+            matriz[i] = fila
+            if con_rutas:
+                rutas[i] = rutas_fila
+        return matriz, rutas
+
+    with ProcessPoolExecutor(max_workers=procesos, initializer=iniciar_trabajador,
+                             initargs=(grafo,)) as ejecutor:
+        futuros = [ejecutor.submit(_tarea, o, destinos, con_rutas) for o in origenes]
+        for i, futuro in enumerate(futuros):
+            fila, rutas_fila = futuro.result()
+            matriz[i] = fila
+            if con_rutas:
+                rutas[i] = rutas_fila
+    return matriz, rutas
+
+def exportar_csv(archivo, nombres_origen, nombres_destino, matriz):
+    with open(archivo, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.writer(f)
+        escritor.writerow(["origen \\ destino (km)"] + list(nombres_destino))
+        for nombre, fila in zip(nombres_origen, matriz):
+            escritor.writerow([nombre] + ["" if np.isinf(x) else f"{x:.4f}" for x in fila])
+
+def exportar_npy(archivo, matriz):
+    np.save(archivo, matriz)
+
+# Una fila por par con ruta: origen, destino, km y los ids de nodo separados por espacio
+def exportar_rutas_csv(archivo, nombres_origen, nombres_destino, matriz, rutas):
+    with open(archivo, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.writer(f)
+        escritor.writerow(["origen", "destino", "km", "nodos"])
+        for i, nombre_origen in enumerate(nombres_origen):
+            for j, nombre_destino in enumerate(nombres_destino):
+                ruta = rutas[i][j]
+                if ruta is None:
+                    continue
+                escritor.writerow([nombre_origen, nombre_destino, f"{matriz[i][j]:.4f}",
+                                   " ".join(str(nodo) for nodo in ruta)])
+
+# Ubica cada lugar en el grafo (con el caché de geocodificación) y devuelve
+# los que se encontraron como [(nombre, nodo), ...]. Tras cada consulta que
+# salió a la red se espera 'pausa' segundos, como pide Nominatim.
+def ubicar_lugares(lugares, cache_geo, indice, grafo, pausa):
+    ubicados = []
+    for lugar in lugares:
+        try:
+            _, uso_red = cache_geo.buscar(lugar)
+            nodo = cache_geo.nodo_para(lugar, indice, grafo)
+            if uso_red:
+                time.sleep(pausa)
+        except Exception as e:
+            print(f"Error geocodificando {lugar}: {e}")
+            continue
+        if nodo is None:
+            print(f"No encontrado, se omite: {lugar}")
+        else:
+            ubicados.append((lugar, nodo))
+    return ubicados
+
+def main():
+    parser = argparse.ArgumentParser(description="Matriz de distancias entre los LUGARES_PUNO")
+    parser.add_argument("--csv", default="matriz_distancias.csv", help="archivo CSV de salida")
+    parser.add_argument("--npy", help="guardar también la matriz en formato NumPy (.npy)")
+    parser.add_argument("--rutas", metavar="CSV",
+                        help="calcular también los caminos y guardarlos en este CSV")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count(),
+                        help="procesos en paralelo (1 = sin paralelismo)")
+    args = parser.parse_args()
+    if args.procesos is not None and args.procesos < 1:
+        parser.error("--procesos tiene que ser al menos 1")
+
+    from geopy.geocoders import Nominatim
+
+    from cache_geocodificacion import PAUSA_NOMINATIM, CacheGeocodificacion
+    from cache_osm import cargar_grafo_puno
+    from grafo_osm import LUGARES_PUNO
+    from indice_espacial import IndiceEspacial
+
+    grafo, nodos = cargar_grafo_puno()
+    if grafo is None:
+        raise SystemExit("No se pudo crear el grafo de calles.")
+    indice = IndiceEspacial({n: nodos[n] for n in grafo.nodes})
+    cache_geo = CacheGeocodificacion(Nominatim(user_agent="puno_ruta_app"))
+
+    lugares = ubicar_lugares(LUGARES_PUNO, cache_geo, indice, grafo, PAUSA_NOMINATIM)
+    nombres = [nombre for nombre, _ in lugares]
+    puntos = [nodo for _, nodo in lugares]
+
+    inicio = time.perf_counter()
+    matriz, rutas = calcular_matriz(grafo, puntos, puntos, bool(args.rutas), args.procesos)
+    print(f"Matriz {len(puntos)}x{len(puntos)} calculada en {time.perf_counter() - inicio:.2f} s "
+          f"con {args.procesos} proceso(s)")
+
+    exportar_csv(args.csv, nombres, nombres, matriz)
+    print(f"CSV guardado en {args.csv}")
+    if args.npy:
+        exportar_npy(args.npy, matriz)
+        print(f"Matriz NumPy guardada en {args.npy}")
+    if rutas is not None:
+        exportar_rutas_csv(args.rutas, nombres, nombres, matriz, rutas)
+        tramos = sum(len(r) for fila in rutas for r in fila if r)
+        print(f"Rutas guardadas en {args.rutas} ({tramos} nodos en total)")
+
+if __name__ == "__main__":
+    main()
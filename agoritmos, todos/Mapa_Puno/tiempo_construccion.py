@@ -0,0 +1,93 @@
+import random
+import sys
+import time
+
+from grafo_osm import crear_grafo_osm, crear_grafo_osm_vectorizado
+
+# Mide cuánto tarda construir el grafo con crear_grafo_osm() (un haversine por
+# tramo) y con crear_grafo_osm_vectorizado() (NumPy en bloque) a medida que
+# crece el extracto OSM: distrito de Puno, provincia y toda la región.
+#
+#   python tiempo_construccion.py             extractos reales (se descargan una vez y quedan en caché)
+#   python tiempo_construccion.py --sintetico extractos generados, sin red
+
+PLANTILLA_CONSULTA = """
+        [out:json][timeout:180];
+        area[name="Puno"][admin_level="{nivel}"]->.a;
+        (
+          way(area.a)[highway];
+        );
+        out body;
+        >;
+        out skel qt;
+        """
+
+EXTRACTOS = [
+    ("Distrito de Puno", 8),
+    ("Provincia de Puno", 6),
+    ("Región Puno", 4),
+]
+
+REPETICIONES = 3
+
+# Extracto falso con la misma forma que la respuesta de Overpass
+def generar_datos_sinteticos(cantidad_vias, nodos_por_via=12, semilla=0):
+    rnd = random.Random(semilla)
+    elementos = []
+    siguiente_id = 1
+    tipos = ['residential', 'primary', 'secondary', 'tertiary', 'track', 'footway']
+    for via in range(cantidad_vias):
+        lat = rnd.uniform(-16.5, -14.0)
+        lon = rnd.uniform(-71.0, -69.0)
+        ids = []
+        for _ in range(nodos_por_via):
+            # Cada tanto la vía reutiliza un nodo existente (intersección)
+            if ids and elementos and rnd.random() < 0.1:
+                ids.append(rnd.randrange(1, siguiente_id))
+                continue
+            lat += rnd.uniform(-0.0005, 0.0005)
+            lon += rnd.uniform(-0.0005, 0.0005)
+            elementos.append({'type': 'node', 'id': siguiente_id, 'lat': lat, 'lon': lon})
+            ids.append(siguiente_id)
+            siguiente_id += 1
+        elementos.append({'type': 'way', 'id': via, 'nodes': ids,
+                          'tags': {'highway': rnd.choice(tipos)}})
+    return {'elements': elementos}
+
+def medir(funcion, datos_osm):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        grafo, _ = funcion(datos_osm)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor * 1000, grafo
+
+def comparar(nombre, datos_osm):
+    escalar_ms, g1 = medir(crear_grafo_osm, datos_osm)
+    vectorizado_ms, g2 = medir(crear_grafo_osm_vectorizado, datos_osm)
+    iguales = (set(g1.nodes) == set(g2.nodes) and set(g1.edges) == set(g2.edges) and
+               all(abs(g1.edges[u, v]['weight'] - d['weight']) < 1e-9 and
+                   g1.edges[u, v]['highway'] == d['highway'] for u, v, d in g2.edges(data=True)))
+    print(f"{nombre:>20} | {len(datos_osm['elements']):>9} elementos | {g2.number_of_edges():>8} aristas | "
+          f"escalar {escalar_ms:9.1f} ms | vectorizado {vectorizado_ms:9.1f} ms | "
+          f"{escalar_ms / vectorizado_ms:5.2f}x | {'iguales' if iguales else 'DISTINTOS'}")
+
+def main():
+    print("Tiempo de construcción del grafo (mejor de "
+          f"{REPETICIONES} repeticiones)")
+    if '--sintetico' in sys.argv:
+        for vias in (2_000, 20_000, 100_000):
+            comparar(f"Sintético {vias} vías", generar_datos_sinteticos(vias))
+        return
+
+    from cache_osm import cargar_datos_osm
+
+    for nombre, nivel in EXTRACTOS:
+        datos_osm = cargar_datos_osm(PLANTILLA_CONSULTA.format(nivel=nivel))
+        if datos_osm is None:
+            print(f"{nombre}: no se pudo descargar el extracto")
+            continue
+        comparar(nombre, datos_osm)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import random
 import heapq
 import time
+import sys
+from array import array
 
 def generar_grafo(n, conexiones_por_nodo):
     grafo = {i: [] for i in range(n)}
@@ -23,6 +25,60 @@ def generar_grafo(n, conexiones_por_nodo):
 
     return grafo
 
+def generar_grafo_csr(n, conexiones_por_nodo):
+    # Mismo procedimiento que generar_grafo, pero guardando el grafo en formato
+    # CSR: tres buffers planos en lugar de un dict de listas de tuplas.
+    #   offsets[u] .. offsets[u + 1]  -> rango de aristas que salen de u
+    #   destinos[k], pesos[k]         -> vecino y peso de la arista k
+    origenes = array('i')
+    vecinos = array('i')
+    pesos_aristas = array('i')
+    grados = array('i', [0]) * n
+    existentes = set()  # pares (u, v) ya conectados, codificados como u * n + v
+
+    def agregar(u, v, peso):
+        origenes.append(u)
+        vecinos.append(v)
+        pesos_aristas.append(peso)
+        grados[u] += 1
+        grados[v] += 1
+        existentes.add(u * n + v)
+        existentes.add(v * n + u)
+
+    # Paso 1: cadena para asegurar conectividad
+    for u in range(n - 1):
+        agregar(u, u + 1, random.randint(1, 20))
+
+    # Paso 2: agregar conexiones aleatorias sin duplicados
+    for u in range(n):
+        while grados[u] < conexiones_por_nodo:
+            v = random.randint(0, n - 1)
+            if v == u or u * n + v in existentes:
+                continue
+            agregar(u, v, random.randint(1, 20))
+
+    existentes.clear()
+
+    # Paso 3: pasar la lista de aristas a CSR (cada arista en ambos sentidos)
+    offsets = array('i', [0]) * (n + 1)
+    for u in range(n):
+        offsets[u + 1] = offsets[u] + grados[u]
+
+    total = offsets[n]
+    destinos = array('i', [0]) * total
+    pesos = array('i', [0]) * total
+    siguiente = array('i', offsets[:n])
+    for k in range(len(origenes)):
+        u, v, peso = origenes[k], vecinos[k], pesos_aristas[k]
+        destinos[siguiente[u]] = v
+        pesos[siguiente[u]] = peso
+        siguiente[u] += 1
+        destinos[siguiente[v]] = u
+        pesos[siguiente[v]] = peso
+        siguiente[v] += 1
+
+    return offsets, destinos, pesos
+
 def dijkstra(grafo, inicio):
     dist = {nodo: float('inf') for nodo in grafo}
     dist[inicio] = 0
@@ -39,10 +95,66 @@ def dijkstra(grafo, inicio):
 
     return dist
 
+def dijkstra_csr(offsets, destinos, pesos, inicio):
+    # Igual que dijkstra(), pero las distancias viven en un arreglo indexado
+    # por el número de nodo en vez de un dict.
+    n = len(offsets) - 1
+    dist = array('d', [float('inf')]) * n
+    dist[inicio] = 0
+    heap = [(0, inicio)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = destinos[k]
+            nueva = d + pesos[k]
+            if nueva < dist[v]:
+                dist[v] = nueva
+                heapq.heappush(heap, (nueva, v))
+
+    return dist
+
+def comparar_representaciones(n, conexiones_por_nodo, semilla=42):
+    # Construye el mismo grafo (misma semilla) en ambos formatos y mide
+    # el tiempo de construcción y de dijkstra en cada uno.
+    resultados = {}
+
+    random.seed(semilla)
+    t0 = time.perf_counter()
+    grafo = generar_grafo(n, conexiones_por_nodo)
+    t1 = time.perf_counter()
+    dist_dict = dijkstra(grafo, 0)
+    t2 = time.perf_counter()
+    resultados['dict'] = ((t1 - t0) * 1000, (t2 - t1) * 1000)
+    del grafo
+
+    random.seed(semilla)
+    t0 = time.perf_counter()
+    offsets, destinos, pesos = generar_grafo_csr(n, conexiones_por_nodo)
+    t1 = time.perf_counter()
+    dist_csr = dijkstra_csr(offsets, destinos, pesos, 0)
+    t2 = time.perf_counter()
+    resultados['csr'] = ((t1 - t0) * 1000, (t2 - t1) * 1000)
+
+    iguales = all(dist_dict[u] == dist_csr[u] for u in range(n))
+
+    print(f"\n=== Comparación dict vs CSR (n={n}, conexiones={conexiones_por_nodo}) ===")
+    for nombre, (construccion_ms, dijkstra_ms) in resultados.items():
+        print(f"{nombre:>5}: construcción {construccion_ms:10.3f} ms | dijkstra {dijkstra_ms:10.3f} ms")
+    print(f"Distancias idénticas: {'sí' if iguales else 'NO'}")
+    return resultados
+
 def main():
     n = 1000  # número de nodos
     conexiones_por_nodo = 10
 
+    # python algoritmo2.py <n> solo compara ambas representaciones
+    if len(sys.argv) > 1:
+        comparar_representaciones(int(sys.argv[1]), conexiones_por_nodo)
+        return
+
     grafo = generar_grafo(n, conexiones_por_nodo)
 
     inicio = 0
@@ -59,5 +171,7 @@ def main():
         else:
             print(f"Nodo {nodo}: {distancias[nodo]}")
 
+    comparar_representaciones(n, conexiones_por_nodo)
+
 if __name__ == "__main__":
     main()
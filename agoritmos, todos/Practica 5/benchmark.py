@@ -0,0 +1,264 @@
+import argparse
+import csv
+import gc
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import complejidad
+from memoria import medir_memoria
+from ordenamiento import ALGORITHMS, TEST_CASES
+
+# Benchmark de los algoritmos de ordenamiento.py con estadística.
+#
+# Para cada caso (aleatoria, ordenada, inversa) y cada tamaño se genera UNA
+# lista con semilla fija y todos los algoritmos ordenan copias de esa misma
+# lista. Primero van unas corridas de calentamiento que no se cuentan y
+# después N repeticiones en rondas intercaladas (A, B, C, A, B, C...), así
+# una deriva lenta de la máquina afecta a todos por igual. Cada corrida se
+# mide con el recolector de basura apagado (después de un gc.collect()).
+# Se informa mediana, IQR y desviación estándar.
+#
+#   python benchmark.py --tamanos 100 1000 2000 --repeticiones 9 --json base.json
+#   python benchmark.py --tamanos 100 1000 2000 --compare base.json --tolerancia 0.1
+#
+# --compare marca una regresión cuando la mediana empeoró más que la
+# tolerancia Y los rangos intercuartiles no se tocan (q1 nuevo > q3 anterior)
+# Y la mediana subió al menos MINIMO_MS; si no, la diferencia se informa como
+# ruido (a 0.01 ms un 15% es ruido de reloj aunque los IQR no se toquen).
+# Termina con código 1 si hubo alguna regresión.
+#
+# Con --complejidad además se ajusta cada serie de tamaños a n, n·log n y n²
+# (ver complejidad.py) y, junto con --compare, se avisa si un exponente subió.
+#
+# Con --memoria cada (algoritmo, caso, n) tiene además dos corridas
+# instrumentadas, fuera de las cronometradas, que agregan las columnas
+# pico_bytes, asignaciones y bytes_asignados (ver memoria.py).
+
+TAMANOS = [100, 500, 1000]
+REPETICIONES = 7
+CALENTAMIENTO = 1
+TOLERANCIA = 0.10  # 10% más lento que la línea base = regresión
+MINIMO_MS = 0.05   # cambios de mediana más chicos que esto no cuentan
+
+COLUMNAS = ['algoritmo', 'caso', 'n', 'repeticiones', 'mediana_ms', 'q1_ms', 'q3_ms', 'iqr_ms',
+            'desviacion_ms', 'minimo_ms', 'media_ms', 'comparaciones', 'intercambios']
+COLUMNAS_MEMORIA = ['pico_bytes', 'asignaciones', 'bytes_asignados']
+
+def lista_para(generador, n, semilla, caso):
+    # Semilla propia por (caso, n): agregar un tamaño no cambia las demás listas
+    return generador(n, random.Random(f"{semilla}-{caso}-{n}"))
+
+# Una corrida: (nanosegundos, comparaciones, intercambios)
+def medir_una(funcion, base, controlar_gc=True):
+    arr = list(base)
+    if controlar_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        inicio = time.perf_counter_ns()
+        comparaciones, intercambios = funcion(arr)
+        fin = time.perf_counter_ns()
+    finally:
+        if controlar_gc:
+            gc.enable()
+    return fin - inicio, comparaciones, intercambios
+
+def resumir(nombre, caso, n, tiempos_ns, comparaciones, intercambios):
+    ms = [t / 1e6 for t in tiempos_ns]
+    if len(ms) > 1:
+        q1, _, q3 = statistics.quantiles(ms, n=4, method='inclusive')
+        desviacion = statistics.stdev(ms)
+    else:
+        q1 = q3 = ms[0]
+        desviacion = 0.0
+    return {
+        'algoritmo': nombre,
+        'caso': caso,
+        'n': n,
+        'repeticiones': len(ms),
+        'mediana_ms': statistics.median(ms),
+        'q1_ms': q1,
+        'q3_ms': q3,
+        'iqr_ms': q3 - q1,
+        'desviacion_ms': desviacion,
+        'minimo_ms': min(ms),
+        'media_ms': statistics.fmean(ms),
+        'comparaciones': comparaciones,
+        'intercambios': intercambios,
+        'tiempos_ms': ms,
+    }
+
+def correr(tamanos=TAMANOS, algoritmos=None, casos=None, repeticiones=REPETICIONES,
+           calentamiento=CALENTAMIENTO, semilla=0, controlar_gc=True, progreso=None, memoria=False):
+    elegidos = [(nombre, f) for nombre, f in ALGORITHMS if algoritmos is None or nombre in algoritmos]
+    resultados = []
+    for caso, generador in TEST_CASES:
+        if casos is not None and caso not in casos:
+            continue
+        for n in tamanos:
+            base = lista_para(generador, n, semilla, caso)
+            for _ in range(calentamiento):
+                for _, funcion in elegidos:
+                    medir_una(funcion, base, controlar_gc)
+
+            tiempos = {nombre: [] for nombre, _ in elegidos}
+            conteos = {}
+            for _ in range(repeticiones):
+                for nombre, funcion in elegidos:
+                    ns, comparaciones, intercambios = medir_una(funcion, base, controlar_gc)
+                    tiempos[nombre].append(ns)
+                    conteos[nombre] = (comparaciones, intercambios)
+
+            for nombre, funcion in elegidos:
+                resultado = resumir(nombre, caso, n, tiempos[nombre], *conteos[nombre])
+                if memoria:
+                    resultado.update(medir_memoria(funcion, list(base)))
+                resultados.append(resultado)
+                if progreso is not None:
+                    progreso(resultado)
+    return resultados
+
+def version_git():
+    try:
+        salida = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return salida.stdout.strip() or None
+
+def metadatos(args):
+    return {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'commit': version_git(),
+        'python': sys.version.split()[0],
+        'implementacion': platform.python_implementation(),
+        'plataforma': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+        'semilla': args.semilla,
+        'repeticiones': args.repeticiones,
+        'calentamiento': args.calentamiento,
+        'gc_controlado': not args.con_gc,
+        'memoria': args.memoria,
+    }
+
+def guardar_json(archivo, meta, resultados, analisis=None):
+    datos = {'meta': meta, 'resultados': resultados}
+    if analisis is not None:
+        datos['complejidad'] = analisis
+    with open(archivo, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, ensure_ascii=False, indent=1)
+
+def guardar_csv(archivo, resultados):
+    columnas = COLUMNAS
+    if resultados and 'pico_bytes' in resultados[0]:
+        columnas = COLUMNAS + COLUMNAS_MEMORIA
+    with open(archivo, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.DictWriter(f, fieldnames=columnas, extrasaction='ignore')
+        escritor.writeheader()
+        escritor.writerows(resultados)
+
+def imprimir_fila(r):
+    linea = (f"{r['algoritmo']:>14} {r['caso']:>9} {r['n']:>7} | mediana {r['mediana_ms']:>10.3f} ms | "
+             f"IQR {r['iqr_ms']:>8.3f} | desv {r['desviacion_ms']:>8.3f} | "
+             f"comp {r['comparaciones']:>9} | interc {r['intercambios']:>9}")
+    if 'pico_bytes' in r:
+        linea += f" | pico {r['pico_bytes'] / 1024:>9.1f} KB | asig {r['asignaciones']:>8}"
+    print(linea)
+
+# Compara contra un JSON anterior; devuelve la cantidad de regresiones
+def comparar_con(archivo_base, resultados, tolerancia, analisis=None, minimo_ms=MINIMO_MS):
+    with open(archivo_base, encoding='utf-8') as f:
+        filas_base = json.load(f)['resultados']
+    base = {(r['algoritmo'], r['caso'], r['n']): r for r in filas_base}
+
+    regresiones = 0
+    print(f"\nComparación con {archivo_base} (tolerancia {tolerancia:.0%}, mínimo {minimo_ms} ms)")
+    for r in resultados:
+        anterior = base.get((r['algoritmo'], r['caso'], r['n']))
+        if anterior is None:
+            estado, cambio = "sin línea base", ""
+        else:
+            razon = r['mediana_ms'] / anterior['mediana_ms']
+            cambio = f"{razon - 1:+.1%}"
+            apreciable = abs(r['mediana_ms'] - anterior['mediana_ms']) >= minimo_ms
+            if razon > 1 + tolerancia and r['q1_ms'] > anterior['q3_ms'] and apreciable:
+                estado = "REGRESIÓN"
+                regresiones += 1
+            elif razon < 1 - tolerancia and r['q3_ms'] < anterior['q1_ms'] and apreciable:
+                estado = "mejora"
+            elif abs(razon - 1) > tolerancia and not apreciable:
+                estado = f"ruido (menos de {minimo_ms} ms)"
+            elif abs(razon - 1) > tolerancia:
+                estado = "ruido (IQR se solapan)"
+            else:
+                estado = "igual"
+            if (r['comparaciones'], r['intercambios']) != (anterior['comparaciones'], anterior['intercambios']):
+                estado += ", cambiaron los conteos"
+            if 'pico_bytes' in r and 'pico_bytes' in anterior:
+                # La memoria no tiene ruido de reloj: alcanza con la tolerancia (y 1 KB de margen)
+                extra = r['pico_bytes'] - anterior['pico_bytes']
+                if extra > max(1024, anterior['pico_bytes'] * tolerancia):
+                    estado += f", MÁS MEMORIA (+{extra / 1024:.1f} KB)"
+                    regresiones += 1
+        print(f"{r['algoritmo']:>14} {r['caso']:>9} {r['n']:>7} | "
+              f"{'' if anterior is None else format(anterior['mediana_ms'], '.3f'):>10} -> "
+              f"{r['mediana_ms']:>10.3f} ms {cambio:>8} | {estado}")
+    if analisis is not None:
+        empeorados = complejidad.comparar_exponentes(complejidad.analizar(filas_base), analisis['ajustes'])
+        complejidad.imprimir_empeorados(empeorados)
+        regresiones += len(empeorados)
+    print(f"{regresiones} regresión(es)")
+    return regresiones
+
+def main():
+    nombres = [nombre for nombre, _ in ALGORITHMS]
+    parser = argparse.ArgumentParser(description="Benchmark de los algoritmos de ordenamiento.py")
+    parser.add_argument("--tamanos", type=int, nargs='+', default=TAMANOS)
+    parser.add_argument("--algoritmos", nargs='+', choices=nombres, metavar="ALGORITMO",
+                        help="por defecto todos: " + ", ".join(nombres))
+    parser.add_argument("--casos", nargs='+', choices=[caso for caso, _ in TEST_CASES])
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES)
+    parser.add_argument("--calentamiento", type=int, default=CALENTAMIENTO,
+                        help="corridas previas que no se cuentan")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--con-gc", action="store_true",
+                        help="no apagar el recolector de basura durante cada corrida")
+    parser.add_argument("--json", help="guardar los resultados en JSON")
+    parser.add_argument("--csv", help="guardar los resultados en CSV")
+    parser.add_argument("--compare", metavar="BASE.json",
+                        help="comparar las medianas con un JSON guardado antes")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                        help="cambio relativo de la mediana que se acepta (0.1 = 10%%)")
+    parser.add_argument("--minimo-ms", type=float, default=MINIMO_MS,
+                        help="cambio absoluto de la mediana por debajo del cual no hay regresión")
+    parser.add_argument("--memoria", action="store_true",
+                        help="medir memoria pico y asignaciones (dos corridas extra, más lento)")
+    parser.add_argument("--complejidad", action="store_true",
+                        help="ajustar n, n·log n y n² y buscar cruces (mejor con 4 o más tamaños)")
+    args = parser.parse_args()
+    if args.repeticiones < 1:
+        parser.error("--repeticiones tiene que ser al menos 1")
+
+    resultados = correr(args.tamanos, args.algoritmos, args.casos, args.repeticiones,
+                        args.calentamiento, args.semilla, not args.con_gc, progreso=imprimir_fila,
+                        memoria=args.memoria)
+
+    analisis = complejidad.informe(resultados) if args.complejidad else None
+
+    if args.json:
+        guardar_json(args.json, metadatos(args), resultados, analisis)
+        print(f"JSON guardado en {args.json}")
+    if args.csv:
+        guardar_csv(args.csv, resultados)
+        print(f"CSV guardado en {args.csv}")
+    if args.compare and comparar_con(args.compare, resultados, args.tolerancia, analisis, args.minimo_ms):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
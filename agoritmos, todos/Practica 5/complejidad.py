@@ -0,0 +1,269 @@
+import argparse
+import json
+import math
+from itertools import combinations
+
+# Complejidad empírica a partir de un barrido de tamaños de benchmark.py.
+#
+# Para cada algoritmo y caso se ajustan el tiempo, las comparaciones y los
+# intercambios contra tres modelos, c·f(n) + b con f = n, n·log2(n) y n² (b
+# absorbe el costo fijo de llamar a la función), y se elige el de menor error
+# relativo. Aparte se estima el exponente k de y ≈ a·n^k con una recta en
+# escala log-log (1 ≈ lineal, 2 ≈ cuadrático; n·log n da algo un poco mayor
+# que 1). Con eso se buscan los cruces: el tamaño a partir del cual un
+# algoritmo deja de ganarle a otro. Solo cuentan los tamaños donde uno es más
+# rápido sin discusión (los rangos intercuartiles no se tocan).
+#
+#   python benchmark.py --tamanos 50 100 200 500 1000 2000 --complejidad --json r.json
+#   python complejidad.py r.json
+#   python complejidad.py --verificar   (caso fijo con un cruce que hay que encontrar)
+
+MODELOS = [
+    ("n", lambda n: n),
+    ("n log n", lambda n: n * math.log2(n)),
+    ("n²", lambda n: n * n),
+]
+
+METRICAS = [
+    ("mediana_ms", "tiempo"),
+    ("comparaciones", "comparaciones"),
+    ("intercambios", "intercambios"),
+]
+
+MARGEN_EXPONENTE = 0.15  # cuánto puede subir el exponente antes de avisar
+EXTRAPOLACION_MAXIMA = 100  # no se anuncian cruces más allá de 100 veces el n más grande medido
+
+# y ≈ a·n^k por mínimos cuadrados en log-log; devuelve (a, k) o None
+def ajustar_potencia(ns, ys):
+    puntos = [(math.log(n), math.log(y)) for n, y in zip(ns, ys) if n > 0 and y > 0]
+    if len(puntos) < 2 or len(puntos) < len(ns):
+        return None
+    mx = sum(x for x, _ in puntos) / len(puntos)
+    my = sum(y for _, y in puntos) / len(puntos)
+    sxx = sum((x - mx) ** 2 for x, _ in puntos)
+    if sxx == 0:
+        return None
+    k = sum((x - mx) * (y - my) for x, y in puntos) / sxx
+    return math.exp(my - k * mx), k
+
+# y ≈ c·f(n) + b minimizando el error relativo (pesos 1/y²); devuelve
+# (c, b, error relativo RMS). Si b saliera negativo se ajusta sin b.
+def ajustar_modelo(f, ns, ys):
+    fs = [f(n) for n in ns]
+    ws = [1 / (y * y) for y in ys]
+    sw = sum(ws)
+    swf = sum(w * fi for w, fi in zip(ws, fs))
+    swff = sum(w * fi * fi for w, fi in zip(ws, fs))
+    swy = sum(w * y for w, y in zip(ws, ys))
+    swfy = sum(w * fi * y for w, fi, y in zip(ws, fs, ys))
+    det = sw * swff - swf * swf
+    c = b = 0.0
+    if len(ns) > 2 and det > 0:
+        c = (sw * swfy - swf * swy) / det
+        b = (swff * swy - swf * swfy) / det
+    if c <= 0 or b < 0:
+        c, b = swfy / swff, 0.0
+    error = math.sqrt(sum(((c * fi + b) / y - 1) ** 2 for fi, y in zip(fs, ys)) / len(ys))
+    return c, b, error
+
+def ajustar(ns, ys):
+    resultado = {'exponente': None, 'modelo': None, 'error': None, 'constante': None, 'fijo': None}
+    potencia = ajustar_potencia(ns, ys)
+    if potencia is None:
+        return resultado  # algún valor en 0 (p. ej. sin intercambios): nada que ajustar
+    resultado['exponente'] = potencia[1]
+    nombre, (c, b, error) = min(((nombre, ajustar_modelo(f, ns, ys)) for nombre, f in MODELOS),
+                                key=lambda m: m[1][2])
+    resultado.update(modelo=nombre, error=error, constante=c, fijo=b)
+    return resultado
+
+# Agrupa las filas de benchmark.py por (algoritmo, caso) -> [(n, fila)] ordenado por n
+def series(resultados):
+    grupos = {}
+    for r in resultados:
+        grupos.setdefault((r['algoritmo'], r['caso']), []).append((r['n'], r))
+    for filas in grupos.values():
+        filas.sort(key=lambda p: p[0])
+    return grupos
+
+def analizar(resultados):
+    ajustes = []
+    for (algoritmo, caso), filas in series(resultados).items():
+        if len(filas) < 2:
+            continue
+        ns = [n for n, _ in filas]
+        for clave, metrica in METRICAS:
+            ajuste = ajustar(ns, [r[clave] for _, r in filas])
+            ajustes.append({'algoritmo': algoritmo, 'caso': caso, 'metrica': metrica,
+                            'tamanos': ns, **ajuste})
+    return ajustes
+
+# Tamaños donde cambia cuál de dos algoritmos es más rápido (por mediana).
+# Dentro del rango medido se interpola en escala log entre los dos tamaños
+# vecinos con ganador claro; si no hay cambio, se usa el corte de los ajustes
+# a·n^k (solo si los exponentes difieren de verdad): dentro del rango cuando
+# los tamaños cercanos al cruce quedaron sin ganador claro, o extrapolado más
+# allá del n más grande.
+def cruces(resultados, clave='mediana_ms'):
+    grupos = series(resultados)
+    casos = sorted({caso for _, caso in grupos})
+    encontrados = []
+    for caso in casos:
+        algoritmos = sorted(a for a, c in grupos if c == caso)
+        for a, b in combinations(algoritmos, 2):
+            filas_a = dict(grupos[(a, caso)])
+            filas_b = dict(grupos[(b, caso)])
+            ns = sorted(set(filas_a) & set(filas_b))
+            if len(ns) < 2:
+                continue
+            ya = [filas_a[n][clave] for n in ns]
+            yb = [filas_b[n][clave] for n in ns]
+            ganador = [quien_gana(filas_a[n], filas_b[n], clave) for n in ns]
+            encontrados.extend(cruces_par(caso, a, b, ns, ya, yb, ganador))
+    return encontrados
+
+# -1 si gana a, 1 si gana b, 0 si no se puede decir (los IQR se solapan)
+def quien_gana(fila_a, fila_b, clave):
+    if clave == 'mediana_ms':
+        if fila_a['q3_ms'] < fila_b['q1_ms']:
+            return -1
+        if fila_b['q3_ms'] < fila_a['q1_ms']:
+            return 1
+        return 0
+    return (fila_a[clave] > fila_b[clave]) - (fila_a[clave] < fila_b[clave])
+
+def cruces_par(caso, a, b, ns, ya, yb, ganador):
+    hallados = []
+    decididos = [i for i, g in enumerate(ganador) if g != 0 and ya[i] > 0 and yb[i] > 0]
+    for i, j in zip(decididos, decididos[1:]):
+        if ganador[i] == ganador[j]:
+            continue
+        # Razón log(ya/yb) interpolada linealmente en log n
+        r1, r2 = math.log(ya[i] / yb[i]), math.log(ya[j] / yb[j])
+        x1, x2 = math.log(ns[i]), math.log(ns[j])
+        n_cruce = math.exp(x1 + (x2 - x1) * r1 / (r1 - r2)) if r1 != r2 else ns[j]
+        antes, despues = (a, b) if ganador[i] < 0 else (b, a)
+        hallados.append({'caso': caso, 'n': n_cruce, 'gana_antes': antes, 'gana_despues': despues,
+                         'estimado': False, 'extrapolado': False})
+    if hallados:
+        return hallados
+
+    ajuste_a, ajuste_b = ajustar_potencia(ns, ya), ajustar_potencia(ns, yb)
+    if ajuste_a is None or ajuste_b is None or abs(ajuste_a[1] - ajuste_b[1]) < MARGEN_EXPONENTE:
+        return []
+    # a·n^k = b·n^j  ->  n = (ab / aa)^(1 / (ka - kb))
+    n_cruce = (ajuste_b[0] / ajuste_a[0]) ** (1 / (ajuste_a[1] - ajuste_b[1]))
+    crece_mas = a if ajuste_a[1] > ajuste_b[1] else b
+    otro = b if crece_mas == a else a
+    if ns[0] <= n_cruce <= ns[-1]:
+        # Se cortan dentro del rango pero los tamaños de alrededor no tienen
+        # ganador claro (IQR solapados). Vale si ningún tamaño decidido lo
+        # contradice: antes del cruce gana el que crece más, después el otro.
+        gana_crece_mas = -1 if crece_mas == a else 1
+        if any((ganador[i] == gana_crece_mas) != (ns[i] < n_cruce) for i in decididos):
+            return []
+    elif not ns[-1] < n_cruce <= ns[-1] * EXTRAPOLACION_MAXIMA:
+        return []  # antes del primer tamaño medido, o demasiado lejos
+    return [{'caso': caso, 'n': n_cruce, 'gana_antes': crece_mas, 'gana_despues': otro,
+             'estimado': True, 'extrapolado': n_cruce > ns[-1]}]
+
+# Exponentes que subieron más que 'margen' respecto de un análisis anterior
+def comparar_exponentes(anteriores, actuales, margen=MARGEN_EXPONENTE):
+    base = {(r['algoritmo'], r['caso'], r['metrica']): r for r in anteriores}
+    empeorados = []
+    for r in actuales:
+        previo = base.get((r['algoritmo'], r['caso'], r['metrica']))
+        if previo is None or previo['exponente'] is None or r['exponente'] is None:
+            continue
+        if r['exponente'] - previo['exponente'] > margen:
+            empeorados.append((r, previo))
+    return empeorados
+
+def imprimir_ajustes(ajustes):
+    print(f"\n{'Algoritmo':>14} {'caso':>9} {'métrica':>13} | {'exponente':>9} | {'modelo':>8} | error")
+    for r in ajustes:
+        if r['exponente'] is None:
+            print(f"{r['algoritmo']:>14} {r['caso']:>9} {r['metrica']:>13} | {'-':>9} | {'-':>8} | "
+                  "(valores en 0)")
+            continue
+        print(f"{r['algoritmo']:>14} {r['caso']:>9} {r['metrica']:>13} | {r['exponente']:>9.2f} | "
+              f"{r['modelo']:>8} | {r['error']:.1%}")
+
+def imprimir_cruces(lista):
+    print("\nCruces por tiempo (mediana):")
+    if not lista:
+        print("  ninguno: en cada caso el orden de los algoritmos no cambia")
+    for c in lista:
+        if c['extrapolado']:
+            nota = " (extrapolado)"
+        elif c['estimado']:
+            nota = " (según los ajustes; cerca del cruce los IQR se solapan)"
+        else:
+            nota = ""
+        print(f"  {c['caso']:>9}: {c['gana_antes']} gana hasta n ≈ {c['n']:.0f}, "
+              f"después {c['gana_despues']}{nota}")
+
+def imprimir_empeorados(empeorados):
+    for r, previo in empeorados:
+        print(f"EXPONENTE EMPEORÓ: {r['algoritmo']} {r['caso']} {r['metrica']}: "
+              f"{previo['exponente']:.2f} -> {r['exponente']:.2f}")
+
+def informe(resultados):
+    ajustes = analizar(resultados)
+    lista = cruces(resultados)
+    imprimir_ajustes(ajustes)
+    imprimir_cruces(lista)
+    return {'ajustes': ajustes, 'cruces': lista}
+
+# Caso fijo para --verificar: en casi_ord Insertion Sort gana sin discusión
+# hasta n = 400 y en 800 los IQR se solapan, así que ningún par de tamaños
+# decididos muestra el cambio; los ajustes se cortan en n ≈ 590 y ese cruce
+# tiene que aparecer igual.
+EJEMPLO_CRUCE = [
+    {'algoritmo': algoritmo, 'caso': 'casi_ord', 'n': n, 'mediana_ms': mediana,
+     'q1_ms': mediana * (1 - ancho), 'q3_ms': mediana * (1 + ancho)}
+    for algoritmo, puntos in [
+        ("Insertion Sort", [(50, 0.0354, 0.05), (100, 0.1, 0.05), (200, 0.2828, 0.05),
+                            (400, 0.8, 0.05), (800, 2.2627, 0.15)]),
+        ("Merge Sort", [(50, 0.1215, 0.05), (100, 0.243, 0.05), (200, 0.486, 0.05),
+                        (400, 0.972, 0.05), (800, 1.944, 0.15)]),
+    ]
+    for n, mediana, ancho in puntos
+]
+
+def verificar():
+    lista = cruces(EJEMPLO_CRUCE)
+    imprimir_cruces(lista)
+    esperado = [c for c in lista if c['gana_antes'] == "Insertion Sort"
+                and c['gana_despues'] == "Merge Sort" and 400 < c['n'] < 800]
+    if len(lista) != 1 or not esperado:
+        raise SystemExit("FALLÓ: se esperaba un cruce Insertion Sort -> Merge Sort entre 400 y 800")
+    print("OK")
+
+def main():
+    parser = argparse.ArgumentParser(description="Complejidad empírica de un JSON de benchmark.py")
+    parser.add_argument("archivo", nargs='?', help="JSON guardado con benchmark.py --json")
+    parser.add_argument("--compare", metavar="BASE.json",
+                        help="avisar si algún exponente subió respecto de otro JSON")
+    parser.add_argument("--margen", type=float, default=MARGEN_EXPONENTE)
+    parser.add_argument("--verificar", action="store_true",
+                        help="comprobar la búsqueda de cruces con un caso fijo")
+    args = parser.parse_args()
+    if args.verificar:
+        verificar()
+        return
+    if args.archivo is None:
+        parser.error("falta el archivo JSON")
+
+    with open(args.archivo, encoding='utf-8') as f:
+        actual = informe(json.load(f)['resultados'])
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            anteriores = analizar(json.load(f)['resultados'])
+        empeorados = comparar_exponentes(anteriores, actual['ajustes'], args.margen)
+        imprimir_empeorados(empeorados)
+        if empeorados:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
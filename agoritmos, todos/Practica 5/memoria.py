@@ -0,0 +1,67 @@
+import sys
+import tracemalloc
+
+# Instrumentación de memoria para los algoritmos de ordenamiento (opcional:
+# son dos corridas aparte de las que se cronometran, y la de asignaciones es
+# varias veces más lenta).
+#
+#   pico_bytes        memoria máxima en uso durante el ordenamiento, sin contar
+#                     la lista de entrada (tracemalloc, en una corrida sin
+#                     sys.settrace)
+#   asignaciones      cuántas veces creció la memoria en uso entre una línea y
+#                     la siguiente del algoritmo (sys.settrace + tracemalloc).
+#                     Es aproximado: varias asignaciones en la misma línea
+#                     cuentan como una, y también cuentan los int que crea
+#                     Python para los contadores pasado 256.
+#   bytes_asignados   suma de esos crecimientos
+
+# Pico de memoria de una corrida sin el gancho de sys.settrace: el gancho
+# asigna por su cuenta (frames, ints de los contadores, las tuplas de
+# get_traced_memory) y esos bytes se sumarían al pico del algoritmo
+def medir_pico(funcion, arr):
+    tracemalloc.start()
+    try:
+        funcion(arr)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def medir_asignaciones(funcion, arr):
+    leer = tracemalloc.get_traced_memory
+    archivo = funcion.__code__.co_filename
+    previo = 0
+    asignaciones = 0
+    bytes_asignados = 0
+
+    def en_linea(frame, evento, arg):
+        nonlocal previo, asignaciones, bytes_asignados
+        actual = leer()[0]
+        if actual > previo:
+            asignaciones += 1
+            bytes_asignados += actual - previo
+        previo = actual
+        return en_linea
+
+    # Solo se siguen las funciones del archivo del algoritmo (incluye las anidadas)
+    def en_llamada(frame, evento, arg):
+        return en_linea if frame.f_code.co_filename == archivo else None
+
+    tracemalloc.start()
+    try:
+        previo = leer()[0]
+        sys.settrace(en_llamada)
+        try:
+            funcion(arr)
+        finally:
+            sys.settrace(None)
+    finally:
+        tracemalloc.stop()
+    return {'asignaciones': asignaciones, 'bytes_asignados': bytes_asignados}
+
+# El pico y las asignaciones salen de corridas separadas, cada una sobre su
+# propia copia de arr (la copia se hace antes de empezar a medir)
+def medir_memoria(funcion, arr, contar_asignaciones=True):
+    resultado = {'pico_bytes': medir_pico(funcion, list(arr))}
+    if contar_asignaciones:
+        resultado.update(medir_asignaciones(funcion, list(arr)))
+    return resultado
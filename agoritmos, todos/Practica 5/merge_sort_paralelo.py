@@ -0,0 +1,209 @@
+import argparse
+import os
+import random
+import time
+from array import array
+from contextlib import contextmanager
+from multiprocessing import get_context, shared_memory
+
+from ordenamiento import merge_sort
+
+# Merge sort en paralelo para arreglos grandes de enteros (int64).
+#
+# Los datos viven en dos bloques de multiprocessing.shared_memory; a los
+# procesos solo se les pasa el nombre de los bloques y los índices, nunca la
+# lista. Dos fases:
+#
+#   1. Cada trabajador ordena su trozo (n / p elementos) con merge_sort de
+#      ordenamiento.py y lo deja en el mismo bloque.
+#   2. Mezcla por pares, como los niveles de arriba del merge sort: en cada
+#      ronda los trozos vecinos se mezclan de a dos (cada par en un proceso)
+#      hacia el otro bloque, hasta que queda uno solo. Son log2(p) rondas y
+#      en cada una trabaja la mitad de procesos que en la anterior; la
+#      última mezcla los n elementos en un solo proceso.
+#
+#   python merge_sort_paralelo.py --tamanos 100000 1000000 --trabajadores 1 2 4 8
+#
+# Cuándo conviene: solo con varios núcleos de verdad. Con un solo CPU los
+# procesos se turnan y el costo de crearlos y copiar trozos hace que sea más
+# lento que merge_sort solo (~0.9x). Con p núcleos la fase 1 escala casi p
+# veces, pero la última mezcla es secuencial, así que la aceleración total
+# queda bastante por debajo de p. Por debajo de MINIMO_PARALELO elementos, o
+# con un solo trabajador, merge_sort_paralelo() ordena sin procesos.
+
+TIPO = 'q'      # int64
+BYTES = 8
+BLOQUE_ESCRITURA = 1 << 16  # elementos por tanda al llenar el bloque de prueba
+MINIMO_PARALELO = 50_000
+
+# Vista int64 del bloque; usarla con 'with' para soltarla aunque algo falle
+# (close() no se puede hacer mientras haya vistas abiertas)
+def vista(bloque):
+    return bloque.buf.cast(TIPO)
+
+def cerrar(bloque, borrar=False):
+    try:
+        bloque.close()
+    except BufferError:
+        pass  # alguna vista sigue viva (p. ej. en un traceback); igual se borra abajo
+    finally:
+        if borrar:
+            try:
+                bloque.unlink()
+            except FileNotFoundError:
+                pass
+
+# Crea 'cantidad' bloques de n enteros y los borra al salir, haya error o no
+@contextmanager
+def bloques_compartidos(cantidad, n):
+    bloques = []
+    try:
+        for _ in range(cantidad):
+            bloques.append(shared_memory.SharedMemory(create=True, size=max(1, n) * BYTES))
+        yield bloques
+    finally:
+        for bloque in bloques:
+            cerrar(bloque, borrar=True)
+
+def ordenar_trozo(nombre, inicio, fin):
+    bloque = shared_memory.SharedMemory(name=nombre)
+    try:
+        with vista(bloque) as datos:
+            trozo = datos[inicio:fin].tolist()
+            merge_sort(trozo)
+            datos[inicio:fin] = array(TIPO, trozo)
+    finally:
+        cerrar(bloque)
+
+# Mezcla de dos listas ordenadas, igual que la de merge_sort
+def mezclar(izquierda, derecha):
+    resultado = []
+    agregar = resultado.append
+    i = j = 0
+    while i < len(izquierda) and j < len(derecha):
+        if izquierda[i] <= derecha[j]:
+            agregar(izquierda[i])
+            i += 1
+        else:
+            agregar(derecha[j])
+            j += 1
+    resultado.extend(izquierda[i:])
+    resultado.extend(derecha[j:])
+    return resultado
+
+# Mezcla los trozos ordenados [inicio, medio) y [medio, fin) del bloque
+# 'nombre_origen' y deja el resultado en el mismo rango de 'nombre_destino'
+def mezclar_par(nombre_origen, nombre_destino, inicio, medio, fin):
+    origen = shared_memory.SharedMemory(name=nombre_origen)
+    try:
+        destino = shared_memory.SharedMemory(name=nombre_destino)
+        try:
+            with vista(origen) as datos, vista(destino) as resultado:
+                resultado[inicio:fin] = array(TIPO, mezclar(datos[inicio:medio].tolist(),
+                                                            datos[medio:fin].tolist()))
+        finally:
+            cerrar(destino)
+    finally:
+        cerrar(origen)
+
+def limites_trozos(n, p):
+    return [(i * n // p, (i + 1) * n // p) for i in range(p)]
+
+# Ordena el bloque 'nombre_entrada' (n enteros) dejando el resultado en
+# 'nombre_salida'; la entrada queda como espacio de trabajo. Devuelve los
+# segundos de cada fase.
+def ordenar_compartido(nombre_entrada, nombre_salida, n, trabajadores, pool):
+    trozos = limites_trozos(n, trabajadores)
+    inicio = time.perf_counter()
+    pool.starmap(ordenar_trozo, [(nombre_entrada, a, b) for a, b in trozos])
+    fase_ordenar = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    origen, destino = nombre_entrada, nombre_salida
+    # Cada ronda va de un bloque al otro. Un trozo sin pareja se "mezcla" con
+    # uno vacío para pasarlo de bloque; si el último queda en la entrada se
+    # hace una ronda más que solo lo copia a la salida.
+    while len(trozos) > 1 or origen != nombre_salida:
+        tareas = []
+        siguientes = []
+        for k in range(0, len(trozos), 2):
+            a, medio = trozos[k]
+            fin = trozos[k + 1][1] if k + 1 < len(trozos) else medio
+            tareas.append((origen, destino, a, medio, fin))
+            siguientes.append((a, fin))
+        pool.starmap(mezclar_par, tareas)
+        trozos = siguientes
+        origen, destino = destino, origen
+    fase_mezclar = time.perf_counter() - inicio
+    return fase_ordenar, fase_mezclar
+
+# Interfaz simple: recibe una secuencia de enteros y devuelve un array('q') ordenado
+def merge_sort_paralelo(valores, trabajadores=None):
+    trabajadores = trabajadores or os.cpu_count()
+    n = len(valores)
+    if n == 0:
+        return array(TIPO)
+    valores = array(TIPO, valores)  # falla acá (OverflowError...) antes de crear nada
+    if trabajadores == 1 or n < MINIMO_PARALELO:
+        # Los procesos no compensan lo que cuestan: merge_sort directo
+        lista = valores.tolist()
+        merge_sort(lista)
+        return array(TIPO, lista)
+    with bloques_compartidos(2, n) as (entrada, salida):
+        with vista(entrada) as datos:
+            datos[:] = valores
+        with get_context().Pool(trabajadores) as pool:
+            ordenar_compartido(entrada.name, salida.name, n, trabajadores, pool)
+        with vista(salida) as resultado:
+            return array(TIPO, resultado)
+
+def llenar_aleatorio(datos, n, semilla):
+    rnd = random.Random(semilla)
+    for inicio in range(0, n, BLOQUE_ESCRITURA):
+        fin = min(n, inicio + BLOQUE_ESCRITURA)
+        datos[inicio:fin] = array(TIPO, (rnd.getrandbits(62) for _ in range(fin - inicio)))
+
+def esta_ordenado(datos):
+    return all(datos[i] <= datos[i + 1] for i in range(len(datos) - 1))
+
+def escalamiento(tamanos, lista_trabajadores, semilla=0, verificar=True):
+    print(f"{'n':>11} | {'procesos':>8} | {'ordenar (s)':>11} | {'mezclar (s)':>11} | "
+          f"{'total (s)':>9} | {'aceleración':>11} | {'eficiencia':>10}")
+    for n in tamanos:
+        with bloques_compartidos(3, n) as (original, entrada, salida):
+            with vista(original) as datos_original:
+                llenar_aleatorio(datos_original, n, semilla)
+            base = None  # tiempo con 1 proceso
+            for p in lista_trabajadores:
+                with vista(original) as datos_original, vista(entrada) as datos_entrada:
+                    datos_entrada[:] = datos_original  # misma entrada para cada p
+                # El pool se crea fuera de la medición: se mide el ordenamiento
+                with get_context().Pool(p) as pool:
+                    fase_ordenar, fase_mezclar = ordenar_compartido(entrada.name, salida.name, n, p, pool)
+                total = fase_ordenar + fase_mezclar
+                if base is None:
+                    base = total
+                aceleracion = base / total
+                estado = ""
+                if verificar:
+                    with vista(salida) as resultado:
+                        estado = "" if esta_ordenado(resultado) else "  ¡NO ORDENADO!"
+                print(f"{n:>11} | {p:>8} | {fase_ordenar:>11.2f} | {fase_mezclar:>11.2f} | "
+                      f"{total:>9.2f} | {aceleracion:>10.2f}x | {aceleracion / p:>10.0%}{estado}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Escalamiento del merge sort en paralelo")
+    parser.add_argument("--tamanos", type=int, nargs='+', default=[100_000, 1_000_000],
+                        help="cantidad de enteros (merge_sort es Python puro: 10^7 tarda minutos)")
+    parser.add_argument("--trabajadores", type=int, nargs='+', default=[1, 2, 4, 8],
+                        help="cantidades de procesos a probar (siempre se agrega 1, la base)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sin-verificar", action="store_true",
+                        help="no revisar que la salida quede ordenada")
+    args = parser.parse_args()
+    print(f"CPU disponibles: {os.cpu_count()}")
+    trabajadores = sorted(set(args.trabajadores) | {1})
+    escalamiento(args.tamanos, trabajadores, args.semilla, not args.sin_verificar)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 import random
+import sys
 import time
 
+from memoria import medir_memoria
+
 SIZE = 1000
+INSERTION_CUTOFF = 10
+NINTHER_CUTOFF = 40
 
 def bubble_sort(arr):
     comparisons = 0
@@ -97,53 +102,187 @@ def quick_sort(arr):
     sorted_arr = quick_sort_helper(arr.copy())
     return comparisons[0], swaps[0]
 
-def generate_random_list():
-    return [random.randint(0, 9999) for _ in range(SIZE)]
+# (índice del valor del medio entre arr[a], arr[b] y arr[c], comparaciones hechas)
+def median_of_three(arr, a, b, c):
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b, 2
+        return (c if arr[a] < arr[c] else a), 3
+    if arr[a] < arr[c]:
+        return a, 2
+    return (c if arr[b] < arr[c] else b), 3
+
+# Quick sort en su lugar, sin recursión y sin listas nuevas: partición en tres
+# (< pivote, == pivote, > pivote), pivote mediana de tres e insertion sort
+# para los tramos de INSERTION_CUTOFF elementos o menos.
+# No es más rápido que quick_sort: en CPython las comprensiones de lista de
+# quick_sort corren en C y a n = 100000 este tarda entre 10% y 40% más según
+# el caso. Lo que gana es memoria: el pico es de ~1 KB (la pila de tramos)
+# contra varios MB de las listas nuevas de quick_sort (ver
+# python ordenamiento.py --quick).
+def quick_sort_3way(arr):
+    comparisons = 0
+    swaps = 0
+    stack = [(0, len(arr) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < INSERTION_CUTOFF:
+            for i in range(lo + 1, hi + 1):
+                key = arr[i]
+                j = i - 1
+                while j >= lo:
+                    comparisons += 1
+                    if arr[j] > key:
+                        arr[j+1] = arr[j]
+                        swaps += 1
+                        j -= 1
+                    else:
+                        break
+                arr[j+1] = key
+                if j+1 != i:
+                    swaps += 1
+            continue
 
-def generate_sorted_list():
-    return list(range(SIZE))
+        # Pivote: mediana de tres (o de nueve, "ninther", en tramos grandes).
+        # Solo se elige el índice, sin reordenar la muestra: dejar el mínimo en
+        # mid hacía que la partición armara malas muestras en cada nivel y el
+        # arreglo ordenado o invertido costaba ~n^1.5 comparaciones
+        mid = (lo + hi) // 2
+        if hi - lo > NINTHER_CUTOFF:
+            step = (hi - lo) // 8
+            p, c1 = median_of_three(arr, lo, lo + step, lo + 2 * step)
+            q, c2 = median_of_three(arr, mid - step, mid, mid + step)
+            r, c3 = median_of_three(arr, hi - 2 * step, hi - step, hi)
+            p, c4 = median_of_three(arr, p, q, r)
+            comparisons += c1 + c2 + c3 + c4
+        else:
+            p, c = median_of_three(arr, lo, mid, hi)
+            comparisons += c
+        arr[lo], arr[p] = arr[p], arr[lo]
+        swaps += 1
+        pivot = arr[lo]
+
+        # arr[lo:lt] < pivote, arr[lt:i] == pivote, arr[gt+1:hi+1] > pivote
+        lt, i, gt = lo, lo + 1, hi
+        while i <= gt:
+            x = arr[i]
+            comparisons += 1
+            if x < pivot:
+                arr[i] = arr[lt]
+                arr[lt] = x
+                swaps += 1
+                lt += 1
+                i += 1
+            else:
+                comparisons += 1
+                if x > pivot:
+                    arr[i] = arr[gt]
+                    arr[gt] = x
+                    swaps += 1
+                    gt -= 1
+                else:
+                    i += 1
+
+        # El tramo más chico se procesa primero: la pila no pasa de O(log n)
+        if lt - lo < hi - gt:
+            stack.append((gt + 1, hi))
+            stack.append((lo, lt - 1))
+        else:
+            stack.append((lo, lt - 1))
+            stack.append((gt + 1, hi))
+    return comparisons, swaps
 
-def generate_reverse_list():
-    return list(range(SIZE-1, -1, -1))
+# Con 'rnd' (un random.Random con semilla) la lista sale siempre igual
+def generate_random_list(size=SIZE, rnd=random):
+    return [rnd.randint(0, 9999) for _ in range(size)]
 
-def measure_time(sort_func, arr_generator, sort_name, array_type):
+def generate_sorted_list(size=SIZE, rnd=None):
+    return list(range(size))
+
+def generate_reverse_list(size=SIZE, rnd=None):
+    return list(range(size-1, -1, -1))
+
+# Ordenada salvo un 2% de pares intercambiados al azar
+def generate_nearly_sorted_list(size=SIZE, rnd=random):
+    arr = list(range(size))
+    for _ in range(size // 50):
+        i, j = rnd.randrange(size), rnd.randrange(size)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+# Muchos repetidos: solo 10 valores distintos
+def generate_few_unique_list(size=SIZE, rnd=random):
+    return [rnd.randint(0, 9) for _ in range(size)]
+
+TEST_CASES = [
+    ("aleatoria", generate_random_list),
+    ("ordenada", generate_sorted_list),
+    ("casi_ord", generate_nearly_sorted_list),
+    ("inversa", generate_reverse_list)
+]
+
+ALGORITHMS = [
+    ("Bubble Sort", bubble_sort),
+    ("Insertion Sort", insertion_sort),
+    ("Merge Sort", merge_sort),
+    ("Quick Sort", quick_sort),
+    ("Quick 3 vías", quick_sort_3way)
+]
+
+# Con memory=True se hace además una corrida instrumentada (ver memoria.py)
+def measure_time(sort_func, arr_generator, sort_name, array_type, memory=False):
     arr = arr_generator()
-    
-    if sort_func.__name__ == 'quick_sort':
-        start = time.perf_counter()
-        comparisons, swaps = sort_func(arr.copy())
-        end = time.perf_counter()
-    else:
-        arr_copy = arr.copy()
-        start = time.perf_counter()
-        comparisons, swaps = sort_func(arr_copy)
-        end = time.perf_counter()
+    arr_copy = arr.copy()
+    start = time.perf_counter()
+    comparisons, swaps = sort_func(arr_copy)
+    end = time.perf_counter()
     
     elapsed = (end - start) * 1000
-    print(f"{sort_name:>14} {array_type:>9}: {elapsed:>10.2f} ms | Comparaciones: {comparisons:>8} | Intercambios: {swaps:>7}")
+    line = f"{sort_name:>14} {array_type:>9}: {elapsed:>10.2f} ms | Comparaciones: {comparisons:>8} | Intercambios: {swaps:>7}"
+    if memory:
+        mem = medir_memoria(sort_func, arr)
+        line += f" | Pico: {mem['pico_bytes'] / 1024:>8.1f} KB | Asignaciones: {mem['asignaciones']:>7}"
+    print(line)
+
+# Bytes de memoria en el pico mientras ordena (sin contar la lista de entrada)
+def measure_peak_memory(sort_func, arr):
+    return medir_memoria(sort_func, arr, contar_asignaciones=False)['pico_bytes']
+
+# quick_sort (listas nuevas en cada nivel) contra quick_sort_3way (en su lugar)
+def compare_quick_sorts(sizes=(1000, 10000, 100000), repeats=3):
+    print(f"\n=== QUICK SORT: LISTAS NUEVAS vs EN SU LUGAR (mejor de {repeats}) ===")
+    cases = [("aleatoria", generate_random_list), ("repetidos", generate_few_unique_list),
+             ("ordenada", generate_sorted_list), ("inversa", generate_reverse_list)]
+    for size in sizes:
+        for array_type, generator in cases:
+            arr = generator(size, random.Random(size))
+            for name, sort_func in (("Quick Sort", quick_sort), ("Quick 3 vías", quick_sort_3way)):
+                best = float('inf')
+                for _ in range(repeats):
+                    arr_copy = arr.copy()
+                    start = time.perf_counter()
+                    sort_func(arr_copy)
+                    best = min(best, time.perf_counter() - start)
+                peak = measure_peak_memory(sort_func, arr.copy())
+                print(f"{name:>14} {array_type:>9} {size:>7}: {best * 1000:>10.2f} ms | "
+                      f"Memoria pico: {peak / 1024:>10.1f} KB")
 
+# python ordenamiento.py --memoria agrega memoria pico y asignaciones a la tabla
+# python ordenamiento.py --quick agrega la comparación de quick sorts hasta n = 100000
 def main():
+    memory = '--memoria' in sys.argv
     print("\n" + "="*90)
     print("COMPARACIÓN DE ALGORITMOS DE ORDENAMIENTO (PYTHON) - TIEMPO, COMPARACIONES E INTERCAMBIOS")
     print("="*90)
+    print("(una sola corrida por algoritmo; para medir en serio: python benchmark.py)")
     
-    test_cases = [
-        ("aleatoria", generate_random_list),
-        ("ordenada", generate_sorted_list),
-        ("inversa", generate_reverse_list)
-    ]
-    
-    algorithms = [
-        ("Bubble Sort", bubble_sort),
-        ("Insertion Sort", insertion_sort),
-        ("Merge Sort", merge_sort),
-        ("Quick Sort", quick_sort)
-    ]
-    
-    for array_type, generator in test_cases:
+    for array_type, generator in TEST_CASES:
         print(f"\n=== ARREGLO {array_type.upper()} ===")
-        for name, algorithm in algorithms:
-            measure_time(algorithm, generator, name, array_type)
+        for name, algorithm in ALGORITHMS:
+            measure_time(algorithm, generator, name, array_type, memory)
+    
+    if '--quick' in sys.argv:
+        compare_quick_sorts()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,186 @@
+import math
+import multiprocessing
+import queue
+import time
+import tkinter as tk
+
+from pasos_ordenamiento import ALGORITMOS, FIN, EstadoOrdenamiento
+from planificador_pasos import LOTES_EN_COLA, PlanificadorPasos, RelojCuadros
+from renderizador_barras import RenderizadorBarras
+try:
+    from renderizador_raster import RenderizadorRaster
+except ImportError:  # sin NumPy solo se dibujan barras
+    RenderizadorRaster = None
+
+# Modo carrera: varios algoritmos sobre copias idénticas del mismo arreglo.
+#
+# Cada algoritmo corre en su propio proceso (sin pelear por el GIL con la
+# interfaz ni entre ellos) con el mismo ritmo de pasos por segundo, y manda
+# sus pasos por lotes en una multiprocessing.Queue acotada. La ventana tiene
+# un solo tick que reparte lo recibido entre los carriles, dibuja cada uno en
+# su canvas y actualiza la tabla de posiciones.
+
+ANCHO_CARRIL = 320
+ALTO_CARRIL = 150
+COLUMNAS_MAXIMAS = 3
+
+# Se ejecuta en el proceso hijo (tiene que ser una función del módulo)
+def correr_carril(nombre, arreglo, cola, ritmo, evento_detener):
+    planificador = PlanificadorPasos(ALGORITMOS[nombre](arreglo), ritmo,
+                                     cola=cola, evento_detener=evento_detener)
+    planificador.producir()
+
+class Carril:
+    def __init__(self, padre, contexto, nombre, arreglo, ritmo, colores):
+        self.nombre = nombre
+        self.colores = colores
+        self.estado = EstadoOrdenamiento(list(arreglo))
+        self.terminado_en = None  # segundos desde la largada
+        self.completado = False
+        self.dibujado = False
+
+        self.frame = tk.Frame(padre, bg='#34495e', bd=1, relief=tk.RAISED)
+        tk.Label(self.frame, text=nombre, bg='#34495e', fg='white',
+                 font=('Arial', 10, 'bold')).pack(anchor='w', padx=5)
+        self.canvas = tk.Canvas(self.frame, width=ANCHO_CARRIL, height=ALTO_CARRIL,
+                                bg='#ecf0f1', highlightthickness=0)
+        self.canvas.pack(padx=5, pady=(0, 5))
+        if RenderizadorRaster is not None and len(arreglo) > ANCHO_CARRIL:
+            self.renderizador = RenderizadorRaster(self.canvas)
+        else:
+            self.renderizador = RenderizadorBarras(self.canvas, max_etiquetas=0)
+
+        self.cola = contexto.Queue(maxsize=LOTES_EN_COLA)
+        self.evento_detener = contexto.Event()
+        self.proceso = contexto.Process(target=correr_carril, daemon=True,
+                                        args=(nombre, list(arreglo), self.cola, ritmo, self.evento_detener))
+
+    def tomar(self):
+        pasos = []
+        while True:
+            try:
+                pasos.extend(self.cola.get_nowait())
+            except queue.Empty:
+                return pasos
+
+    # Aplica lo recibido; devuelve la cantidad de pasos aplicados
+    def avanzar(self, transcurrido):
+        aplicados = 0
+        aplicar = self.estado.aplicar
+        for paso in self.tomar():
+            if paso[0] == FIN:
+                self.terminado_en = transcurrido
+                self.completado = paso[1]
+                if self.completado:
+                    self.estado.terminar()
+                break
+            aplicar(paso)
+            aplicados += 1
+
+        if not self.dibujado:
+            # El canvas recién tiene tamaño después del primer dibujo de Tk
+            self.dibujado = self.renderizador.dibujar(self.estado, self.colores)
+            self.estado.tomar_cambios()
+        elif aplicados or self.terminado_en is not None:
+            self.renderizador.dibujar(self.estado, self.colores, self.estado.tomar_cambios())
+        return aplicados
+
+    def detener(self):
+        self.evento_detener.set()
+        self.proceso.join(timeout=0.5)
+        if self.proceso.is_alive():
+            self.proceso.terminate()
+
+class VentanaCarrera:
+    def __init__(self, root, arreglo, ritmo, fps, colores):
+        self.arreglo = arreglo
+        self.ritmo = ritmo
+        self.fps = fps
+        self.colores = colores
+        self.carriles = []
+        self.reloj = None
+        self.largada = 0
+        self.contexto = multiprocessing.get_context()
+
+        self.ventana = tk.Toplevel(root)
+        self.ventana.title(f"Carrera de algoritmos ({len(arreglo)} elementos)")
+        self.ventana.configure(bg='#2c3e50')
+        self.ventana.protocol("WM_DELETE_WINDOW", self.cerrar)
+
+        # Elección de algoritmos
+        opciones = tk.Frame(self.ventana, bg='#34495e')
+        opciones.pack(fill=tk.X, padx=10, pady=10)
+        self.seleccion = {}
+        for nombre in ALGORITMOS:
+            var = tk.BooleanVar(value=True)
+            tk.Checkbutton(opciones, text=nombre, variable=var, bg='#34495e', fg='white',
+                           selectcolor='#2c3e50').pack(side=tk.LEFT, padx=5)
+            self.seleccion[nombre] = var
+        self.start_button = tk.Button(opciones, text="🏁 Largar", command=self.largar,
+                                      bg='#27ae60', fg='white', font=('Arial', 10, 'bold'),
+                                      relief=tk.FLAT, padx=20)
+        self.start_button.pack(side=tk.RIGHT, padx=5)
+
+        self.grilla = tk.Frame(self.ventana, bg='#2c3e50')
+        self.grilla.pack(padx=10)
+
+        self.tabla = tk.Label(self.ventana, text="", bg='#2c3e50', fg='#ecf0f1',
+                              font=('Courier', 10), justify=tk.LEFT, anchor='w')
+        self.tabla.pack(fill=tk.X, padx=10, pady=10)
+
+    def largar(self):
+        nombres = [nombre for nombre, var in self.seleccion.items() if var.get()]
+        if not nombres or self.carriles:
+            return
+        self.start_button.config(state=tk.DISABLED)
+
+        columnas = min(COLUMNAS_MAXIMAS, math.ceil(math.sqrt(len(nombres))))
+        for i, nombre in enumerate(nombres):
+            carril = Carril(self.grilla, self.contexto, nombre, self.arreglo, self.ritmo, self.colores)
+            carril.frame.grid(row=i // columnas, column=i % columnas, padx=5, pady=5)
+            self.carriles.append(carril)
+
+        self.largada = time.perf_counter()
+        for carril in self.carriles:
+            carril.proceso.start()
+        self.reloj = RelojCuadros(self.fps)
+        self.ventana.after(round(1000 / self.fps), self.cuadro)
+
+    def cuadro(self):
+        if not self.carriles:
+            return
+        transcurrido = time.perf_counter() - self.largada
+        aplicados = 0
+        for carril in self.carriles:
+            if carril.terminado_en is None:
+                aplicados += carril.avanzar(transcurrido)
+        self.reloj.contar(aplicados)
+        self.actualizar_tabla(transcurrido)
+
+        if all(carril.terminado_en is not None for carril in self.carriles):
+            for carril in self.carriles:
+                carril.proceso.join(timeout=0.5)
+            return
+        self.ventana.after(self.reloj.siguiente(), self.cuadro)
+
+    def actualizar_tabla(self, transcurrido):
+        # Primero los que terminaron, por tiempo; después los que siguen corriendo
+        posiciones = sorted(self.carriles, key=lambda c: (c.terminado_en is None, c.terminado_en or 0))
+        lineas = [f"{'#':>2}  {'Algoritmo':<15} {'Comparaciones':>14} {'Intercambios':>13} "
+                  f"{'Tiempo':>9}  Estado"]
+        for puesto, carril in enumerate(posiciones, 1):
+            if carril.terminado_en is None:
+                tiempo, estado = transcurrido, "corriendo"
+            else:
+                tiempo, estado = carril.terminado_en, "terminó" if carril.completado else "error"
+            lineas.append(f"{puesto:>2}  {carril.nombre:<15} {carril.estado.comparaciones:>14} "
+                          f"{carril.estado.intercambios:>13} {tiempo:>8.2f}s  {estado}")
+        lineas.append(f"Pasos/s en pantalla: {self.reloj.pasos_por_segundo:.0f} | "
+                      f"Cuadros saltados: {self.reloj.saltados}")
+        self.tabla.config(text="\n".join(lineas))
+
+    def cerrar(self):
+        carriles, self.carriles = self.carriles, []
+        for carril in carriles:
+            carril.detener()
+        self.ventana.destroy()
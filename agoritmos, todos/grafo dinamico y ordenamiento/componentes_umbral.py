@@ -0,0 +1,106 @@
+from array import array
+from typing import List, Tuple
+
+# Componentes conexas de la red social para cada umbral de peso, sin DFS.
+#
+# Con umbral u, dos usuarios están en la misma componente si hay un camino de
+# aristas con peso >= u. Al bajar el umbral solo se AGREGAN aristas, así que
+# basta con ordenar las aristas por peso de mayor a menor una sola vez, ir
+# uniéndolas en un union-find y sacar una "foto" de las componentes cada vez
+# que el peso baja de un umbral al siguiente. Después, consultar cualquier
+# umbral es devolver la foto ya calculada.
+
+class UnionFind:
+    def __init__(self, n: int):
+        self.padre = array('i', range(n))
+        self.tamano = array('i', [1]) * n
+
+    def encontrar(self, x: int) -> int:
+        # Iterativo, con compresión por mitades (sin recursión)
+        padre = self.padre
+        while padre[x] != x:
+            padre[x] = padre[padre[x]]
+            x = padre[x]
+        return x
+
+    def unir(self, a: int, b: int) -> bool:
+        ra, rb = self.encontrar(a), self.encontrar(b)
+        if ra == rb:
+            return False
+        if self.tamano[ra] < self.tamano[rb]:
+            ra, rb = rb, ra
+        self.padre[rb] = ra
+        self.tamano[ra] += self.tamano[rb]
+        return True
+
+class ComponentesPorUmbral:
+    def __init__(self, n: int, aristas: List[Tuple[int, int, int]],
+                 umbral_min: int = 1, umbral_max: int = 10):
+        self.n = n
+        self.umbral_min = umbral_min
+        self.umbral_max = umbral_max
+        self.fotos = {}
+        self.cantidades = {}
+
+        ordenadas = sorted(aristas, key=lambda a: a[2], reverse=True)
+        conjuntos = UnionFind(n)
+        k = 0
+        for umbral in range(umbral_max, umbral_min - 1, -1):
+            while k < len(ordenadas) and ordenadas[k][2] >= umbral:
+                u, v, _ = ordenadas[k]
+                conjuntos.unir(u, v)
+                k += 1
+            self.fotos[umbral], self.cantidades[umbral] = self.etiquetar(conjuntos)
+
+    def etiquetar(self, conjuntos: UnionFind):
+        # Ids 0, 1, 2... en orden del primer usuario de cada componente,
+        # igual que los asignaba detectar_componentes_por_peso con el DFS
+        etiquetas = array('i', [-1]) * self.n
+        id_de_raiz = {}
+        for i in range(self.n):
+            raiz = conjuntos.encontrar(i)
+            if raiz not in id_de_raiz:
+                id_de_raiz[raiz] = len(id_de_raiz)
+            etiquetas[i] = id_de_raiz[raiz]
+        return etiquetas, len(id_de_raiz)
+
+    def acotar(self, umbral: int) -> int:
+        return max(self.umbral_min, min(self.umbral_max, umbral))
+
+    def componentes(self, umbral: int) -> array:
+        return self.fotos[self.acotar(umbral)]
+
+    def cantidad(self, umbral: int) -> int:
+        return self.cantidades[self.acotar(umbral)]
+
+def aristas_desde_matriz(matriz_adyacencia: List[List[int]],
+                         matriz_pesos: List[List[int]]) -> List[Tuple[int, int, int]]:
+    aristas = []
+    n = len(matriz_adyacencia)
+    for i in range(n):
+        fila_adyacencia = matriz_adyacencia[i]
+        fila_pesos = matriz_pesos[i]
+        for j in range(i + 1, n):
+            if fila_adyacencia[j] == 1:
+                aristas.append((i, j, fila_pesos[j]))
+    return aristas
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Prueba de escala: 100k usuarios con ~3 conexiones cada uno
+    n = 100_000
+    rnd = random.Random(0)
+    aristas = [(rnd.randrange(n), rnd.randrange(n), rnd.randint(1, 10)) for _ in range(3 * n)]
+
+    inicio = time.perf_counter()
+    motor = ComponentesPorUmbral(n, aristas)
+    print(f"Preproceso de {n} usuarios y {len(aristas)} aristas: {time.perf_counter() - inicio:.2f} s")
+
+    inicio = time.perf_counter()
+    for umbral in range(1, 11):
+        motor.componentes(umbral)
+    print(f"10 consultas de umbral: {(time.perf_counter() - inicio) * 1e6:.1f} µs en total")
+    for umbral in range(1, 11):
+        print(f"  umbral {umbral:>2}: {motor.cantidad(umbral)} componentes")
@@ -4,6 +4,8 @@ import heapq
 import random
 from collections import defaultdict
 import math
+import sys
+import time
 
 class Nodo:
     def __init__(self, nombre, x, y):
@@ -17,6 +19,60 @@ class Arista:
         self.hasta = hasta
         self.peso = peso
 
+# Versión original: en cada extracción de la cola recorre todas las aristas
+# buscando las que salen del nodo actual -> O(V·E). Se conserva para comparar.
+def dijkstra_por_aristas(nodos, aristas, inicio):
+    distancias = {nodo: float('inf') for nodo in nodos.values()}
+    padres = {}
+    distancias[inicio] = 0
+    padres[inicio] = None
+    
+    cola = [(0, 0, inicio)]
+    contador = 1  # desempate: los Nodo no se pueden comparar entre sí
+    
+    while cola:
+        dist_actual, _, nodo_actual = heapq.heappop(cola)
+        
+        if dist_actual > distancias[nodo_actual]:
+            continue
+        
+        for arista in aristas:
+            if arista.desde == nodo_actual:
+                nueva_dist = dist_actual + arista.peso
+                if nueva_dist < distancias[arista.hasta]:
+                    distancias[arista.hasta] = nueva_dist
+                    padres[arista.hasta] = nodo_actual
+                    heapq.heappush(cola, (nueva_dist, contador, arista.hasta))
+                    contador += 1
+    
+    return distancias, padres
+
+# Usa el índice de aristas salientes de cada nodo -> O((V + E) log V)
+def dijkstra_por_adyacencia(nodos, adyacencia, inicio):
+    distancias = {nodo: float('inf') for nodo in nodos.values()}
+    padres = {}
+    distancias[inicio] = 0
+    padres[inicio] = None
+    
+    cola = [(0, 0, inicio)]
+    contador = 1  # desempate: los Nodo no se pueden comparar entre sí
+    
+    while cola:
+        dist_actual, _, nodo_actual = heapq.heappop(cola)
+        
+        if dist_actual > distancias[nodo_actual]:
+            continue
+        
+        for arista in adyacencia[nodo_actual.nombre]:
+            nueva_dist = dist_actual + arista.peso
+            if nueva_dist < distancias[arista.hasta]:
+                distancias[arista.hasta] = nueva_dist
+                padres[arista.hasta] = nodo_actual
+                heapq.heappush(cola, (nueva_dist, contador, arista.hasta))
+                contador += 1
+    
+    return distancias, padres
+
 class GrafoDinamico:
     def __init__(self, root):
         self.root = root
@@ -25,6 +81,7 @@ class GrafoDinamico:
         
         self.nodos = {}
         self.aristas = []
+        self.adyacencia = defaultdict(list)  # nombre del nodo -> aristas que salen de él
         self.ruta_corta = []
         
         self.setup_ui()
@@ -76,6 +133,7 @@ class GrafoDinamico:
     def cargar_grafo_desde_texto(self):
         self.nodos.clear()
         self.aristas.clear()
+        self.adyacencia.clear()
         self.ruta_corta.clear()
         
         lineas = self.entrada_text.get('1.0', tk.END).strip().split('\n')
@@ -93,8 +151,12 @@ class GrafoDinamico:
                         self.nodos[n2] = Nodo(n2, random.randint(100, 500), random.randint(100, 250))
                     
                     # Crear aristas bidireccionales
-                    self.aristas.append(Arista(self.nodos[n1], self.nodos[n2], peso))
-                    self.aristas.append(Arista(self.nodos[n2], self.nodos[n1], peso))
+                    ida = Arista(self.nodos[n1], self.nodos[n2], peso)
+                    vuelta = Arista(self.nodos[n2], self.nodos[n1], peso)
+                    self.aristas.append(ida)
+                    self.aristas.append(vuelta)
+                    self.adyacencia[n1].append(ida)
+                    self.adyacencia[n2].append(vuelta)
                     
                 except ValueError:
                     continue
@@ -102,28 +164,7 @@ class GrafoDinamico:
         self.dibujar_grafo()
     
     def dijkstra(self, inicio):
-        distancias = {nodo: float('inf') for nodo in self.nodos.values()}
-        padres = {}
-        distancias[inicio] = 0
-        padres[inicio] = None
-        
-        cola = [(0, inicio)]
-        
-        while cola:
-            dist_actual, nodo_actual = heapq.heappop(cola)
-            
-            if dist_actual > distancias[nodo_actual]:
-                continue
-            
-            for arista in self.aristas:
-                if arista.desde == nodo_actual:
-                    nueva_dist = dist_actual + arista.peso
-                    if nueva_dist < distancias[arista.hasta]:
-                        distancias[arista.hasta] = nueva_dist
-                        padres[arista.hasta] = nodo_actual
-                        heapq.heappush(cola, (nueva_dist, arista.hasta))
-        
-        return distancias, padres
+        return dijkstra_por_adyacencia(self.nodos, self.adyacencia, inicio)
     
     def reconstruir_ruta(self, destino, padres):
         ruta = []
@@ -206,7 +247,62 @@ class GrafoDinamico:
             self.canvas.create_text(nodo.x, nodo.y, text=nodo.nombre, 
                                   fill='black', font=('Arial', 10, 'bold'))
 
+# Grafo aleatorio conexo con el mismo formato que cargar_grafo_desde_texto()
+def generar_grafo_prueba(cantidad_nodos, aristas_por_nodo=3, semilla=0):
+    rnd = random.Random(semilla)
+    nodos = {}
+    aristas = []
+    adyacencia = defaultdict(list)
+    for i in range(cantidad_nodos):
+        nodos[f"N{i}"] = Nodo(f"N{i}", 0, 0)
+    
+    def conectar(a, b, peso):
+        ida = Arista(nodos[a], nodos[b], peso)
+        vuelta = Arista(nodos[b], nodos[a], peso)
+        aristas.extend((ida, vuelta))
+        adyacencia[a].append(ida)
+        adyacencia[b].append(vuelta)
+    
+    for i in range(1, cantidad_nodos):
+        conectar(f"N{i - 1}", f"N{i}", rnd.randint(1, 20))
+    for _ in range(cantidad_nodos * (aristas_por_nodo - 1)):
+        a, b = rnd.randrange(cantidad_nodos), rnd.randrange(cantidad_nodos)
+        if a != b:
+            conectar(f"N{a}", f"N{b}", rnd.randint(1, 20))
+    return nodos, aristas, adyacencia
+
+# Duplicando el tamaño, el exponente log2(t2 / t1) se acerca a 2 con el
+# recorrido de todas las aristas y a 1 con el índice de adyacencia.
+def comparar_dijkstra(tamanos=(250, 500, 1000, 2000)):
+    print(f"{'nodos':>6} {'aristas':>8} | {'por aristas':>12} {'exp':>5} | {'por adyacencia':>14} {'exp':>5}")
+    anterior = None
+    for n in tamanos:
+        nodos, aristas, adyacencia = generar_grafo_prueba(n)
+        inicio = nodos["N0"]
+        
+        t0 = time.perf_counter()
+        dist_a, _ = dijkstra_por_aristas(nodos, aristas, inicio)
+        t1 = time.perf_counter()
+        dist_b, _ = dijkstra_por_adyacencia(nodos, adyacencia, inicio)
+        t2 = time.perf_counter()
+        
+        if dist_a != dist_b:
+            print("ADVERTENCIA: las distancias no coinciden")
+        
+        tiempos = (t1 - t0, t2 - t1)
+        if anterior is None:
+            exponentes = ("", "")
+        else:
+            factor = math.log2(n / anterior[0])
+            exponentes = tuple(f"{math.log2(t / ta) / factor:5.2f}" for t, ta in zip(tiempos, anterior[1]))
+        print(f"{n:>6} {len(aristas):>8} | {tiempos[0] * 1000:>9.1f} ms {exponentes[0]:>5} | "
+              f"{tiempos[1] * 1000:>11.1f} ms {exponentes[1]:>5}")
+        anterior = (n, tiempos)
+
 def main():
+    if "--benchmark" in sys.argv:
+        comparar_dijkstra()
+        return
     root = tk.Tk()
     app = GrafoDinamico(root)
     root.mainloop()
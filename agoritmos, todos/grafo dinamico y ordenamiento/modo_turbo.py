@@ -0,0 +1,104 @@
+import argparse
+import random
+import time
+from collections import namedtuple
+
+from pasos_ordenamiento import ALGORITMOS, BRECHA, COMPARAR, ESCRIBIR, INTERCAMBIAR
+
+# Modo turbo: corre los mismos generadores de la visualización sin interfaz,
+# sin esperas y sin dibujar, solo contando los pasos. Sirve sin pantalla,
+# desde la línea de comandos o importado:
+#
+#   from modo_turbo import ejecutar
+#   r = ejecutar("Quick Sort", arreglo)
+#   print(r.comparaciones, r.intercambios, r.segundos)
+#
+#   python modo_turbo.py --tamanos 100000 1000000 --algoritmos "Merge Sort" "Heap Sort"
+
+ResultadoTurbo = namedtuple('ResultadoTurbo', ['algoritmo', 'n', 'comparaciones', 'intercambios',
+                                               'pasos', 'segundos', 'pasos_por_segundo',
+                                               'completado', 'ordenado'])
+
+REVISAR_TIEMPO_CADA = 1 << 16  # pasos entre cada revisión del límite de tiempo
+
+def generar_arreglo(n, semilla=0, maximo=None):
+    rnd = random.Random(semilla)
+    maximo = maximo or max(10 * n, 100)
+    return [rnd.randint(1, maximo) for _ in range(n)]
+
+def esta_ordenado(arr):
+    return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
+
+# Ordena 'arr' en su lugar con el algoritmo 'nombre' (clave de ALGORITMOS).
+# Con limite_segundos se corta la ejecución al pasar ese tiempo (completado=False).
+def ejecutar(nombre, arr, limite_segundos=None):
+    generador = ALGORITMOS[nombre](arr)
+    conteos = [0] * (BRECHA + 1)  # pasos por código de operación
+
+    inicio = time.perf_counter()
+    completado = True
+    if limite_segundos is None:
+        for paso in generador:
+            conteos[paso[0]] += 1
+    else:
+        tope = inicio + limite_segundos
+        for k, paso in enumerate(generador, 1):
+            conteos[paso[0]] += 1
+            if not k % REVISAR_TIEMPO_CADA and time.perf_counter() > tope:
+                generador.close()
+                completado = False
+                break
+    segundos = time.perf_counter() - inicio
+
+    pasos = sum(conteos)
+    return ResultadoTurbo(
+        algoritmo=nombre,
+        n=len(arr),
+        comparaciones=conteos[COMPARAR],
+        # Igual que EstadoOrdenamiento: una escritura cuenta como intercambio
+        intercambios=conteos[INTERCAMBIAR] + conteos[ESCRIBIR],
+        pasos=pasos,
+        segundos=segundos,
+        pasos_por_segundo=pasos / segundos if segundos > 0 else float('inf'),
+        completado=completado,
+        ordenado=completado and esta_ordenado(arr),
+    )
+
+# Corre cada algoritmo sobre el mismo arreglo de cada tamaño
+def comparar(tamanos, algoritmos=None, semilla=0, limite_segundos=None, maximo=None):
+    resultados = []
+    for n in tamanos:
+        base = generar_arreglo(n, semilla, maximo)
+        for nombre in algoritmos or ALGORITMOS:
+            resultados.append(ejecutar(nombre, list(base), limite_segundos))
+    return resultados
+
+def imprimir_tabla(resultados):
+    print(f"{'Algoritmo':<15} | {'n':>9} | {'Comparaciones':>14} | {'Intercambios':>14} | "
+          f"{'Tiempo (s)':>10} | {'Pasos/s':>12} | Estado")
+    for r in resultados:
+        if not r.completado:
+            estado = "cortado por tiempo"
+        else:
+            estado = "ok" if r.ordenado else "¡NO ORDENADO!"
+        print(f"{r.algoritmo:<15} | {r.n:>9} | {r.comparaciones:>14} | {r.intercambios:>14} | "
+              f"{r.segundos:>10.3f} | {r.pasos_por_segundo:>12.0f} | {estado}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Algoritmos de ordenamiento sin interfaz ni esperas")
+    parser.add_argument("--tamanos", type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                        help="tamaños de arreglo a probar")
+    parser.add_argument("--algoritmos", nargs='+', choices=list(ALGORITMOS), metavar="ALGORITMO",
+                        help="algoritmos a correr (por defecto todos): " + ", ".join(ALGORITMOS))
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--maximo", type=int,
+                        help="valor máximo de los elementos (por defecto 10·n; 400 = rango de la interfaz)")
+    parser.add_argument("--limite", type=float, default=60.0,
+                        help="segundos como máximo por ejecución (0 = sin límite)")
+    args = parser.parse_args()
+
+    resultados = comparar(args.tamanos, args.algoritmos, args.semilla, args.limite or None, args.maximo)
+    imprimir_tabla(resultados)
+
+if __name__ == "__main__":
+    main()
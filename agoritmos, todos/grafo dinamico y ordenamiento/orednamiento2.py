@@ -1,10 +1,30 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
 import random
 import time
 import threading
 import winsound  # Para los sonidos (Windows)
 from datetime import datetime
+from pasos_ordenamiento import ALGORITMOS, COMPARAR, INTERCAMBIAR, ESCRIBIR, FIN, EstadoOrdenamiento
+from renderizador_barras import RenderizadorBarras
+from planificador_pasos import (FPS_DISPONIBLES, PlanificadorPasos, RelojCuadros,
+                                pasos_por_segundo, texto_velocidad)
+from traza_ordenamiento import Traza, grabar
+from carrera import VentanaCarrera
+try:
+    from renderizador_raster import RenderizadorRaster
+except ImportError:  # sin NumPy solo se dibujan barras
+    RenderizadorRaster = None
+
+TAMANO_MINIMO = 5
+TAMANO_MAXIMO = 200_000 if RenderizadorRaster else 3000
+
+# Sonido de cada tipo de paso (frecuencia, duración)
+SONIDOS = {
+    COMPARAR: (600, 20),
+    INTERCAMBIAR: (400, 50),
+    ESCRIBIR: (500, 30),
+}
 
 class SortingVisualizer:
     def __init__(self, root):
@@ -22,7 +42,14 @@ class SortingVisualizer:
         self.comparisons = 0
         self.swaps = 0
         self.start_time = 0
+        self.pausa_inicio = None  # time.time() al pausar; el reloj no corre en pausa
         self.sound_enabled = True
+        self.fps = FPS_DISPONIBLES[-1]
+        self.planificador = None
+        self.reloj = None
+        self.estado = None
+        self.traza = None
+        self.reproduciendo = False
         
         # Colores
         self.colors = {
@@ -34,9 +61,14 @@ class SortingVisualizer:
             'heap_node': '#8e44ad',
             'shell_gap': '#16a085'
         }
+        # Color de cada capa de EstadoOrdenamiento.capa(), en orden: normal,
+        # brecha, heap, ordenado, comparando, intercambiando y pivote
+        self.colores_capa = [self.colors[c] for c in ('default', 'shell_gap', 'heap_node', 'sorted',
+                                                      'comparing', 'swapping', 'pivot')]
         
         self.setup_ui()
         self.generate_array()
+        self.root.protocol("WM_DELETE_WINDOW", self.cerrar)
         
     def setup_ui(self):
         # Frame principal
@@ -55,16 +87,14 @@ class SortingVisualizer:
         tk.Label(row1, text="Algoritmo:", bg='#34495e', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
         self.algorithm_var = tk.StringVar(value=self.current_algorithm)
         algorithm_combo = ttk.Combobox(row1, textvariable=self.algorithm_var, 
-                                     values=["Bubble Sort", "Insertion Sort", "Selection Sort", 
-                                           "Quick Sort", "Merge Sort", "Heap Sort", "Shell Sort"], 
-                                     state="readonly", width=15)
+                                     values=list(ALGORITMOS), state="readonly", width=15)
         algorithm_combo.pack(side=tk.LEFT, padx=(5, 20))
         algorithm_combo.bind('<<ComboboxSelected>>', self.on_algorithm_change)
         
         # Tamaño del array
         tk.Label(row1, text="Tamaño:", bg='#34495e', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
         self.size_var = tk.IntVar(value=self.array_size)
-        size_scale = tk.Scale(row1, from_=5, to=150, orient=tk.HORIZONTAL, variable=self.size_var,
+        size_scale = tk.Scale(row1, from_=TAMANO_MINIMO, to=TAMANO_MAXIMO, orient=tk.HORIZONTAL, variable=self.size_var,
                             bg='#34495e', fg='white', highlightthickness=0, length=150,
                             command=self.on_size_change)
         size_scale.pack(side=tk.LEFT, padx=(5, 20))
@@ -74,8 +104,19 @@ class SortingVisualizer:
         self.speed_var = tk.IntVar(value=self.speed)
         speed_scale = tk.Scale(row1, from_=1, to=100, orient=tk.HORIZONTAL, variable=self.speed_var,
                              bg='#34495e', fg='white', highlightthickness=0, length=150,
-                             command=self.on_speed_change)
-        speed_scale.pack(side=tk.LEFT, padx=(5, 20))
+                             command=self.on_speed_change, showvalue=False)
+        speed_scale.pack(side=tk.LEFT, padx=(5, 5))
+        self.speed_label = tk.Label(row1, text=texto_velocidad(self.speed), bg='#34495e', fg='white',
+                                    font=('Arial', 9), width=16, anchor='w')
+        self.speed_label.pack(side=tk.LEFT, padx=(0, 20))
+        
+        # Cuadros por segundo del dibujo
+        tk.Label(row1, text="FPS:", bg='#34495e', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
+        self.fps_var = tk.StringVar(value=str(self.fps))
+        fps_combo = ttk.Combobox(row1, textvariable=self.fps_var, values=[str(f) for f in FPS_DISPONIBLES],
+                                 state="readonly", width=4)
+        fps_combo.pack(side=tk.LEFT, padx=(5, 20))
+        fps_combo.bind('<<ComboboxSelected>>', self.on_fps_change)
         
         # Checkbox para sonido
         self.sound_var = tk.BooleanVar(value=True)
@@ -94,11 +135,21 @@ class SortingVisualizer:
                                     relief=tk.FLAT, padx=20)
         self.start_button.pack(side=tk.LEFT, padx=(0, 10))
         
-        self.stop_button = tk.Button(row2, text="⏸ Pausar", command=self.stop_sorting,
+        self.stop_button = tk.Button(row2, text="⏸ Pausar", command=self.toggle_pause,
                                    bg='#e74c3c', fg='white', font=('Arial', 10, 'bold'),
                                    relief=tk.FLAT, padx=20, state=tk.DISABLED)
         self.stop_button.pack(side=tk.LEFT, padx=(0, 10))
         
+        self.step_button = tk.Button(row2, text="⏭ Paso", command=self.step_once,
+                                   bg='#e67e22', fg='white', font=('Arial', 10, 'bold'),
+                                   relief=tk.FLAT, padx=10, state=tk.DISABLED)
+        self.step_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.cancel_button = tk.Button(row2, text="⏹ Detener", command=self.stop_sorting,
+                                     bg='#c0392b', fg='white', font=('Arial', 10, 'bold'),
+                                     relief=tk.FLAT, padx=10, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=(0, 10))
+        
         self.reset_button = tk.Button(row2, text="🔄 Reset", command=self.reset_array,
                                     bg='#95a5a6', fg='white', font=('Arial', 10, 'bold'),
                                     relief=tk.FLAT, padx=20)
@@ -108,6 +159,11 @@ class SortingVisualizer:
                                        bg='#3498db', fg='white', font=('Arial', 10, 'bold'),
                                        relief=tk.FLAT, padx=20)
         self.generate_button.pack(side=tk.LEFT, padx=(0, 10))
+
+        self.race_button = tk.Button(row2, text="🏁 Carrera", command=self.abrir_carrera,
+                                   bg='#f39c12', fg='white', font=('Arial', 10, 'bold'),
+                                   relief=tk.FLAT, padx=20)
+        self.race_button.pack(side=tk.LEFT, padx=(0, 10))
         
         self.manual_button = tk.Button(row2, text="✏️ Manual", command=self.manual_input,
                                      bg='#f39c12', fg='white', font=('Arial', 10, 'bold'),
@@ -126,6 +182,34 @@ class SortingVisualizer:
                                   bg='#34495e', fg='#ecf0f1', font=('Arial', 10))
         self.stats_label.pack(anchor='e')
         
+        # Grabación y reproducción de trazas
+        trace_row = tk.Frame(control_frame, bg='#34495e')
+        trace_row.pack(fill=tk.X, padx=10, pady=5)
+        
+        self.record_button = tk.Button(trace_row, text="⏺ Grabar", command=self.grabar_traza,
+                                     bg='#c0392b', fg='white', font=('Arial', 10, 'bold'),
+                                     relief=tk.FLAT, padx=15)
+        self.record_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.open_button = tk.Button(trace_row, text="📂 Abrir traza", command=self.abrir_traza,
+                                   bg='#7f8c8d', fg='white', font=('Arial', 10, 'bold'),
+                                   relief=tk.FLAT, padx=15)
+        self.open_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.replay_button = tk.Button(trace_row, text="▶ Reproducir", command=self.reproducir_traza,
+                                     bg='#16a085', fg='white', font=('Arial', 10, 'bold'),
+                                     relief=tk.FLAT, padx=15, state=tk.DISABLED)
+        self.replay_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.trace_var = tk.IntVar(value=0)
+        self.trace_scale = tk.Scale(trace_row, from_=0, to=0, orient=tk.HORIZONTAL, variable=self.trace_var,
+                                  bg='#34495e', fg='white', highlightthickness=0, length=350,
+                                  command=self.on_trace_seek, state=tk.DISABLED)
+        self.trace_scale.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.trace_label = tk.Label(trace_row, text="Sin traza", bg='#34495e', fg='#ecf0f1', font=('Arial', 9))
+        self.trace_label.pack(side=tk.LEFT)
+        
         # Tercera fila - Leyenda de colores
         legend_frame = tk.Frame(control_frame, bg='#34495e')
         legend_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -151,6 +235,9 @@ class SortingVisualizer:
         # Canvas para la visualización
         self.canvas = tk.Canvas(main_frame, bg='#ecf0f1', relief=tk.SUNKEN, bd=2)
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.barras = RenderizadorBarras(self.canvas, max_etiquetas=50, ancho_min_etiqueta=25)
+        self.raster = RenderizadorRaster(self.canvas) if RenderizadorRaster else None
+        self.renderizador = self.barras
         
     def toggle_sound(self):
         self.sound_enabled = self.sound_var.get()
@@ -162,9 +249,12 @@ class SortingVisualizer:
     def generate_array(self):
         if self.is_sorting:
             return
-        self.array = [random.randint(10, 400) for _ in range(self.array_size)]
+        # Con arreglos grandes el rango crece para no llenarlo de repetidos
+        self.array = [random.randint(10, max(400, self.array_size)) for _ in range(self.array_size)]
+        self.estado = EstadoOrdenamiento(self.array)
         self.comparisons = 0
         self.swaps = 0
+        self.reloj = None
         self.update_stats()
         self.draw_array()
         
@@ -178,8 +268,9 @@ class SortingVisualizer:
         if input_str:
             try:
                 numbers = [int(num.strip()) for num in input_str.split(',')]
-                if 5 <= len(numbers) <= 150:
+                if TAMANO_MINIMO <= len(numbers) <= TAMANO_MAXIMO:
                     self.array = numbers
+                    self.estado = EstadoOrdenamiento(self.array)
                     self.array_size = len(numbers)
                     self.size_var.set(self.array_size)
                     self.comparisons = 0
@@ -187,56 +278,35 @@ class SortingVisualizer:
                     self.update_stats()
                     self.draw_array()
                 else:
-                    messagebox.showerror("Error", "El tamaño del array debe estar entre 5 y 150")
+                    messagebox.showerror("Error", f"El tamaño del array debe estar entre {TAMANO_MINIMO} y {TAMANO_MAXIMO}")
             except ValueError:
                 messagebox.showerror("Error", "Ingrese solo números separados por comas")
         
-    def draw_array(self, comparing=[], swapping=[], sorted_indices=[], pivot_index=-1, 
-                  heap_nodes=[], shell_gaps=[]):
-        self.canvas.delete("all")
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        
-        if canvas_width <= 1 or canvas_height <= 1:
-            self.root.after(100, lambda: self.draw_array(comparing, swapping, sorted_indices, pivot_index, heap_nodes, shell_gaps))
-            return
-            
-        bar_width = canvas_width / len(self.array)
-        max_value = max(self.array) if self.array else 1
-        
-        for i, value in enumerate(self.array):
-            x1 = i * bar_width
-            y1 = canvas_height - (value / max_value) * (canvas_height - 20)
-            x2 = (i + 1) * bar_width - 2
-            y2 = canvas_height
-            
-            # Determinar color
-            color = self.colors['default']
-            if i == pivot_index:
-                color = self.colors['pivot']
-            elif i in swapping:
-                color = self.colors['swapping']
-            elif i in comparing:
-                color = self.colors['comparing']
-            elif i in sorted_indices:
-                color = self.colors['sorted']
-            elif i in heap_nodes:
-                color = self.colors['heap_node']
-            elif i in shell_gaps:
-                color = self.colors['shell_gap']
-            
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline='#2c3e50', width=1)
-            
-            # Mostrar valor si hay espacio
-            if bar_width > 25 and len(self.array) <= 50:
-                text_x = x1 + bar_width / 2
-                text_y = y1 - 10
-                self.canvas.create_text(text_x, text_y, text=str(value), font=('Arial', 8), fill='#2c3e50')
+    def draw_array(self, completo=True):
+        # En la animación solo se revisan las barras que cambiaron desde el cuadro anterior
+        cambios = self.estado.tomar_cambios()
+        if not self.elegir_renderizador().dibujar(self.estado, self.colores_capa,
+                                                  None if completo else cambios):
+            self.root.after(100, self.draw_array)
+    
+    def elegir_renderizador(self):
+        # Con más elementos que píxeles de ancho, una sola imagen en vez de una barra por elemento
+        if self.raster is not None and len(self.array) > self.canvas.winfo_width():
+            renderizador = self.raster
+        else:
+            renderizador = self.barras
+        if renderizador is not self.renderizador:
+            renderizador.invalidar()
+            self.renderizador = renderizador
+        return renderizador
     
     def update_stats(self):
-        elapsed_time = time.time() - self.start_time if self.is_sorting else 0
+        elapsed_time = (self.pausa_inicio or time.time()) - self.start_time if self.is_sorting else 0
         self.time_label.config(text=f"Tiempo: {elapsed_time:.2f}s")
-        self.stats_label.config(text=f"Comparaciones: {self.comparisons} | Intercambios: {self.swaps}")
+        texto = f"Comparaciones: {self.comparisons} | Intercambios: {self.swaps}"
+        if self.reloj is not None:
+            texto += f" | Pasos/s: {self.reloj.pasos_por_segundo:.0f} | Cuadros saltados: {self.reloj.saltados}"
+        self.stats_label.config(text=texto)
     
     def on_algorithm_change(self, event):
         self.current_algorithm = self.algorithm_var.get()
@@ -248,36 +318,89 @@ class SortingVisualizer:
     
     def on_speed_change(self, value):
         self.speed = int(value)
+        self.speed_label.config(text=texto_velocidad(self.speed))
+        if self.planificador is not None:
+            self.planificador.ritmo = pasos_por_segundo(self.speed)
+    
+    def on_fps_change(self, event):
+        # Se usa a partir del próximo ordenamiento
+        self.fps = int(self.fps_var.get())
     
     def start_sorting(self):
         if self.is_sorting:
             return
         
+        # El hilo ordena su propia copia; self.array solo cambia al aplicar los pasos
+        self.estado = EstadoOrdenamiento(self.array)
+        self.estado.comparaciones = self.comparisons
+        self.estado.intercambios = self.swaps
+        self.draw_array()
+        self.iniciar_animacion(ALGORITMOS[self.current_algorithm](list(self.array)))
+    
+    # Anima los pasos de 'generador' sobre self.estado (un algoritmo o una traza)
+    def iniciar_animacion(self, generador):
         self.is_sorting = True
         self.start_time = time.time()
+        self.pausa_inicio = None
         self.start_button.config(state=tk.DISABLED)
-        self.stop_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.NORMAL, text="⏸ Pausar")
+        self.cancel_button.config(state=tk.NORMAL)
         self.generate_button.config(state=tk.DISABLED)
         self.manual_button.config(state=tk.DISABLED)
         
         # Actualizar tiempo en tiempo real
         self.update_time()
         
-        # Ejecutar algoritmo en hilo separado
-        thread = threading.Thread(target=self.run_algorithm)
-        thread.daemon = True
-        thread.start()
+        # Ejecutar en hilo separado; la interfaz dibuja a ritmo fijo
+        self.planificador = PlanificadorPasos(generador, pasos_por_segundo(self.speed),
+                                              al_producir=self.sonar_paso)
+        self.reloj = RelojCuadros(self.fps)
+        self.planificador.iniciar()
+        self.root.after(round(1000 / self.fps), self.cuadro, self.planificador)
     
     def update_time(self):
         if self.is_sorting:
-            elapsed_time = time.time() - self.start_time
+            elapsed_time = (self.pausa_inicio or time.time()) - self.start_time
             self.time_label.config(text=f"Tiempo: {elapsed_time:.2f}s")
             self.root.after(100, self.update_time)
     
+    # Todos los algoritmos a la vez sobre copias del array actual, cada uno en su proceso
+    def abrir_carrera(self):
+        if self.is_sorting:
+            return
+        VentanaCarrera(self.root, list(self.array), pasos_por_segundo(self.speed),
+                       self.fps, self.colores_capa)
+
+    # Pausa o reanuda sin perder el avance; en pausa se puede ir de a un paso
+    def toggle_pause(self):
+        if not self.is_sorting or self.planificador is None:
+            return
+        if self.planificador.pausado:
+            self.planificador.reanudar()
+            self.start_time += time.time() - self.pausa_inicio
+            self.pausa_inicio = None
+            self.stop_button.config(text="⏸ Pausar")
+            self.step_button.config(state=tk.DISABLED)
+        else:
+            self.planificador.pausar()
+            self.pausa_inicio = time.time()
+            self.stop_button.config(text="▶ Reanudar")
+            self.step_button.config(state=tk.NORMAL)
+    
+    def step_once(self):
+        if self.planificador is not None and self.planificador.pausado:
+            self.planificador.avanzar()
+    
+    # Cancela el ordenamiento (queda el array como iba)
     def stop_sorting(self):
         self.is_sorting = False
+        self.reproduciendo = False
+        if self.planificador is not None:
+            self.planificador.detener()
         self.start_button.config(state=tk.NORMAL)
-        self.stop_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.DISABLED, text="⏸ Pausar")
+        self.step_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.DISABLED)
         self.generate_button.config(state=tk.NORMAL)
         self.manual_button.config(state=tk.NORMAL)
     
@@ -285,208 +408,157 @@ class SortingVisualizer:
         self.stop_sorting()
         self.comparisons = 0
         self.swaps = 0
+        self.reloj = None
+        self.estado = EstadoOrdenamiento(self.array)
         self.update_stats()
         self.draw_array()
     
-    def run_algorithm(self):
-        try:
-            if self.current_algorithm == "Bubble Sort":
-                self.bubble_sort()
-            elif self.current_algorithm == "Insertion Sort":
-                self.insertion_sort()
-            elif self.current_algorithm == "Selection Sort":
-                self.selection_sort()
-            elif self.current_algorithm == "Quick Sort":
-                self.quick_sort(0, len(self.array) - 1)
-            elif self.current_algorithm == "Merge Sort":
-                self.merge_sort(0, len(self.array) - 1)
-            elif self.current_algorithm == "Heap Sort":
-                self.heap_sort()
-            elif self.current_algorithm == "Shell Sort":
-                self.shell_sort()
-        except Exception as e:
-            print(f"Error en algoritmo: {e}")
-        finally:
-            self.root.after(0, self.sorting_finished)
+    def cuadro(self, planificador):
+        # Un tick de la interfaz: aplica todos los pasos que llegaron desde el
+        # cuadro anterior y dibuja una sola vez
+        if planificador is not self.planificador or planificador.detenido:
+            return
+        
+        fin = None
+        aplicados = 0
+        aplicar = self.estado.aplicar
+        for paso in planificador.tomar():
+            if paso[0] == FIN:
+                fin = paso
+                break
+            aplicar(paso)
+            aplicados += 1
+        self.reloj.contar(aplicados)
+        
+        if aplicados:
+            self.comparisons = self.estado.comparaciones
+            self.swaps = self.estado.intercambios
+            self.update_stats()
+            self.draw_array(completo=False)
+            if self.reproduciendo:
+                self.trace_var.set(self.estado.pasos)
+        
+        if fin is None:
+            self.root.after(self.reloj.siguiente(), self.cuadro, planificador)
+        else:
+            self.sorting_finished(completado=fin[1])
     
-    def sorting_finished(self):
+    def sonar_paso(self, paso):
+        if paso[0] in SONIDOS:
+            self.play_sound(*SONIDOS[paso[0]])
+    
+    def sorting_finished(self, completado=True):
         self.is_sorting = False
+        self.reproduciendo = False
         self.start_button.config(state=tk.NORMAL)
-        self.stop_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.DISABLED, text="⏸ Pausar")
+        self.step_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.DISABLED)
         self.generate_button.config(state=tk.NORMAL)
         self.manual_button.config(state=tk.NORMAL)
         
-        # Mostrar array completamente ordenado
-        sorted_indices = list(range(len(self.array)))
-        self.root.after(0, lambda: self.draw_array(sorted_indices=sorted_indices))
-        self.play_sound(1000, 200)  # Sonido de finalización
+        # Mostrar array completamente ordenado (o como quedó, si se detuvo)
+        if completado:
+            self.estado.terminar()
+            self.draw_array(completo=False)
+            self.play_sound(1000, 200)  # Sonido de finalización
+        else:
+            self.draw_array()
     
-    def delay(self):
-        time.sleep((101 - self.speed) / 1000)
+    # Graba una ejecución completa del algoritmo elegido sobre el arreglo actual,
+    # sin animarla, y la abre para reproducirla
+    def grabar_traza(self):
+        if self.is_sorting:
+            return
+        archivo = filedialog.asksaveasfilename(parent=self.root, defaultextension=".traza",
+                                               filetypes=[("Trazas de ordenamiento", "*.traza")])
+        if not archivo:
+            return
+        
+        self.record_button.config(state=tk.DISABLED)
+        self.trace_label.config(text=f"Grabando {self.current_algorithm}...")
+        resultado = {}
+        hilo = threading.Thread(target=self.correr_grabacion,
+                                args=(self.current_algorithm, list(self.array), archivo, resultado))
+        hilo.daemon = True
+        hilo.start()
+        self.root.after(100, self.revisar_grabacion, hilo, archivo, resultado)
     
-    # Algoritmos de ordenamiento existentes (bubble, insertion, selection, quick, merge)
-    # ... (los mismos que en tu versión original)
+    def correr_grabacion(self, nombre, arreglo, archivo, resultado):
+        try:
+            resultado['pasos'] = grabar(nombre, arreglo, archivo)
+        except Exception as e:
+            resultado['error'] = e
     
-    # Nuevos algoritmos añadidos:
+    def revisar_grabacion(self, hilo, archivo, resultado):
+        if hilo.is_alive():
+            self.root.after(100, self.revisar_grabacion, hilo, archivo, resultado)
+            return
+        self.record_button.config(state=tk.NORMAL)
+        if 'error' in resultado:
+            self.trace_label.config(text="Sin traza" if self.traza is None else self.texto_traza())
+            messagebox.showerror("Error", f"No se pudo grabar la traza: {resultado['error']}")
+            return
+        self.cargar_traza(archivo)
     
-    def heap_sort(self):
-        n = len(self.array)
-        sorted_indices = []
-        
-        # Construir max heap
-        for i in range(n // 2 - 1, -1, -1):
-            if not self.is_sorting:
-                return
-            self.heapify(n, i, sorted_indices)
-        
-        # Extraer elementos uno por uno
-        for i in range(n - 1, 0, -1):
-            if not self.is_sorting:
-                return
-                
-            # Mover la raíz actual al final
-            self.swaps += 1
-            self.array[0], self.array[i] = self.array[i], self.array[0]
-            self.root.after(0, self.update_stats)
-            self.root.after(0, lambda: self.draw_array(
-                swapping=[0, i], 
-                heap_nodes=list(range(i)),
-                sorted_indices=sorted_indices
-            ))
-            self.play_sound(800, 50)
-            self.delay()
-            
-            sorted_indices.append(i)
-            
-            # Llamar heapify en el heap reducido
-            self.heapify(i, 0, sorted_indices)
-        
+    def abrir_traza(self):
         if self.is_sorting:
-            sorted_indices.append(0)
-            self.root.after(0, lambda: self.draw_array(sorted_indices=sorted_indices))
+            return
+        archivo = filedialog.askopenfilename(parent=self.root,
+                                             filetypes=[("Trazas de ordenamiento", "*.traza")])
+        if archivo:
+            self.cargar_traza(archivo)
     
-    def heapify(self, n, i, sorted_indices):
-        largest = i
-        left = 2 * i + 1
-        right = 2 * i + 2
-        
-        # Comparar con el hijo izquierdo
-        if left < n:
-            self.comparisons += 1
-            self.root.after(0, self.update_stats)
-            self.root.after(0, lambda: self.draw_array(
-                comparing=[largest, left],
-                heap_nodes=list(range(n)),
-                sorted_indices=sorted_indices
-            ))
-            self.play_sound(600, 20)
-            self.delay()
-            
-            if self.array[left] > self.array[largest]:
-                largest = left
-        
-        # Comparar con el hijo derecho
-        if right < n:
-            self.comparisons += 1
-            self.root.after(0, self.update_stats)
-            self.root.after(0, lambda: self.draw_array(
-                comparing=[largest, right],
-                heap_nodes=list(range(n)),
-                sorted_indices=sorted_indices
-            ))
-            self.play_sound(600, 20)
-            self.delay()
-            
-            if self.array[right] > self.array[largest]:
-                largest = right
-        
-        # Si el más grande no es la raíz
-        if largest != i:
-            self.swaps += 1
-            self.array[i], self.array[largest] = self.array[largest], self.array[i]
-            self.root.after(0, self.update_stats)
-            self.root.after(0, lambda: self.draw_array(
-                swapping=[i, largest],
-                heap_nodes=list(range(n)),
-                sorted_indices=sorted_indices
-            ))
-            self.play_sound(400, 50)
-            self.delay()
-            
-            # Heapify el subárbol afectado
-            self.heapify(n, largest, sorted_indices)
+    def cargar_traza(self, archivo):
+        try:
+            traza = Traza(archivo)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"No se pudo abrir la traza: {e}")
+            return
+        if self.traza is not None:
+            self.traza.cerrar()
+        self.traza = traza
+        self.trace_label.config(text=self.texto_traza())
+        self.trace_scale.config(to=traza.pasos, state=tk.NORMAL)
+        self.replay_button.config(state=tk.NORMAL)
+        self.trace_var.set(0)
+        self.mostrar_paso(0)
     
-    def shell_sort(self):
-        n = len(self.array)
-        gap = n // 2
-        sorted_indices = []
-        
-        while gap > 0:
-            if not self.is_sorting:
-                return
-                
-            # Hacer un insertion sort para esta brecha
-            for i in range(gap, n):
-                if not self.is_sorting:
-                    return
-                    
-                temp = self.array[i]
-                j = i
-                
-                # Resaltar los elementos en la brecha actual
-                gap_indices = list(range(i % gap, n, gap))
-                self.root.after(0, lambda: self.draw_array(
-                    comparing=[i],
-                    shell_gaps=gap_indices,
-                    sorted_indices=sorted_indices
-                ))
-                self.play_sound(700, 20)
-                self.delay()
-                
-                while j >= gap and self.array[j - gap] > temp:
-                    if not self.is_sorting:
-                        return
-                        
-                    self.comparisons += 1
-                    self.root.after(0, self.update_stats)
-                    self.root.after(0, lambda: self.draw_array(
-                        comparing=[j, j - gap],
-                        shell_gaps=gap_indices,
-                        sorted_indices=sorted_indices
-                    ))
-                    self.play_sound(600, 20)
-                    self.delay()
-                    
-                    self.swaps += 1
-                    self.array[j] = self.array[j - gap]
-                    self.root.after(0, self.update_stats)
-                    self.root.after(0, lambda: self.draw_array(
-                        swapping=[j, j - gap],
-                        shell_gaps=gap_indices,
-                        sorted_indices=sorted_indices
-                    ))
-                    self.play_sound(500, 30)
-                    self.delay()
-                    
-                    j -= gap
-                
-                self.array[j] = temp
-                if j != i:
-                    self.swaps += 1
-                    self.root.after(0, self.update_stats)
-                    self.root.after(0, lambda: self.draw_array(
-                        swapping=[j, i],
-                        shell_gaps=gap_indices,
-                        sorted_indices=sorted_indices
-                    ))
-                    self.play_sound(500, 30)
-                    self.delay()
-            
-            gap //= 2
-        
-        if self.is_sorting:
-            sorted_indices = list(range(n))
-            self.root.after(0, lambda: self.draw_array(sorted_indices=sorted_indices))
+    def texto_traza(self):
+        return f"{self.traza.algoritmo} | n = {self.traza.n} | {self.traza.pasos} pasos"
+    
+    def on_trace_seek(self, value):
+        # Mientras se anima, el slider solo muestra la posición
+        if self.traza is None or self.is_sorting:
+            return
+        self.mostrar_paso(int(value))
+    
+    # Salta al estado después de k pasos (cuadro clave + los pasos que faltan)
+    def mostrar_paso(self, k):
+        self.estado = self.traza.estado_en(k)
+        self.array = self.estado.array
+        self.comparisons = self.estado.comparaciones
+        self.swaps = self.estado.intercambios
+        self.update_stats()
+        self.draw_array()
+    
+    def reproducir_traza(self):
+        if self.is_sorting or self.traza is None:
+            return
+        k = self.trace_var.get()
+        if k >= self.traza.pasos:
+            k = 0
+        self.mostrar_paso(k)
+        self.reproduciendo = True
+        self.iniciar_animacion(self.traza.pasos_desde(k))
+
+    # Al cerrar la ventana se cancela el hilo y se espera a que termine
+    def cerrar(self):
+        planificador = self.planificador
+        self.stop_sorting()
+        if planificador is not None:
+            planificador.esperar_fin()
+        self.root.destroy()
 
 if __name__ == "__main__":
     root = tk.Tk()
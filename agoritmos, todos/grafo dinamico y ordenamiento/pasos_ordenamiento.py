@@ -0,0 +1,671 @@
+# Algoritmos de ordenamiento como generadores de pasos.
+#
+# Cada algoritmo ordena la lista que recibe (en su lugar) y va anunciando lo
+# que hace con eventos (operación, a, b) de tamaño fijo. No sabe nada de Tk:
+# el mismo código sirve para animar en SortingVisualizer, para medir sin
+# interfaz o para grabar la secuencia de pasos.
+#
+#   (COMPARAR, i, j)      compara arr[i] con arr[j]
+#   (INTERCAMBIAR, i, j)  arr[i] y arr[j] ya se intercambiaron
+#   (ESCRIBIR, i, valor)  arr[i] = valor
+#   (PIVOTE, i, 0)        arr[i] es el pivote actual (-1 = ninguno)
+#   (ORDENADO, i, j)      las posiciones [i, j) ya están en su lugar
+#   (HEAP, i, j)          el heap ocupa las posiciones [i, j)
+#   (BRECHA, i, gap)      se trabaja la cadena i, i + gap, i + 2·gap... de Shell Sort
+#
+# FIN no lo produce ningún algoritmo: lo agrega quien consume el generador
+# para avisar que terminó, como (FIN, completado, 0).
+
+COMPARAR = 0
+INTERCAMBIAR = 1
+ESCRIBIR = 2
+PIVOTE = 3
+ORDENADO = 4
+HEAP = 5
+BRECHA = 6
+FIN = -1
+
+def bubble_sort(arr):
+    n = len(arr)
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            yield (COMPARAR, j, j + 1)
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                yield (INTERCAMBIAR, j, j + 1)
+        yield (ORDENADO, n - i - 1, n - i)
+
+def insertion_sort(arr):
+    if arr:
+        yield (ORDENADO, 0, 1)
+    for i in range(1, len(arr)):
+        key = arr[i]
+        j = i - 1
+        while j >= 0:
+            yield (COMPARAR, j, j + 1)
+            if arr[j] <= key:
+                break
+            arr[j + 1] = arr[j]
+            yield (ESCRIBIR, j + 1, arr[j])
+            j -= 1
+        if j + 1 != i:
+            arr[j + 1] = key
+            yield (ESCRIBIR, j + 1, key)
+        yield (ORDENADO, i, i + 1)
+
+def selection_sort(arr):
+    n = len(arr)
+    for i in range(n):
+        min_idx = i
+        for j in range(i + 1, n):
+            yield (COMPARAR, min_idx, j)
+            if arr[j] < arr[min_idx]:
+                min_idx = j
+        if min_idx != i:
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+            yield (INTERCAMBIAR, i, min_idx)
+        yield (ORDENADO, i, i + 1)
+
+def quick_sort(arr):
+    # Pila explícita en vez de recursión: no hay límite de profundidad y cada
+    # evento no tiene que atravesar una cadena de generadores anidados
+    pila = [(0, len(arr) - 1)]
+    while pila:
+        low, high = pila.pop()
+        if low >= high:
+            if low == high:
+                yield (ORDENADO, low, low + 1)
+            continue
+        pi = yield from partition(arr, low, high)
+        pila.append((pi + 1, high))
+        pila.append((low, pi - 1))
+
+def partition(arr, low, high):
+    pivot = arr[high]
+    i = low - 1
+    yield (PIVOTE, high, 0)
+
+    for j in range(low, high):
+        yield (COMPARAR, j, high)
+        if arr[j] < pivot:
+            i += 1
+            if i != j:
+                arr[i], arr[j] = arr[j], arr[i]
+                yield (INTERCAMBIAR, i, j)
+
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    yield (INTERCAMBIAR, i + 1, high)
+    yield (PIVOTE, -1, 0)
+    yield (ORDENADO, i + 1, i + 2)
+    return i + 1
+
+def merge_sort(arr, left=0, right=None):
+    if right is None:
+        right = len(arr) - 1
+    # Mismo orden de mezclas que la versión recursiva, pero con una pila:
+    # cada evento sale directo de merge() sin pasar por log n generadores
+    pila = [(left, right, False)]
+    while pila:
+        left, right, mezclar = pila.pop()
+        if left >= right:
+            continue
+        mid = (left + right) // 2
+        if mezclar:
+            yield from merge(arr, left, mid, right)
+        else:
+            pila.append((left, right, True))
+            pila.append((mid + 1, right, False))
+            pila.append((left, mid, False))
+
+def merge(arr, left, mid, right):
+    left_arr = arr[left:mid + 1]
+    right_arr = arr[mid + 1:right + 1]
+    i = j = 0
+    k = left
+
+    while i < len(left_arr) and j < len(right_arr):
+        yield (COMPARAR, left + i, mid + 1 + j)
+        if left_arr[i] <= right_arr[j]:
+            arr[k] = left_arr[i]
+            i += 1
+        else:
+            arr[k] = right_arr[j]
+            j += 1
+        yield (ESCRIBIR, k, arr[k])
+        k += 1
+
+    while i < len(left_arr):
+        arr[k] = left_arr[i]
+        yield (ESCRIBIR, k, arr[k])
+        i += 1
+        k += 1
+
+    while j < len(right_arr):
+        arr[k] = right_arr[j]
+        yield (ESCRIBIR, k, arr[k])
+        j += 1
+        k += 1
+
+def heap_sort(arr):
+    n = len(arr)
+    # Construir max heap
+    yield (HEAP, 0, n)
+    for i in range(n // 2 - 1, -1, -1):
+        yield from heapify(arr, n, i)
+
+    # Extraer elementos uno por uno
+    for i in range(n - 1, 0, -1):
+        arr[0], arr[i] = arr[i], arr[0]
+        yield (INTERCAMBIAR, 0, i)
+        yield (ORDENADO, i, i + 1)
+        yield (HEAP, 0, i)
+        yield from heapify(arr, i, 0)
+
+    if n:
+        yield (HEAP, 0, 0)
+        yield (ORDENADO, 0, 1)
+
+def heapify(arr, n, i, inicio=0):
+    # Hundir arr[i] hasta su lugar (iterativo). El heap ocupa arr[inicio:inicio + n]
+    # e i se cuenta desde inicio (introsort lo usa sobre un tramo del arreglo)
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+
+        if left < n:
+            yield (COMPARAR, inicio + largest, inicio + left)
+            if arr[inicio + left] > arr[inicio + largest]:
+                largest = left
+
+        if right < n:
+            yield (COMPARAR, inicio + largest, inicio + right)
+            if arr[inicio + right] > arr[inicio + largest]:
+                largest = right
+
+        if largest == i:
+            return
+        arr[inicio + i], arr[inicio + largest] = arr[inicio + largest], arr[inicio + i]
+        yield (INTERCAMBIAR, inicio + i, inicio + largest)
+        i = largest
+
+def shell_sort(arr):
+    n = len(arr)
+    gap = n // 2
+
+    while gap > 0:
+        # Insertion sort para esta brecha
+        for i in range(gap, n):
+            temp = arr[i]
+            j = i
+            yield (BRECHA, i % gap, gap)
+
+            while j >= gap:
+                yield (COMPARAR, j - gap, j)
+                if arr[j - gap] <= temp:
+                    break
+                arr[j] = arr[j - gap]
+                yield (ESCRIBIR, j, arr[j])
+                j -= gap
+
+            if j != i:
+                arr[j] = temp
+                yield (ESCRIBIR, j, temp)
+
+        gap //= 2
+
+    yield (BRECHA, 0, 0)
+    yield (ORDENADO, 0, n)
+
+# --- Timsort ---------------------------------------------------------------
+# Versión instrumentada del algoritmo de list.sort(): busca tramos ya
+# ordenados (los descendentes se invierten), los alarga hasta MINRUN con
+# inserción binaria, los apila cuidando que los tamaños crezcan como
+# Fibonacci y los mezcla con galope cuando un lado gana muchas veces seguidas.
+# Solo tiene merge_lo (copia el tramo izquierdo), no merge_hi.
+
+MIN_GALOPE = 7
+
+def calcular_minrun(n):
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def contar_tramo(arr, lo, hi):
+    # Largo del tramo que empieza en lo; si es estrictamente descendente se invierte
+    if lo + 1 == hi:
+        return 1
+    fin = lo + 1
+    yield (COMPARAR, lo, fin)
+    if arr[fin] < arr[lo]:
+        while fin + 1 < hi:
+            yield (COMPARAR, fin, fin + 1)
+            if not arr[fin + 1] < arr[fin]:
+                break
+            fin += 1
+        i, j = lo, fin
+        while i < j:
+            arr[i], arr[j] = arr[j], arr[i]
+            yield (INTERCAMBIAR, i, j)
+            i += 1
+            j -= 1
+    else:
+        while fin + 1 < hi:
+            yield (COMPARAR, fin, fin + 1)
+            if arr[fin + 1] < arr[fin]:
+                break
+            fin += 1
+    return fin + 1 - lo
+
+def insercion_binaria(arr, lo, hi, inicio):
+    # arr[lo:inicio] ya está ordenado; se insertan arr[inicio:hi] uno por uno
+    for i in range(inicio, hi):
+        clave = arr[i]
+        izq, der = lo, i
+        while izq < der:
+            medio = (izq + der) // 2
+            yield (COMPARAR, medio, i)
+            if clave < arr[medio]:
+                der = medio
+            else:
+                izq = medio + 1
+        for j in range(i, izq, -1):
+            arr[j] = arr[j - 1]
+            yield (ESCRIBIR, j, arr[j])
+        if izq != i:
+            arr[izq] = clave
+            yield (ESCRIBIR, izq, clave)
+
+def galopar(valores, lo, hi, clave, pos_clave, desplazamiento, estricto):
+    # Cuántos de valores[lo:hi] van antes que clave (< si estricto, <= si no).
+    # Búsqueda exponencial desde lo y después binaria. Los índices que se
+    # anuncian son valores[i] -> desplazamiento + i.
+    n = hi - lo
+    previo, ofs = 0, 1
+    while ofs <= n:
+        yield (COMPARAR, desplazamiento + lo + ofs - 1, pos_clave)
+        x = valores[lo + ofs - 1]
+        if not (x < clave if estricto else x <= clave):
+            break
+        previo = ofs
+        ofs = 2 * ofs + 1
+    tope = min(ofs - 1, n)
+    while previo < tope:
+        medio = (previo + tope) // 2
+        yield (COMPARAR, desplazamiento + lo + medio, pos_clave)
+        x = valores[lo + medio]
+        if x < clave if estricto else x <= clave:
+            previo = medio + 1
+        else:
+            tope = medio
+    return previo
+
+def mezclar_galopando(arr, a, na, b, nb, min_galope):
+    # Mezcla arr[a:a+na] con arr[b:b+nb] (b == a + na) copiando solo el izquierdo.
+    # Devuelve el nuevo min_galope, que se adapta a lo que rindió galopar.
+    tmp = arr[a:a + na]
+    i, j, k = 0, b, a
+    fin_j = b + nb
+    while True:
+        gana_izq = gana_der = 0
+        # Uno por uno hasta que un lado gane min_galope veces seguidas
+        while i < na and j < fin_j and gana_izq < min_galope and gana_der < min_galope:
+            yield (COMPARAR, a + i, j)
+            if arr[j] < tmp[i]:
+                arr[k] = arr[j]
+                j += 1
+                gana_der += 1
+                gana_izq = 0
+            else:
+                arr[k] = tmp[i]
+                i += 1
+                gana_izq += 1
+                gana_der = 0
+            yield (ESCRIBIR, k, arr[k])
+            k += 1
+        if i == na or j == fin_j:
+            break
+
+        # Galope: se copian bloques enteros mientras rinda
+        while True:
+            gana_izq = yield from galopar(tmp, i, na, arr[j], j, a, False)
+            for _ in range(gana_izq):
+                arr[k] = tmp[i]
+                yield (ESCRIBIR, k, arr[k])
+                i += 1
+                k += 1
+            if i == na:
+                break
+            arr[k] = arr[j]
+            yield (ESCRIBIR, k, arr[k])
+            j += 1
+            k += 1
+            if j == fin_j:
+                break
+
+            gana_der = yield from galopar(arr, j, fin_j, tmp[i], a + i, 0, True)
+            for _ in range(gana_der):
+                arr[k] = arr[j]
+                yield (ESCRIBIR, k, arr[k])
+                j += 1
+                k += 1
+            if j == fin_j:
+                break
+            arr[k] = tmp[i]
+            yield (ESCRIBIR, k, arr[k])
+            i += 1
+            k += 1
+            if i == na:
+                break
+
+            min_galope = max(1, min_galope - 1)
+            if gana_izq < MIN_GALOPE and gana_der < MIN_GALOPE:
+                break
+        if i == na or j == fin_j:
+            break
+        min_galope += 1  # salir del galope lo encarece para la próxima
+
+    # Lo que queda del tramo derecho ya está en su lugar
+    while i < na:
+        arr[k] = tmp[i]
+        yield (ESCRIBIR, k, arr[k])
+        i += 1
+        k += 1
+    return min_galope
+
+def mezclar_tramos(arr, tramos, t, min_galope):
+    a, na = tramos[t]
+    b, nb = tramos[t + 1]
+    tramos[t] = (a, na + nb)
+    del tramos[t + 1]
+
+    # Lo del izquierdo que ya va antes de todo el derecho queda donde está...
+    saltar = yield from galopar(arr, a, b, arr[b], b, 0, False)
+    a += saltar
+    na -= saltar
+    if na == 0:
+        return min_galope
+    # ...y lo mismo con lo del derecho que va después de todo el izquierdo
+    nb = yield from galopar(arr, b, b + nb, arr[b - 1], b - 1, 0, True)
+    if nb == 0:
+        return min_galope
+    return (yield from mezclar_galopando(arr, a, na, b, nb, min_galope))
+
+def timsort(arr):
+    n = len(arr)
+    minrun = calcular_minrun(n)
+    tramos = []  # (inicio, largo) de cada tramo pendiente de mezclar
+    min_galope = MIN_GALOPE
+    lo = 0
+    while lo < n:
+        largo = yield from contar_tramo(arr, lo, n)
+        if largo < minrun:
+            forzado = min(minrun, n - lo)
+            yield from insercion_binaria(arr, lo, lo + forzado, lo + largo)
+            largo = forzado
+        tramos.append((lo, largo))
+        lo += largo
+
+        # Invariantes de la pila: cada tramo más largo que los dos de arriba juntos
+        while len(tramos) > 1:
+            t = len(tramos) - 2
+            if ((t > 0 and tramos[t - 1][1] <= tramos[t][1] + tramos[t + 1][1]) or
+                    (t > 1 and tramos[t - 2][1] <= tramos[t - 1][1] + tramos[t][1])):
+                if tramos[t - 1][1] < tramos[t + 1][1]:
+                    t -= 1
+            elif tramos[t][1] > tramos[t + 1][1]:
+                break
+            min_galope = yield from mezclar_tramos(arr, tramos, t, min_galope)
+
+    while len(tramos) > 1:
+        t = len(tramos) - 2
+        if t > 0 and tramos[t - 1][1] < tramos[t + 1][1]:
+            t -= 1
+        min_galope = yield from mezclar_tramos(arr, tramos, t, min_galope)
+    yield (ORDENADO, 0, n)
+
+# --- Introsort -------------------------------------------------------------
+# Quick sort con pivote mediana de tres; si la recursión pasa de 2·log2(n)
+# niveles ese tramo se termina con heap sort (nunca O(n²)), y los tramos de
+# CORTE_INSERCION elementos o menos se dejan para una sola pasada final de
+# insertion sort, que ahí casi no mueve nada.
+
+CORTE_INSERCION = 16
+
+def mediana_de_tres(arr, low, high):
+    # Ordena arr[low], arr[mid], arr[high] y deja la mediana en high como pivote
+    mid = (low + high) // 2
+    for i, j in ((low, mid), (mid, high), (low, mid)):
+        yield (COMPARAR, i, j)
+        if arr[j] < arr[i]:
+            arr[i], arr[j] = arr[j], arr[i]
+            yield (INTERCAMBIAR, i, j)
+    arr[mid], arr[high] = arr[high], arr[mid]
+    yield (INTERCAMBIAR, mid, high)
+
+def heap_sort_rango(arr, low, high):
+    n = high - low + 1
+    yield (HEAP, low, high + 1)
+    for i in range(n // 2 - 1, -1, -1):
+        yield from heapify(arr, n, i, low)
+    for i in range(n - 1, 0, -1):
+        arr[low], arr[low + i] = arr[low + i], arr[low]
+        yield (INTERCAMBIAR, low, low + i)
+        yield (ORDENADO, low + i, low + i + 1)
+        yield (HEAP, low, low + i)
+        yield from heapify(arr, i, 0, low)
+    yield (HEAP, 0, 0)
+    yield (ORDENADO, low, low + 1)
+
+def introsort(arr):
+    n = len(arr)
+    pila = [(0, n - 1, 2 * max(n, 1).bit_length())]
+    while pila:
+        low, high, profundidad = pila.pop()
+        if high - low < CORTE_INSERCION:
+            continue
+        if profundidad == 0:
+            yield from heap_sort_rango(arr, low, high)
+            continue
+        yield from mediana_de_tres(arr, low, high)
+        pi = yield from partition(arr, low, high)
+        pila.append((pi + 1, high, profundidad - 1))
+        pila.append((low, pi - 1, profundidad - 1))
+    yield from insertion_sort(arr)
+
+# --- Sin comparaciones -----------------------------------------------------
+# Ninguno de los dos compara elementos entre sí: leen cada valor como número
+# (desplazado por el mínimo, así aceptan negativos). Solo anuncian escrituras.
+
+BASE_RADIX = 10
+
+def counting_sort(arr):
+    n = len(arr)
+    if n == 0:
+        return
+    minimo = min(arr)
+    conteo = [0] * (max(arr) - minimo + 1)
+    for valor in arr:
+        conteo[valor - minimo] += 1
+
+    k = 0
+    for d, veces in enumerate(conteo):
+        inicio = k
+        for _ in range(veces):
+            arr[k] = d + minimo
+            yield (ESCRIBIR, k, arr[k])
+            k += 1
+        if veces:
+            yield (ORDENADO, inicio, k)
+
+def radix_sort(arr):
+    # LSD: un counting sort estable por dígito, del menos al más significativo
+    n = len(arr)
+    if n == 0:
+        return
+    minimo = min(arr)
+    mayor = max(arr) - minimo
+    divisor = 1
+    while True:
+        conteo = [0] * BASE_RADIX
+        for valor in arr:
+            conteo[(valor - minimo) // divisor % BASE_RADIX] += 1
+        for d in range(1, BASE_RADIX):
+            conteo[d] += conteo[d - 1]
+        salida = [0] * n
+        for valor in reversed(arr):
+            d = (valor - minimo) // divisor % BASE_RADIX
+            conteo[d] -= 1
+            salida[conteo[d]] = valor
+        for k, valor in enumerate(salida):
+            if arr[k] != valor:
+                arr[k] = valor
+                yield (ESCRIBIR, k, valor)
+        divisor *= BASE_RADIX
+        if divisor > mayor:
+            break
+    yield (ORDENADO, 0, n)
+
+# Nombre en la interfaz -> generador
+ALGORITMOS = {
+    "Bubble Sort": bubble_sort,
+    "Insertion Sort": insertion_sort,
+    "Selection Sort": selection_sort,
+    "Quick Sort": quick_sort,
+    "Merge Sort": merge_sort,
+    "Heap Sort": heap_sort,
+    "Shell Sort": shell_sort,
+    "Timsort": timsort,
+    "Introsort": introsort,
+    "LSD Radix Sort": radix_sort,
+    "Counting Sort": counting_sort,
+}
+
+# Capa (color) de cada barra, de menor a mayor prioridad
+CAPA_NORMAL = 0
+CAPA_BRECHA = 1
+CAPA_HEAP = 2
+CAPA_ORDENADO = 3
+CAPA_COMPARANDO = 4
+CAPA_INTERCAMBIANDO = 5
+CAPA_PIVOTE = 6
+
+def cadena(inicio, gap, n):
+    return range(inicio, n, gap) if gap else range(0)
+
+class EstadoOrdenamiento:
+    """Lo que se ve en pantalla: el arreglo, los contadores y los resaltados.
+    Se actualiza solo a partir de los eventos, así que sirve igual para la
+    animación en vivo que para reproducir una ejecución grabada.
+
+    Los resaltados se guardan por índice (ordenados es un bytearray) o como
+    rangos (heap y brecha), así que capa(i) es O(1) y aplicar un paso nunca
+    recorre el arreglo. tomar_cambios() devuelve solo las barras que hay que
+    volver a dibujar desde la última vez."""
+
+    def __init__(self, array):
+        self.array = array
+        self.comparaciones = 0
+        self.intercambios = 0
+        self.pasos = 0
+        self.comparando = []
+        self.intercambiando = []
+        self.pivote = -1
+        self.ordenados = bytearray(len(array))  # 1 = ya está en su lugar
+        self.rango_heap = (0, 0)  # último HEAP (i, j)
+        self.brecha = (0, 0)      # última BRECHA (i, gap)
+        self.modificados = set()  # índices que cambiaron de valor o se ordenaron desde el último dibujo
+
+        # Lo que había en el último dibujo, para saber qué barras restaurar
+        self.resaltados_dibujados = []
+        self.heap_dibujado = (0, 0)
+        self.brecha_dibujada = (0, 0)
+
+    def aplicar(self, paso):
+        op, a, b = paso
+        self.pasos += 1
+        if op == COMPARAR:
+            self.comparaciones += 1
+            self.comparando = [a, b]
+            self.intercambiando = []
+        elif op == INTERCAMBIAR:
+            self.intercambios += 1
+            self.array[a], self.array[b] = self.array[b], self.array[a]
+            self.modificados.add(a)
+            self.modificados.add(b)
+            self.intercambiando = [a, b]
+            self.comparando = []
+        elif op == ESCRIBIR:
+            self.intercambios += 1
+            self.array[a] = b
+            self.modificados.add(a)
+            self.intercambiando = [a]
+            self.comparando = []
+        elif op == PIVOTE:
+            self.pivote = a
+        elif op == ORDENADO:
+            self.ordenados[a:b] = b'\x01' * (b - a)
+            self.modificados.update(range(a, b))
+        elif op == HEAP:
+            self.rango_heap = (a, b)
+        elif op == BRECHA:
+            self.brecha = (a, b)
+
+    # Deja todo como al terminar: todo ordenado y sin otros resaltados
+    def terminar(self):
+        n = len(self.array)
+        self.comparando = []
+        self.intercambiando = []
+        self.pivote = -1
+        self.rango_heap = (0, 0)
+        self.brecha = (0, 0)
+        self.ordenados[:] = b'\x01' * n
+        self.modificados.update(range(n))
+
+    def capa(self, i):
+        if i == self.pivote:
+            return CAPA_PIVOTE
+        if i in self.intercambiando:
+            return CAPA_INTERCAMBIANDO
+        if i in self.comparando:
+            return CAPA_COMPARANDO
+        if self.ordenados[i]:
+            return CAPA_ORDENADO
+        if self.rango_heap[0] <= i < self.rango_heap[1]:
+            return CAPA_HEAP
+        inicio, gap = self.brecha
+        if gap and i >= inicio and (i - inicio) % gap == 0:
+            return CAPA_BRECHA
+        return CAPA_NORMAL
+
+    def resaltados(self):
+        indices = self.comparando + self.intercambiando
+        if self.pivote >= 0:
+            indices.append(self.pivote)
+        return indices
+
+    # Índices cuyo valor o color pudo cambiar desde la llamada anterior
+    def tomar_cambios(self):
+        cambios = self.modificados
+        self.modificados = set()
+
+        resaltados = self.resaltados()
+        cambios.update(self.resaltados_dibujados)
+        cambios.update(resaltados)
+        self.resaltados_dibujados = resaltados
+
+        if self.rango_heap != self.heap_dibujado:
+            # Diferencia entre los dos rangos (o algo más, nunca menos)
+            (a1, b1), (a2, b2) = self.heap_dibujado, self.rango_heap
+            cambios.update(range(min(a1, a2), max(a1, a2)))
+            cambios.update(range(min(b1, b2), max(b1, b2)))
+            self.heap_dibujado = self.rango_heap
+
+        if self.brecha != self.brecha_dibujada:
+            n = len(self.array)
+            cambios.update(cadena(*self.brecha_dibujada, n))
+            cambios.update(cadena(*self.brecha, n))
+            self.brecha_dibujada = self.brecha
+        return cambios
@@ -0,0 +1,200 @@
+import queue
+import threading
+import time
+
+from pasos_ordenamiento import FIN
+
+# Separa la velocidad del algoritmo de la velocidad de dibujo.
+#
+# Un hilo avanza el generador a N pasos por segundo (o sin límite) y entrega
+# los pasos por lotes en una cola acotada; si la interfaz se atrasa, la cola
+# se llena y el hilo espera en vez de acumular memoria. La interfaz, con un
+# tick fijo de 30 o 60 cuadros por segundo, toma todo lo que llegó desde el
+# cuadro anterior, lo aplica y dibuja una sola vez.
+#
+# El hilo se puede pausar, reanudar, avanzar de a un paso o cancelar. En pausa
+# duerme en un Event (no gira) y cancelar lo despierta de cualquier espera.
+
+TAMANO_LOTE = 1000   # pasos por lote como máximo
+LOTES_EN_COLA = 16   # con la cola llena el productor espera (contrapresión)
+ADELANTO_MINIMO = 0.002  # solo se duerme si se va adelantado al menos esto (s)
+VELOCIDAD_SIN_LIMITE = 100
+FPS_DISPONIBLES = (30, 60)
+
+# Posición del slider de velocidad (1..100) -> pasos por segundo.
+# Escala logarítmica de 1 a ~500.000 pasos/s; 100 es sin límite (None).
+def pasos_por_segundo(velocidad):
+    if velocidad >= VELOCIDAD_SIN_LIMITE:
+        return None
+    return round(10 ** ((velocidad - 1) * 5.7 / 98))
+
+def texto_velocidad(velocidad):
+    ritmo = pasos_por_segundo(velocidad)
+    return "sin límite" if ritmo is None else f"{ritmo} pasos/s"
+
+class PlanificadorPasos:
+    # Por defecto produce en un hilo. Para correr en otro proceso se le pasa
+    # una multiprocessing.Queue y un multiprocessing.Event, y el proceso
+    # llama directamente a producir() (ver carrera.py).
+    def __init__(self, generador, ritmo=None, al_producir=None, cola=None, evento_detener=None):
+        self.generador = generador
+        self.ritmo = ritmo              # pasos por segundo; None = sin límite. Se puede cambiar en marcha
+        self.al_producir = al_producir  # se llama con cada paso desde el hilo (p. ej. para el sonido)
+        self.cola = cola if cola is not None else queue.Queue(maxsize=LOTES_EN_COLA)
+        self.evento_detener = evento_detener if evento_detener is not None else threading.Event()
+        self.hilo = threading.Thread(target=self.producir, daemon=True)
+
+        self.pausado = False
+        self.pasos_sueltos = 0  # pasos que puede dar estando en pausa
+        self.lock = threading.Lock()
+        self.despertar = threading.Event()
+
+    def iniciar(self):
+        self.hilo.start()
+
+    # Cancela: el hilo termina en el paso siguiente, aunque esté en pausa o durmiendo
+    def detener(self):
+        self.evento_detener.set()
+        self.despertar.set()
+
+    # Espera a que el hilo termine (p. ej. al cerrar la ventana)
+    def esperar_fin(self, timeout=1.0):
+        if self.hilo.is_alive():
+            self.hilo.join(timeout)
+
+    @property
+    def detenido(self):
+        return self.evento_detener.is_set()
+
+    def pausar(self):
+        with self.lock:
+            self.pausado = True
+
+    def reanudar(self):
+        with self.lock:
+            self.pausado = False
+            self.pasos_sueltos = 0
+            self.despertar.set()
+
+    # Estando en pausa, deja pasar 'cantidad' pasos más
+    def avanzar(self, cantidad=1):
+        with self.lock:
+            self.pasos_sueltos += cantidad
+            self.despertar.set()
+
+    # Bloquea mientras esté en pausa y no haya pasos sueltos. False = cancelado
+    def esperar_turno(self):
+        while not self.detenido:
+            with self.lock:
+                if not self.pausado:
+                    return True
+                if self.pasos_sueltos:
+                    self.pasos_sueltos -= 1
+                    return True
+                self.despertar.clear()
+            self.despertar.wait()
+        return False
+
+    def entregar(self, lote):
+        # Espera lugar en la cola sin quedar bloqueado si se detiene
+        while not self.detenido:
+            try:
+                self.cola.put(lote, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def producir(self):
+        completado = False
+        lote = []
+        ritmo = self.ritmo
+        base_tiempo = time.perf_counter()
+        base_pasos = producidos = 0
+        try:
+            for paso in self.generador:
+                if self.detenido:
+                    break
+                if self.pausado:
+                    # Lo producido hasta acá se ve antes de quedarse esperando
+                    if lote:
+                        if not self.entregar(lote):
+                            break
+                        lote = []
+                    if not self.esperar_turno():
+                        break
+                    base_tiempo = time.perf_counter()
+                    base_pasos = producidos
+                lote.append(paso)
+                if self.al_producir is not None:
+                    self.al_producir(paso)
+                producidos += 1
+
+                if self.ritmo != ritmo:
+                    # Cambió la velocidad: se mide el ritmo desde ahora
+                    ritmo = self.ritmo
+                    base_tiempo = time.perf_counter()
+                    base_pasos = producidos
+                if ritmo is None:
+                    if len(lote) >= TAMANO_LOTE:
+                        if not self.entregar(lote):
+                            break
+                        lote = []
+                    continue
+
+                adelanto = base_tiempo + (producidos - base_pasos) / ritmo - time.perf_counter()
+                if adelanto > ADELANTO_MINIMO or len(lote) >= TAMANO_LOTE:
+                    if not self.entregar(lote):
+                        break
+                    lote = []
+                    if adelanto > 0:
+                        self.evento_detener.wait(adelanto)  # se corta al cancelar
+            else:
+                completado = True
+        except Exception as e:
+            print(f"Error en algoritmo: {e}")
+
+        if not self.detenido:
+            lote.append((FIN, completado, 0))
+            self.entregar(lote)
+
+    # Todos los pasos que llegaron desde la última llamada, sin esperar
+    def tomar(self):
+        pasos = []
+        while True:
+            try:
+                pasos.extend(self.cola.get_nowait())
+            except queue.Empty:
+                return pasos
+
+class RelojCuadros:
+    """Tick fijo de la interfaz: calcula cuánto esperar hasta el próximo
+    cuadro, cuenta los cuadros que se saltaron por llegar tarde y mide los
+    pasos por segundo que realmente se dibujaron."""
+
+    def __init__(self, fps):
+        self.periodo = 1 / fps
+        self.proximo = time.perf_counter() + self.periodo
+        self.saltados = 0
+        self.pasos_por_segundo = 0.0
+        self.inicio_medicion = time.perf_counter()
+        self.pasos_medicion = 0
+
+    def contar(self, pasos):
+        self.pasos_medicion += pasos
+        ahora = time.perf_counter()
+        transcurrido = ahora - self.inicio_medicion
+        if transcurrido >= 0.5:
+            self.pasos_por_segundo = self.pasos_medicion / transcurrido
+            self.inicio_medicion = ahora
+            self.pasos_medicion = 0
+
+    # Milisegundos hasta el próximo cuadro (para root.after)
+    def siguiente(self):
+        ahora = time.perf_counter()
+        if ahora > self.proximo + self.periodo:
+            perdidos = int((ahora - self.proximo) / self.periodo)
+            self.saltados += perdidos
+            self.proximo += perdidos * self.periodo
+        self.proximo += self.periodo
+        return max(1, round((self.proximo - ahora) * 1000))
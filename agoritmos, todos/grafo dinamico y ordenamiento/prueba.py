@@ -4,6 +4,7 @@ import random
 import math
 from typing import List, Tuple, Optional
 import numpy as np
+from componentes_umbral import ComponentesPorUmbral, aristas_desde_matriz
 
 class Point:
     def __init__(self, x: int = 0, y: int = 0):
@@ -19,6 +20,8 @@ class RedSocialGrafica:
         self.componente: List[int] = []
         self.colores: List[str] = []
         self.umbral_peso: int = 5
+        # Componentes precalculadas para todos los umbrales (se rehace al cambiar la red)
+        self.motor_componentes: Optional[ComponentesPorUmbral] = None
         self.random = random.Random()
         
         # Variables para pan/scroll de la vista
@@ -404,6 +407,7 @@ class RedSocialGrafica:
     
     def inicializar_grafo(self):
         """Inicializa el grafo con datos mejorados"""
+        self.motor_componentes = None
         for i in range(1, 31):
             self.usuarios.append(f"User{i}")
         
@@ -429,9 +433,12 @@ class RedSocialGrafica:
     def detectar_componentes_por_peso(self):
         """Detecta componentes con colores mejorados"""
         n = len(self.usuarios)
-        self.componente = [-1] * n
+        if self.motor_componentes is None or self.motor_componentes.n != n:
+            aristas = aristas_desde_matriz(self.matriz_adyacencia, self.matriz_pesos)
+            self.motor_componentes = ComponentesPorUmbral(n, aristas)
+        
+        self.componente = list(self.motor_componentes.componentes(self.umbral_peso))
         self.colores = []
-        componente_id = 0
         
         # Paleta de colores más atractiva
         color_palette = [
@@ -440,25 +447,13 @@ class RedSocialGrafica:
             "#F8C471", "#82E0AA", "#F1948A", "#85C1E9", "#D7BDE2"
         ]
         
-        for i in range(n):
-            if self.componente[i] == -1:
-                self.dfs_por_peso(i, componente_id)
-                if componente_id < len(color_palette):
-                    self.colores.append(color_palette[componente_id])
-                else:
-                    # Generar color aleatorio si se agotan los predefinidos
-                    color = f"#{self.random.randint(0, 255):02x}{self.random.randint(0, 255):02x}{self.random.randint(0, 255):02x}"
-                    self.colores.append(color)
-                componente_id += 1
-    
-    def dfs_por_peso(self, nodo: int, id: int):
-        """DFS mejorado"""
-        self.componente[nodo] = id
-        for i in range(len(self.usuarios)):
-            if (self.matriz_adyacencia[nodo][i] == 1 and 
-                self.matriz_pesos[nodo][i] >= self.umbral_peso and 
-                self.componente[i] == -1):
-                self.dfs_por_peso(i, id)
+        for componente_id in range(self.motor_componentes.cantidad(self.umbral_peso)):
+            if componente_id < len(color_palette):
+                self.colores.append(color_palette[componente_id])
+            else:
+                # Generar color aleatorio si se agotan los predefinidos
+                color = f"#{self.random.randint(0, 255):02x}{self.random.randint(0, 255):02x}{self.random.randint(0, 255):02x}"
+                self.colores.append(color)
     
     def generar_posiciones(self):
         """Genera posiciones con diferentes layouts"""
@@ -4,6 +4,7 @@ import random
 import math
 from typing import List, Tuple, Optional
 import numpy as np
+from componentes_umbral import ComponentesPorUmbral, aristas_desde_matriz
 
 class Point:
     def __init__(self, x: int = 0, y: int = 0):
@@ -19,6 +20,8 @@ class RedSocialGrafica:
         self.componente: List[int] = []
         self.colores: List[str] = []
         self.umbral_peso: int = 5
+        # Componentes precalculadas para todos los umbrales (se rehace al cambiar la red)
+        self.motor_componentes: Optional[ComponentesPorUmbral] = None
         self.random = random.Random()
         
         # Variables para pan/scroll de la vista
@@ -239,6 +242,8 @@ class RedSocialGrafica:
                 self.canvas.configure(scrollregion=new_bbox)
     
     def inicializar_grafo(self):
+        self.motor_componentes = None
+        
         # Crear usuarios
         for i in range(1, 31):
             self.usuarios.append(f"User{i}")
@@ -263,25 +268,16 @@ class RedSocialGrafica:
     
     def detectar_componentes_por_peso(self):
         n = len(self.usuarios)
-        self.componente = [-1] * n
-        self.colores = []
-        componente_id = 0
+        if self.motor_componentes is None or self.motor_componentes.n != n:
+            aristas = aristas_desde_matriz(self.matriz_adyacencia, self.matriz_pesos)
+            self.motor_componentes = ComponentesPorUmbral(n, aristas)
         
-        for i in range(n):
-            if self.componente[i] == -1:
-                self.dfs_por_peso(i, componente_id)
-                # Generar color aleatorio
-                color = f"#{self.random.randint(0, 255):02x}{self.random.randint(0, 255):02x}{self.random.randint(0, 255):02x}"
-                self.colores.append(color)
-                componente_id += 1
-    
-    def dfs_por_peso(self, nodo: int, id: int):
-        self.componente[nodo] = id
-        for i in range(len(self.usuarios)):
-            if (self.matriz_adyacencia[nodo][i] == 1 and 
-                self.matriz_pesos[nodo][i] >= self.umbral_peso and 
-                self.componente[i] == -1):
-                self.dfs_por_peso(i, id)
+        self.componente = list(self.motor_componentes.componentes(self.umbral_peso))
+        self.colores = []
+        for _ in range(self.motor_componentes.cantidad(self.umbral_peso)):
+            # Generar color aleatorio
+            color = f"#{self.random.randint(0, 255):02x}{self.random.randint(0, 255):02x}{self.random.randint(0, 255):02x}"
+            self.colores.append(color)
     
     def generar_posiciones(self):
         self.posiciones = []
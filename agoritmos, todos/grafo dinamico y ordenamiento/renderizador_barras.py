@@ -0,0 +1,101 @@
+# Dibujo de las barras en modo retenido.
+#
+# En vez de borrar el canvas y crear de nuevo todos los rectángulos en cada
+# paso, se crea un item por barra una sola vez y después solo se tocan las
+# barras que cambiaron: las que cambiaron de valor (coords) y las que cambiaron
+# de color (fill). El color de cada barra sale de capa(i), que tiene que ser
+# O(1) (EstadoOrdenamiento.capa), y la lista de índices a revisar la da
+# EstadoOrdenamiento.tomar_cambios(): un cuadro cuesta O(cambios), no O(n).
+
+class RenderizadorBarras:
+    def __init__(self, canvas, color_borde='#2c3e50', max_etiquetas=30, ancho_min_etiqueta=20):
+        self.canvas = canvas
+        self.color_borde = color_borde
+        self.max_etiquetas = max_etiquetas
+        self.ancho_min_etiqueta = ancho_min_etiqueta
+
+        self.barras = []      # id del rectángulo de cada índice
+        self.etiquetas = []   # id del texto de cada índice (vacío si no se muestran)
+        self.valores = []     # valor dibujado en cada índice
+        self.colores = []     # color dibujado en cada índice
+        self.ancho = 0
+        self.alto = 0
+        self.max_valor = 0
+
+    def geometria(self, i, valor):
+        ancho_barra = self.ancho / len(self.valores)
+        separacion = 2 if ancho_barra > 4 else 0
+        x1 = i * ancho_barra
+        y1 = self.alto - (valor / self.max_valor) * (self.alto - 20)
+        return x1, y1, x1 + max(ancho_barra - separacion, 1), self.alto
+
+    def reconstruir(self, array, capa, colores):
+        self.canvas.delete("all")
+        self.valores = list(array)
+        self.colores = [colores[capa(i)] for i in range(len(array))]
+        self.barras = []
+        self.etiquetas = []
+        if not array:
+            return
+
+        ancho_barra = self.ancho / len(array)
+        # Con barras de pocos píxeles el borde taparía el relleno
+        borde = self.color_borde if ancho_barra > 4 else ''
+        con_etiquetas = ancho_barra > self.ancho_min_etiqueta and len(array) <= self.max_etiquetas
+        crear = self.canvas.create_rectangle
+        for i, valor in enumerate(array):
+            x1, y1, x2, y2 = self.geometria(i, valor)
+            self.barras.append(crear(x1, y1, x2, y2, fill=self.colores[i], outline=borde, width=1))
+            if con_etiquetas:
+                self.etiquetas.append(self.canvas.create_text(x1 + ancho_barra / 2, y1 - 10, text=str(valor),
+                                                              font=('Arial', 8), fill=self.color_borde))
+
+    def mover(self, i, valor):
+        self.valores[i] = valor
+        x1, y1, x2, y2 = self.geometria(i, valor)
+        self.canvas.coords(self.barras[i], x1, y1, x2, y2)
+        if self.etiquetas:
+            self.canvas.coords(self.etiquetas[i], x1 + self.ancho / len(self.valores) / 2, y1 - 10)
+            self.canvas.itemconfig(self.etiquetas[i], text=str(valor))
+
+    def pintar(self, i, color):
+        if self.colores[i] != color:
+            self.colores[i] = color
+            self.canvas.itemconfig(self.barras[i], fill=color)
+
+    # La próxima vez se vuelve a crear todo (p. ej. si otro renderizador usó el canvas)
+    def invalidar(self):
+        self.barras = []
+
+    # Dibuja el arreglo de 'estado' pintando la barra i con colores[estado.capa(i)].
+    # 'cambios' son los índices cuyo valor o color pudo cambiar desde el último
+    # cuadro; con None se revisan todos. Devuelve False si el canvas todavía no
+    # tiene tamaño.
+    def dibujar(self, estado, colores, cambios=None):
+        array = estado.array
+        capa = estado.capa
+        ancho = self.canvas.winfo_width()
+        alto = self.canvas.winfo_height()
+        if ancho <= 1 or alto <= 1:
+            return False
+
+        if cambios is None or len(array) != len(self.barras):
+            max_valor = max(array) if array else 1
+            indices = range(len(array))
+        else:
+            # Ordenar permuta los valores, así que la escala solo cambia si
+            # aparece uno mayor (no hace falta recorrer todo el arreglo)
+            max_valor = max([self.max_valor] + [array[i] for i in cambios])
+            indices = cambios
+        if (len(array) != len(self.barras) or ancho != self.ancho or alto != self.alto
+                or max_valor != self.max_valor):
+            self.ancho, self.alto, self.max_valor = ancho, alto, max_valor
+            self.reconstruir(array, capa, colores)
+            return True
+
+        valores = self.valores
+        for i in indices:
+            if array[i] != valores[i]:
+                self.mover(i, array[i])
+            self.pintar(i, colores[capa(i)])
+        return True
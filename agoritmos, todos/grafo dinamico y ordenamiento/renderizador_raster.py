@@ -0,0 +1,116 @@
+import tkinter as tk
+
+import numpy as np
+
+from pasos_ordenamiento import (CAPA_BRECHA, CAPA_COMPARANDO, CAPA_HEAP, CAPA_INTERCAMBIANDO,
+                                CAPA_ORDENADO, CAPA_PIVOTE)
+
+# Dibujo para arreglos con más elementos que píxeles de ancho.
+#
+# Con 100k barras no tiene sentido un item de canvas por barra: cada columna
+# de píxeles representa un grupo de elementos consecutivos. Con NumPy se saca
+# de cada grupo la media y el máximo (reduceat) y la capa de mayor prioridad,
+# para que un elemento comparado o intercambiado se vea aunque comparta
+# columna con cientos. La columna se pinta sólida hasta la media y en un tono
+# claro hasta el máximo, y todo va a una sola PhotoImage (datos PPM).
+#
+# Los valores se copian una vez a un arreglo NumPy y después solo se actualizan
+# los índices de 'cambios', así que un cuadro no recorre la lista de Python.
+
+MARGEN_SUPERIOR = 20
+
+class RenderizadorRaster:
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.valores = None   # copia NumPy del arreglo dibujado
+        self.max_valor = 0
+        self.imagen = None    # hay que guardar la referencia o Tk la borra
+        self.item = None
+        self.paleta = None
+        self.paleta_de = None
+
+    def invalidar(self):
+        self.valores = None
+        self.item = None
+
+    def rgb(self, color):
+        return [c >> 8 for c in self.canvas.winfo_rgb(color)]
+
+    # Tabla de colores indexada por tono * len(colores) + capa, con los tonos
+    # 0 = fondo, 1 = claro (mezcla con el fondo) y 2 = sólido
+    def actualizar_paleta(self, colores):
+        if self.paleta_de != colores:
+            self.paleta_de = list(colores)
+            solidos = np.array([self.rgb(c) for c in colores], dtype=np.uint16)
+            fondo = np.array(self.rgb(self.canvas.cget('bg')), dtype=np.uint16)
+            claros = (solidos + fondo) // 2
+            self.paleta = np.concatenate([np.broadcast_to(fondo, solidos.shape), claros, solidos]).astype(np.uint8)
+        return self.paleta
+
+    def capas(self, estado, n):
+        capas = np.zeros(n, dtype=np.uint8)
+        inicio, gap = estado.brecha
+        if gap:
+            capas[inicio::gap] = CAPA_BRECHA
+        a, b = estado.rango_heap
+        capas[a:b] = CAPA_HEAP
+        capas[np.frombuffer(estado.ordenados, dtype=np.uint8) != 0] = CAPA_ORDENADO
+        capas[estado.comparando] = CAPA_COMPARANDO
+        capas[estado.intercambiando] = CAPA_INTERCAMBIANDO
+        if estado.pivote >= 0:
+            capas[estado.pivote] = CAPA_PIVOTE
+        return capas
+
+    # Misma interfaz que RenderizadorBarras.dibujar
+    def dibujar(self, estado, colores, cambios=None):
+        ancho = self.canvas.winfo_width()
+        alto = self.canvas.winfo_height()
+        if ancho <= 1 or alto <= 1:
+            return False
+
+        array = estado.array
+        n = len(array)
+        if cambios is None or self.valores is None or len(self.valores) != n:
+            self.valores = np.array(array, dtype=np.int64)
+            self.max_valor = int(self.valores.max()) if n else 1
+        elif cambios:
+            indices = np.fromiter(cambios, dtype=np.intp, count=len(cambios))
+            self.valores[indices] = [array[i] for i in cambios]
+            self.max_valor = max(self.max_valor, int(self.valores[indices].max()))
+        if n == 0:
+            self.canvas.delete("all")
+            self.item = None
+            return True
+
+        # Elementos [inicios[c], inicios[c + 1]) en la columna c
+        inicios = (np.arange(ancho) * n) // ancho
+        capas = self.capas(estado, n)
+        if n >= ancho:
+            maximos = np.maximum.reduceat(self.valores, inicios)
+            conteos = np.diff(np.append(inicios, n))
+            medias = np.add.reduceat(self.valores, inicios) / conteos
+            capa_columna = np.maximum.reduceat(capas, inicios)
+        else:
+            # Menos elementos que columnas: cada elemento ocupa varias
+            maximos = medias = self.valores[inicios]
+            capa_columna = capas[inicios]
+
+        escala = (alto - MARGEN_SUPERIOR) / max(self.max_valor, 1)
+        alto_media = (medias * escala).astype(np.float32)
+        alto_maximo = (maximos * escala).astype(np.float32)
+        paleta = self.actualizar_paleta(colores)
+
+        # Altura desde abajo de cada fila de píxeles (la fila 0 es la de arriba).
+        # Como media <= máximo, el tono de cada píxel es la cantidad de alturas que no supera
+        filas = np.arange(alto, 0, -1, dtype=np.float32)[:, None]
+        tono = (filas <= alto_media).view(np.uint8) + (filas <= alto_maximo).view(np.uint8)
+        pixeles = paleta[tono * np.uint8(len(colores)) + capa_columna]
+
+        datos = b'P6 %d %d 255\n' % (ancho, alto) + pixeles.tobytes()
+        self.imagen = tk.PhotoImage(width=ancho, height=alto, data=datos, format='PPM')
+        if self.item is None:
+            self.canvas.delete("all")
+            self.item = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.imagen)
+        else:
+            self.canvas.itemconfig(self.item, image=self.imagen)
+        return True
@@ -0,0 +1,189 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from pasos_ordenamiento import ALGORITMOS, EstadoOrdenamiento
+
+# Grabación binaria de una ejecución completa y reproducción con saltos.
+#
+# Cada paso ocupa 9 bytes en tres bloques de ancho fijo: la operación (int8)
+# y los dos argumentos (int32 cada uno). Cada 'intervalo' pasos se guarda un
+# cuadro clave con el estado completo (arreglo, contadores y resaltados), así
+# que ir a cualquier paso es cargar el cuadro clave anterior y aplicar como
+# mucho 'intervalo' pasos, sin volver a ejecutar el algoritmo. El archivo se
+# lee con mmap: abrir una traza de millones de pasos no la carga en memoria.
+#
+# Formato (enteros en el orden de bytes de la máquina que grabó):
+#   cabecera   ENCABEZADO
+#   ops        pasos × int8
+#   args a     pasos × int32
+#   args b     pasos × int32
+#   cuadros    (pasos // intervalo + 1) × (CUADRO + n × int32 + n × uint8)
+
+MAGIA = b'TRZO'
+VERSION = 1
+ENCABEZADO = struct.Struct('<4sHc32sqqq')  # magia, versión, orden de bytes, algoritmo, n, pasos, intervalo
+CUADRO = struct.Struct('<12q')  # paso, comparaciones, intercambios, pivote, comparando×2,
+                                # intercambiando×2, rango_heap×2, brecha×2
+INTERVALO_MINIMO = 1024
+ORDEN_BYTES = b'<' if sys.byteorder == 'little' else b'>'
+
+# Con un cuadro clave cada ~n pasos, los cuadros ocupan menos que los pasos
+def intervalo_para(n):
+    return max(INTERVALO_MINIMO, n)
+
+def tamano_cuadro(n):
+    return CUADRO.size + n * 4 + n
+
+def empaquetar_cuadro(estado):
+    n = len(estado.array)
+    comparando = (estado.comparando + [-1, -1])[:2]
+    intercambiando = (estado.intercambiando + [-1, -1])[:2]
+    cabecera = CUADRO.pack(estado.pasos, estado.comparaciones, estado.intercambios, estado.pivote,
+                           *comparando, *intercambiando, *estado.rango_heap, *estado.brecha)
+    return cabecera + array('i', estado.array).tobytes() + bytes(estado.ordenados)
+
+def desempaquetar_cuadro(datos, n):
+    (pasos, comparaciones, intercambios, pivote, c0, c1, i0, i1,
+     heap_a, heap_b, brecha_i, brecha_gap) = CUADRO.unpack_from(datos)
+    inicio = CUADRO.size
+    valores = memoryview(datos)[inicio:inicio + 4 * n].cast('i')
+    ordenados = datos[inicio + 4 * n:inicio + 5 * n]
+
+    estado = EstadoOrdenamiento(valores.tolist())
+    estado.pasos = pasos
+    estado.comparaciones = comparaciones
+    estado.intercambios = intercambios
+    estado.pivote = pivote
+    estado.comparando = [i for i in (c0, c1) if i >= 0]
+    estado.intercambiando = [i for i in (i0, i1) if i >= 0]
+    estado.ordenados = bytearray(ordenados)
+    estado.rango_heap = (heap_a, heap_b)
+    estado.brecha = (brecha_i, brecha_gap)
+    return estado
+
+# Ejecuta el algoritmo sobre una copia de 'arreglo' y guarda la traza en
+# 'archivo'. Devuelve la cantidad de pasos grabados.
+def grabar(nombre, arreglo, archivo, intervalo=None):
+    n = len(arreglo)
+    intervalo = intervalo or intervalo_para(n)
+    ops = array('b')
+    args_a = array('i')
+    args_b = array('i')
+    cuadros = []
+
+    # El estado se lleva aparte (con los mismos eventos) para los cuadros clave
+    estado = EstadoOrdenamiento(list(arreglo))
+    aplicar = estado.aplicar
+    cuadros.append(empaquetar_cuadro(estado))
+    for op, a, b in ALGORITMOS[nombre](list(arreglo)):
+        ops.append(op)
+        args_a.append(a)
+        args_b.append(b)
+        aplicar((op, a, b))
+        if estado.pasos % intervalo == 0:
+            cuadros.append(empaquetar_cuadro(estado))
+            estado.modificados.clear()
+
+    temporal = archivo + ".tmp"
+    with open(temporal, 'wb') as f:
+        f.write(ENCABEZADO.pack(MAGIA, VERSION, ORDEN_BYTES, nombre.encode('utf-8')[:32],
+                                n, len(ops), intervalo))
+        f.write(ops.tobytes())
+        f.write(args_a.tobytes())
+        f.write(args_b.tobytes())
+        for cuadro in cuadros:
+            f.write(cuadro)
+    os.replace(temporal, archivo)
+    return len(ops)
+
+class Traza:
+    def __init__(self, archivo):
+        self.archivo = archivo
+        with open(archivo, 'rb') as f:
+            self.mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.mapa) < ENCABEZADO.size:
+            self.cerrar()
+            raise ValueError(f"{archivo} está truncado (sin cabecera completa)")
+        magia, version, orden, nombre, n, pasos, intervalo = ENCABEZADO.unpack_from(self.mapa)
+        if magia != MAGIA or version != VERSION:
+            self.cerrar()
+            raise ValueError(f"{archivo} no es una traza de ordenamiento válida")
+        if orden != ORDEN_BYTES:
+            self.cerrar()
+            raise ValueError(f"{archivo} se grabó en una máquina con otro orden de bytes")
+        # El tamaño sale entero de la cabecera; si no coincide, el archivo está
+        # cortado o dañado y leerlo daría basura o errores de struct más adelante
+        if n < 0 or pasos < 0 or intervalo <= 0:
+            self.cerrar()
+            raise ValueError(f"{archivo} tiene una cabecera dañada")
+        esperado = ENCABEZADO.size + 9 * pasos + (pasos // intervalo + 1) * tamano_cuadro(n)
+        tamano = len(self.mapa)
+        if tamano != esperado:
+            self.cerrar()
+            raise ValueError(f"{archivo} mide {tamano} bytes y debería medir {esperado} "
+                             f"(truncado o dañado)")
+
+        self.algoritmo = nombre.rstrip(b'\0').decode('utf-8')
+        self.n = n
+        self.pasos = pasos
+        self.intervalo = intervalo
+        vista = memoryview(self.mapa)
+        inicio = ENCABEZADO.size
+        self.ops = vista[inicio:inicio + pasos].cast('b')
+        self.args_a = vista[inicio + pasos:inicio + 5 * pasos].cast('i')
+        self.args_b = vista[inicio + 5 * pasos:inicio + 9 * pasos].cast('i')
+        self.inicio_cuadros = inicio + 9 * pasos
+        self.tamano_cuadro = tamano_cuadro(n)
+
+    def paso(self, k):
+        return self.ops[k], self.args_a[k], self.args_b[k]
+
+    # Pasos desde el k-ésimo hasta el final (para reproducir en vivo)
+    def pasos_desde(self, k=0):
+        ops, args_a, args_b = self.ops, self.args_a, self.args_b
+        for i in range(k, self.pasos):
+            yield ops[i], args_a[i], args_b[i]
+
+    # Estado después de aplicar los primeros k pasos
+    def estado_en(self, k):
+        k = max(0, min(k, self.pasos))
+        indice = k // self.intervalo
+        inicio = self.inicio_cuadros + indice * self.tamano_cuadro
+        estado = desempaquetar_cuadro(self.mapa[inicio:inicio + self.tamano_cuadro], self.n)
+        aplicar = estado.aplicar
+        for i in range(estado.pasos, k):
+            aplicar((self.ops[i], self.args_a[i], self.args_b[i]))
+        estado.modificados.clear()
+        return estado
+
+    def cerrar(self):
+        for vista in ('ops', 'args_a', 'args_b'):
+            if hasattr(self, vista):
+                getattr(self, vista).release()
+        self.mapa.close()
+
+if __name__ == "__main__":
+    # python traza_ordenamiento.py "Heap Sort" 100000 heap.traza
+    import random
+    import time
+
+    nombre = sys.argv[1] if len(sys.argv) > 1 else "Heap Sort"
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    archivo = sys.argv[3] if len(sys.argv) > 3 else "ordenamiento.traza"
+
+    arreglo = [random.randint(10, 400) for _ in range(n)]
+    inicio = time.perf_counter()
+    pasos = grabar(nombre, arreglo, archivo)
+    print(f"{nombre}, n={n}: {pasos} pasos grabados en {time.perf_counter() - inicio:.2f} s "
+          f"({os.path.getsize(archivo) / 1e6:.1f} MB)")
+
+    traza = Traza(archivo)
+    inicio = time.perf_counter()
+    for _ in range(100):
+        traza.estado_en(random.randrange(traza.pasos + 1))
+    print(f"Salto a un paso al azar: {(time.perf_counter() - inicio) * 10:.2f} ms en promedio")
+    traza.cerrar()